@@ -9,6 +9,17 @@ MAX_RESULTS_LIMIT = 100
 MAX_REQUEST_SIZE = 1024 * 1024  # 1MB
 DEFAULT_TIMEOUT = 30  # seconds
 LONG_OPERATION_TIMEOUT = 120  # seconds
+MAX_CONCURRENT_REQUESTS = 100  # in-flight Reltio API calls on the shared async client
+HTTP_EXECUTOR_WORKERS = 32  # threads running the blocking requests-based calls
+KEEPALIVE_EXPIRY = 30  # seconds an idle pooled connection is kept open for reuse
+MATCH_COUNT_CACHE_TTL = 30  # seconds, aggregate match counts are served from cache this long
+MATCH_COUNT_CACHE_MAXSIZE = 1024
+SEARCH_CACHE_TTL = 30  # seconds, identical entity searches are served from cache this long
+SEARCH_CACHE_MAXSIZE = 1024
+BUSINESS_CONFIG_CACHE_MAXSIZE = 64  # tenants whose business configuration is kept in memory
+RENDERED_RESPONSE_CACHE_MAXSIZE = 256  # rendered tenant configuration responses kept per tenant
+TOKEN_DEFAULT_TTL = 3300  # seconds, used when the auth server omits expires_in
+TOKEN_EXPIRY_MARGIN = 30  # seconds, refresh tokens this long before they expire
 REQUIRE_TLS = True  # Require HTTPS for all connections
 ALLOWED_ORIGINS = ["https://app.reltio.com", "https://api.reltio.com"]  # Allowed origins
 HEADER_SOURCE_TAG = "Reltio-Open-MCP-Server"
@@ -27,4 +38,6 @@ ERROR_CODES = {
     "SERVER_ERROR": 500,
     "SERVICE_UNAVAILABLE": 503
 }
-ACTIVITY_LOG_LABEL="OPEN_MCP_SERVER"
\ No newline at end of file
+ACTIVITY_LOG_LABEL="OPEN_MCP_SERVER"
+ACTIVITY_LOG_BATCH_SIZE = 20  # activities written per flush
+ACTIVITY_LOG_FLUSH_INTERVAL = 0.5  # seconds to wait for more activities before flushing
@@ -6,4 +6,9 @@ RELTIO_CLIENT_ID=os.getenv("RELTIO_CLIENT_ID", "reltio-client-id")
 RELTIO_CLIENT_SECRET=os.getenv("RELTIO_CLIENT_SECRET", "reltio-client-secret")
 RELTIO_TENANT=os.getenv("RELTIO_TENANT", "reltio-tenant")
 RELTIO_CLIENT_BASIC_TOKEN=base64.b64encode(f"{RELTIO_CLIENT_ID}:{RELTIO_CLIENT_SECRET}".encode()).decode() #base64 encoding of client_id:client_secret
-RELTIO_AUTH_SERVER=os.getenv("RELTIO_AUTH_SERVER","https://auth.reltio.com")
\ No newline at end of file
+RELTIO_AUTH_SERVER=os.getenv("RELTIO_AUTH_SERVER","https://auth.reltio.com")
+RELTIO_MAX_PAGE_SIZE=int(os.getenv("RELTIO_MAX_PAGE_SIZE", "100")) #largest search page returned per call, at most MAX_RESULTS_LIMIT
+RELTIO_CONFIG_CACHE_TTL=float(os.getenv("RELTIO_CONFIG_CACHE_TTL", "30")) #seconds a fetched business configuration is reused
+RELTIO_CACHE_DIR=os.getenv("RELTIO_CACHE_DIR", "") #directory where business configurations persist across restarts; empty (the default) disables
+RELTIO_PREFETCH_CONFIG=os.getenv("RELTIO_PREFETCH_CONFIG", "true").lower() == "true" #fetch the default tenant's business configuration when the server starts
+RELTIO_TOOL_FORMAT=os.getenv("RELTIO_TOOL_FORMAT", "yaml").lower() #text format of tool responses: yaml or json
\ No newline at end of file
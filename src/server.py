@@ -4,16 +4,22 @@ Reltio MCP Server - Main
 This file initializes the MCP server and registers all tools.
 Tools are imported from separate modules for better organization.
 """
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Dict, Any, Optional
 
 from mcp.server.fastmcp import FastMCP
 
 # Import server name from defines
-from src.env import RELTIO_SERVER_NAME, RELTIO_TENANT
+from src.env import RELTIO_SERVER_NAME, RELTIO_TENANT, RELTIO_PREFETCH_CONFIG
+from src.util.api import close_async_client
+from src.util.session import close_http_resources
+from src.util.activity_log import ActivityLog
 # Import tools from separate modules
 from src.tools.entity import (
     get_entity_details, 
+    get_entities_details,
     update_entity_attributes, 
     get_entity_matches, 
     get_entity_match_history, 
@@ -48,7 +54,9 @@ from src.tools.tenant_config import (
     get_relation_type_definition,
     get_interaction_type_definition,
     get_graph_type_definition,
-    get_grouping_type_definition
+    get_grouping_type_definition,
+    get_type_definitions,
+    warm_business_config
 )
 from src.tools.activity import get_merge_activities, check_user_activity
 from src.tools.interaction import get_entity_interactions, create_interactions
@@ -68,8 +76,33 @@ from src.tools.workflow import (
 # Configure logging
 logger = logging.getLogger("mcp.server.reltio")
 
+# Number of MCP sessions currently running against the shared HTTP client
+_active_sessions = 0
+# Background prefetch of the default tenant's business configuration, started with the first session
+_warmup_task: Optional[asyncio.Task] = None
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[dict]:
+    """Prefetch the default tenant's business configuration when the first MCP session starts, then flush
+    queued activities and close the shared HTTP clients and executor once the last session ends"""
+    global _active_sessions, _warmup_task
+    _active_sessions += 1
+    if _active_sessions == 1 and RELTIO_PREFETCH_CONFIG:
+        _warmup_task = asyncio.create_task(warm_business_config(RELTIO_TENANT))
+    try:
+        yield {}
+    finally:
+        _active_sessions -= 1
+        if _active_sessions == 0:
+            if _warmup_task is not None and not _warmup_task.done():
+                _warmup_task.cancel()
+            _warmup_task = None
+            await ActivityLog.flush()
+            await close_async_client()
+            close_http_resources()
+
 # Initialize MCP server
-mcp = FastMCP(RELTIO_SERVER_NAME)
+mcp = FastMCP(RELTIO_SERVER_NAME, lifespan=lifespan)
 
 # Register tools with the MCP server
 @mcp.tool()
@@ -122,7 +155,7 @@ async def search_entities_tool(filter: str, entity_type: str,
             entity_type (str): Entity type to filter by. The entity type should follow PascalCase format.
                 Examples: HCO, HCP, GPO, Contact, Product, Ingredient, Customer, Prospect, Location, Household, Supplier, Material, FinancialProfessional, FinancialAccount, Payer, InsurancePlan, ProductCategory, BrokerAgent, Claim, Contract, InsuredAsset, Structure, ClinicalStudy, Drug, IDN, MedicalDevice, MedicalManufacturedItem, PackagedMedicinalProduct, Person, PharmaceuticalProduct, ProductGroup, StudySite, Substance, Individual, Organization
             tenant_id (str): Tenant ID for the Reltio environment. Defaults to RELTIO_TENANT env value.
-            max_results (int): Maximum number of results to return. Defaults to 10, and is capped at 10 per call.
+            max_results (int): Maximum number of results to return. Defaults to 10, and is capped at 100 per call (configurable with RELTIO_MAX_PAGE_SIZE).
             sort (str): Attribute name to sort by.
             order (str): Sort order ('asc' or 'desc'). Defaults to 'asc'.
             select (str): Comma-separated list of fields to select in the response.
@@ -176,7 +209,7 @@ async def search_entities_tool(filter: str, entity_type: str,
         select = "uri,label"
     if "uri" not in select:
         select = f"uri,{select}"
-    return await search_entities(filter, entity_type, tenant_id, min(max_results, 10), sort, order, select, options, activeness, offset)
+    return await search_entities(filter, entity_type, tenant_id, max_results, sort, order, select, options, activeness, offset)
     
 @mcp.tool()
 async def get_entity_tool(entity_id: str, filter_field: Dict[str, List[str]] = None, tenant_id: str = RELTIO_TENANT) -> dict:
@@ -234,6 +267,31 @@ async def get_entity_tool(entity_id: str, filter_field: Dict[str, List[str]] = N
     """
     return await get_entity_details(entity_id, filter_field, tenant_id)
 
+@mcp.tool()
+async def get_entities_tool(entity_ids: List[str], filter_field: Dict[str, List[str]] = None, tenant_id: str = RELTIO_TENANT) -> dict:
+    """Get detailed information about several Reltio entities by ID in one call.
+    Prefer this tool over calling get_entity_tool repeatedly when the details of more than one entity are needed.
+    
+    Args:
+        entity_ids (List[str]): The IDs of the entities to retrieve (at most 100)
+        filter_field (Dict[str, List[str]]): Optional fields to filter in each entity response, same format as in get_entity_tool.
+        tenant_id (str): Tenant ID for the Reltio environment. Defaults to RELTIO_TENANT env value.
+    
+    Returns:
+        A dictionary keyed by entity URI containing the details (or the error) for each requested entity
+    
+    Raises:
+        Exception: If there's an error getting the entities details
+    
+    Examples:
+        # Get full details of two entities
+        get_entities_tool(["entity_id_1", "entity_id_2"], None, "tenant_id")
+
+        # Get the names of several entities
+        get_entities_tool(["entity_id_1", "entity_id_2", "entity_id_3"], {"attributes": ["Name"]}, "tenant_id")
+    """
+    return await get_entities_details(entity_ids, filter_field, tenant_id)
+
 @mcp.tool()
 async def update_entity_attributes_tool(entity_id: str, updates: List[Dict[str, Any]],options: str = "",always_create_dcr:bool = False,change_request_id:str = None, overwrite_default_crosswalk_value:bool = True,tenant_id: str = RELTIO_TENANT) -> dict:
     """Update specific attributes of an entity in Reltio.
@@ -834,6 +892,28 @@ async def get_grouping_type_definition_tool(grouping_type: str, tenant_id: str =
     """
     return await get_grouping_type_definition(grouping_type, tenant_id)
 
+@mcp.tool()
+async def get_type_definitions_tool(type_uris: List[str], tenant_id: str = RELTIO_TENANT) -> dict:
+    """Get the definitions of several entity, change request, relation, interaction, graph or grouping types in one call
+        Each type URI should be in the format of "configuration/<kind>/<type>", for example "configuration/entityTypes/Individual".
+        Prefer this tool over repeated single-type definition calls when several types are needed.
+        
+        Args:
+            type_uris (List[str]): The URIs of the types to get the definitions for.
+            tenant_id (str): Tenant ID for the Reltio environment. Defaults to RELTIO_TENANT env value.
+        
+        Returns:
+            The definition of each type keyed by its URI; unknown types map to an empty definition
+        
+        Raises:
+            Exception: If there's an error getting the type definitions
+        
+        Examples:
+            # Get an entity type and the relation type linking it to addresses
+            get_type_definitions_tool(["configuration/entityTypes/Individual", "configuration/relationTypes/HasAddress"], "tenant_id")
+    """
+    return await get_type_definitions(type_uris, tenant_id)
+
 @mcp.tool()
 async def get_merge_activities_tool(timestamp_gt: int, event_types: Optional[List[str]] = None, 
                                     timestamp_lt: Optional[int] = None, entity_type: Optional[str] = None, 
@@ -902,7 +982,7 @@ async def capabilities_tool() -> dict:
         Exception: If there's an error getting the server capabilities
     """
     try:
-        return await list_capabilities()
+        return list_capabilities()
     except Exception as e:
         return {"error": str(e)}
 
@@ -10,7 +10,7 @@ import yaml
 import time
 from src.constants import ACTIVITY_CLIENT, MAX_RESULTS_LIMIT
 from src.env import RELTIO_TENANT
-from src.util.api import get_reltio_url, http_request, create_error_response, validate_connection_security
+from src.util.api import get_reltio_url, http_request_async, create_error_response, validate_connection_security
 from src.util.auth import get_reltio_headers
 from src.util.exceptions import SecurityError
 from src.util.models import MergeActivitiesRequest
@@ -149,7 +149,7 @@ async def get_merge_activities(
         
         # Make the API request
         try:
-            response = http_request(url, headers=headers)
+            response = await http_request_async(url, headers=headers)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             
@@ -262,7 +262,7 @@ async def check_user_activity(username: str, days_back: int = 7, tenant_id: str
             )
         
         try:
-            activities_response = http_request(base_url, params=params, headers=headers)
+            activities_response = await http_request_async(base_url, params=params, headers=headers)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             return create_error_response(
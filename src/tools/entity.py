@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 import yaml
@@ -5,9 +6,10 @@ import json
 import re
 from src.constants import ACTIVITY_CLIENT, MAX_RESULTS_LIMIT
 from src.env import RELTIO_TENANT
-from src.util.api import get_reltio_url, get_reltio_export_job_url, http_request, create_error_response, validate_connection_security
+from src.util.api import HTTP_REQUEST_ERRORS, get_reltio_url, get_reltio_export_job_url, http_request_async, create_error_response, validate_connection_security
 from src.util.auth import get_reltio_headers
-from src.util.exceptions import SecurityError
+from src.util.cache import invalidate_tenant
+from src.util.exceptions import ReltioHTTPError, SecurityError
 from src.util.models import (
     EntityIdRequest, UpdateEntityAttributesRequest, MergeEntitiesRequest, 
     RejectMatchRequest, UnmergeEntityRequest, EntityWithMatchesRequest,
@@ -18,6 +20,9 @@ from src.tools.util import ActivityLogLabel, simplify_reltio_attributes, slim_cr
 
 # Configure logging
 logger = logging.getLogger("mcp.server.reltio")
+
+# Top-level entity keys consumed by simplify_entity; everything else is dropped before filtering
+ENTITY_DETAIL_KEYS = ("attributes", "crosswalks")
    
 
 def filter_entity(entity: Dict[str, Any], filter_field: Optional[Dict[str, List[str]]]) -> Dict[str, Any]:
@@ -53,6 +58,15 @@ def filter_entity(entity: Dict[str, Any], filter_field: Optional[Dict[str, List[
             filtered_entity[field] = value
     return filtered_entity
 
+def simplify_entity(entity: Dict[str, Any], filter_field: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
+    """Apply the optional field filter to an entity and keep only simplified attributes and slim crosswalks"""
+    entity={k: entity[k] for k in ENTITY_DETAIL_KEYS if k in entity}
+    filter_entity_data=filter_entity(entity, filter_field) if filter_field else entity
+    result={"attributes":simplify_reltio_attributes(filter_entity_data.get("attributes",{}))}
+    if "crosswalks" in filter_entity_data:
+        result["crosswalks"]=slim_crosswalks(filter_entity_data["crosswalks"])
+    return result
+
 async def get_entity_details(entity_id: str, filter_field: Dict[str, List[str]] = None, tenant_id: str = RELTIO_TENANT) -> dict:
     """Get detailed information about a Reltio entity by ID
     
@@ -98,7 +112,7 @@ async def get_entity_details(entity_id: str, filter_field: Dict[str, List[str]]
         
         # Make the request with timeout
         try:
-            entity = http_request(url, headers=headers)
+            entity = await http_request_async(url, headers=headers)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             
@@ -126,12 +140,7 @@ async def get_entity_details(entity_id: str, filter_field: Dict[str, List[str]]
         except Exception as log_error:
             logger.error(f"Activity logging failed for get_entity_details: {str(log_error)}")
         
-        filter_entity_data=filter_entity(entity, filter_field) if filter_field else entity
-        result={"attributes":simplify_reltio_attributes(filter_entity_data.get("attributes",{}))}
-        if "crosswalks" in filter_entity_data:
-            result["crosswalks"]=slim_crosswalks(filter_entity_data["crosswalks"])
-
-        return yaml.dump(result, sort_keys=False)
+        return simplify_entity(entity, filter_field)
         
     except Exception as e:
         # Log the error
@@ -143,6 +152,103 @@ async def get_entity_details(entity_id: str, filter_field: Dict[str, List[str]]
             "An unexpected error occurred while retrieving entity details"
         )
 
+async def get_entities_details(entity_ids: List[str], filter_field: Dict[str, List[str]] = None, tenant_id: str = RELTIO_TENANT) -> dict:
+    """Get detailed information about several Reltio entities in one call
+    
+    Args:
+        entity_ids (List[str]): The IDs of the entities to retrieve
+        filter_field (Dict[str, List[str]]): Optional dictionary to filter specific fields in each entity response
+        tenant_id (str): Tenant ID for the Reltio environment. Defaults to RELTIO_TENANT env value.
+    
+    Returns:
+        A dictionary keyed by entity URI containing the details (or the error) for each requested entity
+    
+    Raises:
+        Exception: If there's an error getting the entities details
+    """
+    try:
+        # Validate every ID before issuing any request
+        try:
+            if not entity_ids:
+                raise ValueError("At least one entity ID must be provided")
+            if len(entity_ids) > MAX_RESULTS_LIMIT:
+                raise ValueError(f"At most {MAX_RESULTS_LIMIT} entity IDs can be requested at once")
+            entity_requests = [
+                EntityIdRequest(entity_id=entity_id, tenant_id=tenant_id)
+                for entity_id in entity_ids
+            ]
+        except ValueError as e:
+            logger.warning(f"Validation error in get_entities_details: {str(e)}")
+            return create_error_response(
+                "VALIDATION_ERROR",
+                f"Invalid entity ID format: {str(e)}"
+            )
+        
+        urls = [get_reltio_url(f"entities/{request.entity_id}", "api", request.tenant_id) for request in entity_requests]
+        
+        try:
+            headers = get_reltio_headers()
+            
+            # All URLs share the same host, so validating one covers the batch
+            validate_connection_security(urls[0], headers)
+        except Exception as e:
+            logger.error(f"Authentication or security error: {str(e)}")
+            return create_error_response(
+                "AUTHENTICATION_ERROR",
+                "Failed to authenticate with Reltio API"
+            )
+        
+        # Fan out the requests concurrently, keeping per-entity failures
+        entities = await asyncio.gather(
+            *[http_request_async(url, headers=headers) for url in urls],
+            return_exceptions=True
+        )
+        
+        result = {}
+        for request, entity in zip(entity_requests, entities):
+            entity_uri = f"entities/{request.entity_id}"
+            if isinstance(entity, Exception):
+                logger.error(f"API request error for {entity_uri}: {str(entity)}")
+                if isinstance(entity, ReltioHTTPError) and entity.status_code == 404:
+                    result[entity_uri] = create_error_response(
+                        "RESOURCE_NOT_FOUND",
+                        f"Entity with ID {request.entity_id} not found"
+                    )
+                else:
+                    result[entity_uri] = create_error_response(
+                        "SERVER_ERROR",
+                        "Failed to retrieve entity details from Reltio API"
+                    )
+                continue
+            result[entity_uri] = simplify_entity(entity, filter_field)
+        
+        # Log a single activity for the whole batch
+        try:
+            await ActivityLog.execute_and_log_activity(
+                tenant_id=tenant_id,
+                label=ActivityLogLabel.USER_PROFILE_VIEW.value,
+                client_type=ACTIVITY_CLIENT,
+                description=json.dumps([
+                    {"uri": f"entities/{request.entity_id}", "label": entity.get("label", "")}
+                    for request, entity in zip(entity_requests, entities) if isinstance(entity, dict)
+                ]),
+                items=[{"objectUri": f"entities/{request.entity_id}"} for request in entity_requests]
+            )
+        except Exception as log_error:
+            logger.error(f"Activity logging failed for get_entities_details: {str(log_error)}")
+        
+        return result
+        
+    except Exception as e:
+        # Log the error
+        logger.error(f"Unexpected error in get_entities_details: {str(e)}")
+        
+        # Return a sanitized error response
+        return create_error_response(
+            "SERVER_ERROR",
+            "An unexpected error occurred while retrieving entities details"
+        )
+
 async def update_entity_attributes(entity_id: str, updates: List[Dict[str, Any]],options:str = "",always_create_dcr:bool = False,change_request_id:str = None, overwrite_default_crosswalk_value:bool = True,tenant_id: str = RELTIO_TENANT) -> dict:
     """Update specific attributes of an entity in Reltio
     
@@ -206,7 +312,8 @@ async def update_entity_attributes(entity_id: str, updates: List[Dict[str, Any]]
             )
 
         try:
-            result = http_request(url, method="POST", headers=headers, data=request.updates,params=params if params else None)
+            result = await http_request_async(url, method="POST", headers=headers, data=request.updates,params=params if params else None)
+            invalidate_tenant(request.tenant_id)
         except Exception as e:
             logger.error(f"API request error in update_entity_attributes: {str(e)}")
             if "404" in str(e):
@@ -221,7 +328,7 @@ async def update_entity_attributes(entity_id: str, updates: List[Dict[str, Any]]
 
         
 
-        return yaml.dump(result, sort_keys=False)
+        return result
     except Exception as e:
         logger.error(f"Unexpected error in update_entity_attributes: {str(e)}")
         return create_error_response(
@@ -298,7 +405,7 @@ async def get_entity_matches(entity_id: str, tenant_id: str = RELTIO_TENANT, max
         
         # Make the request with timeout
         try:
-            matches_result = http_request(url, headers=headers, params=params)
+            matches_result = await http_request_async(url, headers=headers, params=params)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             
@@ -325,7 +432,7 @@ async def get_entity_matches(entity_id: str, tenant_id: str = RELTIO_TENANT, max
         source_url = get_reltio_url(f"entities/{request.entity_id}", "api", request.tenant_id)
         
         try:
-            source_entity = http_request(source_url, headers=headers)
+            source_entity = await http_request_async(source_url, headers=headers)
         except Exception as e:
             logger.error(f"Error retrieving source entity: {str(e)}")
             
@@ -351,7 +458,7 @@ async def get_entity_matches(entity_id: str, tenant_id: str = RELTIO_TENANT, max
         except Exception as log_error:
             logger.error(f"Activity logging failed for get_entity_matches: {str(log_error)}")
         
-        return yaml.dump(result, sort_keys=False)
+        return result
     except Exception as e:
         # Log the error
         logger.error(f"Unexpected error in get_entity_matches: {str(e)}")
@@ -413,7 +520,7 @@ async def get_entity_match_history(entity_id: str, tenant_id: str = RELTIO_TENAN
         
         # Make the request with timeout
         try:
-            match_history = http_request(url, headers=headers)
+            match_history = await http_request_async(url, headers=headers)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             
@@ -452,7 +559,7 @@ async def get_entity_match_history(entity_id: str, tenant_id: str = RELTIO_TENAN
         source_url = get_reltio_url(f"entities/{request.entity_id}", "api", request.tenant_id)
         
         try:
-            source_entity = http_request(source_url, headers=headers)
+            source_entity = await http_request_async(source_url, headers=headers)
         except Exception as e:
             logger.error(f"Error retrieving source entity: {str(e)}")
             
@@ -475,7 +582,7 @@ async def get_entity_match_history(entity_id: str, tenant_id: str = RELTIO_TENAN
         except Exception as log_error:
             logger.error(f"Activity logging failed for get_entity_match_history: {str(log_error)}")
 
-        return yaml.dump(match_history, sort_keys=False)
+        return match_history
     except Exception as e:
         # Log the error
         logger.error(f"Unexpected error in get_entity_match_history: {str(e)}")
@@ -534,12 +641,13 @@ async def merge_entities(entity_ids: List[str], tenant_id: str = RELTIO_TENANT)
         
         # Make the POST request
         try:
-            merge_result = http_request(
+            merge_result = await http_request_async(
                 url, 
                 method='POST',
                 data=payload,
                 headers=headers
             )
+            invalidate_tenant(request.tenant_id)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             
@@ -623,12 +731,13 @@ async def reject_entity_match(source_id: str, target_id: str, tenant_id: str = R
         
         # Make the POST request with URL parameters
         try:
-            reject_result = http_request(
+            reject_result = await http_request_async(
                 base_url, 
                 method='POST',
                 params=params,
                 headers=headers
             )
+            invalidate_tenant(request.tenant_id)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             
@@ -704,7 +813,7 @@ async def export_merge_tree(email_id: str, tenant_id: str = RELTIO_TENANT) -> di
             "email": email_id
         }
         try:
-            result = http_request(url, method="POST", headers=headers, data=payload, params=params)
+            result = await http_request_async(url, method="POST", headers=headers, data=payload, params=params)
         except Exception as e:
             logger.error(f"API request error in export_merge_tree: {str(e)}")
             return create_error_response(
@@ -768,8 +877,7 @@ async def unmerge_entity_by_contributor(origin_entity_id: str, contributor_entit
         }
         
         try:
-            headers = get_reltio_headers()
-            headers["Content-Type"] = "application/json"
+            headers = get_reltio_headers(content_type="application/json")
             headers["Globalid"] = ACTIVITY_CLIENT
             # Validate connection security
             validate_connection_security(url, headers)
@@ -782,22 +890,23 @@ async def unmerge_entity_by_contributor(origin_entity_id: str, contributor_entit
         
         # Make the POST request with URL parameters
         try:
-            unmerge_result = http_request(
+            unmerge_result = await http_request_async(
                 url, 
                 method='POST',
                 params=params,
                 headers=headers
             )
-        except Exception as e:
+            invalidate_tenant(request.tenant_id)
+        except ReltioHTTPError as e:
             logger.error(f"API request error: {str(e)}")
             
             # Check for common errors
-            if "404" in str(e):
+            if e.status_code == 404:
                 return create_error_response(
                     "RESOURCE_NOT_FOUND",
                     f"One or more entities not found"
                 )
-            elif "400" in str(e):
+            elif e.status_code == 400:
                 return create_error_response(
                     "INVALID_REQUEST",
                     f"Invalid unmerge request: {str(e)}"
@@ -807,6 +916,12 @@ async def unmerge_entity_by_contributor(origin_entity_id: str, contributor_entit
                 "SERVER_ERROR",
                 "Failed to unmerge entity"
             )
+        except HTTP_REQUEST_ERRORS as e:
+            logger.error(f"API request error: {str(e)}")
+            return create_error_response(
+                "SERVER_ERROR",
+                "Failed to unmerge entity"
+            )
 
         return unmerge_result
     except Exception as e:
@@ -857,8 +972,7 @@ async def unmerge_entity_tree_by_contributor(origin_entity_id: str, contributor_
         }
         
         try:
-            headers = get_reltio_headers()
-            headers["Content-Type"] = "application/json"
+            headers = get_reltio_headers(content_type="application/json")
             headers["Globalid"] = ACTIVITY_CLIENT
             
             # Validate connection security
@@ -872,22 +986,23 @@ async def unmerge_entity_tree_by_contributor(origin_entity_id: str, contributor_
         
         # Make the POST request with URL parameters
         try:
-            unmerge_result = http_request(
+            unmerge_result = await http_request_async(
                 url, 
                 method='POST',
                 params=params,
                 headers=headers
             )
-        except Exception as e:
+            invalidate_tenant(request.tenant_id)
+        except ReltioHTTPError as e:
             logger.error(f"API request error: {str(e)}")
             
             # Check for common errors
-            if "404" in str(e):
+            if e.status_code == 404:
                 return create_error_response(
                     "RESOURCE_NOT_FOUND",
                     f"One or more entities not found"
                 )
-            elif "400" in str(e):
+            elif e.status_code == 400:
                 return create_error_response(
                     "INVALID_REQUEST",
                     f"Invalid tree unmerge request: {str(e)}"
@@ -897,6 +1012,12 @@ async def unmerge_entity_tree_by_contributor(origin_entity_id: str, contributor_
                 "SERVER_ERROR",
                 "Failed to tree unmerge entity"
             )
+        except HTTP_REQUEST_ERRORS as e:
+            logger.error(f"API request error: {str(e)}")
+            return create_error_response(
+                "SERVER_ERROR",
+                "Failed to tree unmerge entity"
+            )
         
         return unmerge_result
     except Exception as e:
@@ -974,7 +1095,7 @@ async def get_entity_with_matches(
             )
         
         try:
-            source_entity = http_request(source_url, headers=headers)
+            source_entity = await http_request_async(source_url, headers=headers)
         except Exception as e:
             logger.error(f"API request error getting source entity: {str(e)}")
             if "404" in str(e):
@@ -1009,7 +1130,7 @@ async def get_entity_with_matches(
         }
         
         try:
-            matches_result = http_request(matches_url, headers=headers, params=params)
+            matches_result = await http_request_async(matches_url, headers=headers, params=params)
         except Exception as e:
             logger.warning(f"Error retrieving matches: {str(e)}")
             # Continue without matches if the matches API fails
@@ -1024,7 +1145,7 @@ async def get_entity_with_matches(
                 "activeness": "active",
                 "limit": 1000  # High limit to get accurate count
             }
-            total_matches_result = http_request(matches_url, headers=headers, params=total_params)
+            total_matches_result = await http_request_async(matches_url, headers=headers, params=total_params)
             total_count = len(total_matches_result) if total_matches_result else 0
         except Exception as e:
             logger.warning(f"Error getting total matches count: {str(e)}")
@@ -1034,10 +1155,10 @@ async def get_entity_with_matches(
         match_entities = {}
         if request.include_match_attributes and matches_result:
             for match in matches_result[:request.match_limit]:
-                match_entity_id = match["object"]["uri"].split("/")[-1]
+                match_entity_id = match["object"]["uri"].rsplit("/", 1)[-1]
                 try:
                     match_entity_url = get_reltio_url(f"entities/{match_entity_id}", "api", request.tenant_id)
-                    match_entity = http_request(match_entity_url, headers=headers)
+                    match_entity = await http_request_async(match_entity_url, headers=headers)
                     
                     # Filter match entity attributes if specified
                     filtered_match_entity = filter_entity(match_entity, {"attributes": request.match_attributes} if request.match_attributes else None)
@@ -1145,13 +1266,14 @@ async def create_entities(entities: List[Dict[str, Any]], return_objects: bool =
         
         # Make the POST request
         try:
-            create_result = http_request(
+            create_result = await http_request_async(
                 url,
                 method='POST',
                 data=request.entities,
                 headers=headers,
                 params=params
             )
+            invalidate_tenant(request.tenant_id)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             
@@ -1348,7 +1470,7 @@ async def get_entity_hops(
         
         # Make the request with timeout
         try:
-            hops_data = http_request(url, method='GET', headers=headers, params=params)
+            hops_data = await http_request_async(url, method='GET', headers=headers, params=params)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             error_str = str(e)
@@ -1521,7 +1643,7 @@ async def get_entity_parents(
         
         # Make the request with timeout
         try:
-            parents_data = http_request(url, method='GET', headers=headers, params=params)
+            parents_data = await http_request_async(url, method='GET', headers=headers, params=params)
         except Exception as e:
             logger.error(f"API request error: {e}")
             error_str = str(e)
@@ -3,7 +3,7 @@ from typing import List, Dict, Any
 import yaml
 from src.constants import ACTIVITY_CLIENT
 from src.env import RELTIO_TENANT
-from src.util.api import get_reltio_url, http_request, create_error_response, validate_connection_security
+from src.util.api import get_reltio_url, http_request_async, create_error_response, validate_connection_security
 from src.util.auth import get_reltio_headers
 from src.util.models import EntityInteractionsRequest, CreateInteractionRequest
 from src.util.activity_log import ActivityLog
@@ -83,7 +83,7 @@ async def get_entity_interactions(entity_id: str, max: int = 50, offset: int = 0
         
         # Make the request with timeout
         try:
-            interactions = http_request(url, headers=headers, params=params)
+            interactions = await http_request_async(url, headers=headers, params=params)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             
@@ -196,7 +196,7 @@ async def create_interactions(interactions: list, source_system: str = "configur
         
         # Make the POST request with timeout
         try:
-            response = http_request(url, method="POST", headers=headers, params=params, data=request.interactions)
+            response = await http_request_async(url, method="POST", headers=headers, params=params, data=request.interactions)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             
@@ -4,7 +4,7 @@ from src.constants import ACTIVITY_CLIENT
 from src.env import RELTIO_TENANT
 from src.util.api import (
     get_reltio_url,
-    http_request,
+    http_request_async,
     create_error_response,
     validate_connection_security
 )
@@ -73,7 +73,7 @@ async def rdm_lookups_list(lookup_type: str, tenant_id: str = RELTIO_TENANT, max
         
         # Make the request with timeout
         try:
-            result = http_request(url, method='POST', headers=headers, data=payload)
+            result = await http_request_async(url, method='POST', headers=headers, data=payload)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             return create_error_response(
@@ -1,19 +1,73 @@
+import copy
 import logging
 import yaml
 import json
-from src.constants import ACTIVITY_CLIENT
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple
+from src.constants import ACTIVITY_CLIENT, MATCH_COUNT_CACHE_TTL, MATCH_COUNT_CACHE_MAXSIZE
 from src.env import RELTIO_TENANT
-from src.util.api import get_reltio_url, http_request, create_error_response, validate_connection_security
+from src.util.api import HTTP_REQUEST_ERRORS, get_reltio_url, http_request_async, create_error_response, validate_connection_security
 from src.util.auth import get_reltio_headers
+from src.util.cache import TTLCache, tenant_generation
 from src.util.exceptions import SecurityError
 from src.util.models import MatchScoreRequest, ConfidenceLevelRequest, GetTotalMatchesRequest, GetMatchFacetsRequest, UnifiedMatchRequest, GetPotentialMatchApisRequest
 from src.util.activity_log import ActivityLog
-from src.tools.util import ActivityLogLabel
+from src.tools.util import ActivityLogLabel, YAML_DUMPER, escape_filter_value
 
 
 # Configure logging
 logger = logging.getLogger("mcp.server.reltio")
 
+# Filter templates and the fixed part of the potential-match search payload
+_MATCH_SCORE_FILTER = "(range(potentialMatches.matchScore,{start},{end}) and equals(type,'configuration/entityTypes/{entity_type}')"
+_CONFIDENCE_FILTER = "(equals(type,'configuration/entityTypes/{entity_type}') and equals(relevanceScores.actionLabel,'{confidence_level}'))"
+_MIN_MATCHES_FILTER = "(gt(matches,'{min_matches}'))"
+_MATCH_SEARCH_PAYLOAD = MappingProxyType({
+    "select": "uri,label,type,relevanceScores",
+    "scoreEnabled": False,
+    "options": "ovOnly",
+    "activeness": "active"
+})
+
+# Short-lived cache of aggregate match counts keyed by (tool, tenant_id, tenant generation, min_matches)
+_count_cache = TTLCache(MATCH_COUNT_CACHE_MAXSIZE, MATCH_COUNT_CACHE_TTL)
+
+
+async def _call_match_api(path: str, tenant_id: str, failure_message: str, payload: Any = None,
+                          params: Optional[Dict[str, Any]] = None, method: str = 'POST') -> Tuple[Any, Optional[dict]]:
+    """Run the security check, authentication and Reltio API call shared by the match tools
+    
+    Returns:
+        A (result, error_response) tuple; error_response is None when the call succeeded
+    """
+    url = get_reltio_url(path, "api", tenant_id)
+    try:
+        validate_connection_security(url)
+    except SecurityError as e:
+        logger.error("Security error: %s", e)
+        return None, create_error_response(
+            "SECURITY_ERROR",
+            "Security requirements not met"
+        )
+    
+    try:
+        headers = get_reltio_headers()
+    except Exception as e:
+        logger.error("Authentication error: %s", e)
+        return None, create_error_response(
+            "AUTHENTICATION_ERROR",
+            "Failed to authenticate with Reltio API"
+        )
+    
+    try:
+        return await http_request_async(url, method=method, headers=headers, data=payload, params=params), None
+    except HTTP_REQUEST_ERRORS as e:
+        logger.error("API request error: %s", e)
+        return None, create_error_response(
+            "SERVER_ERROR",
+            f"{failure_message}: {str(e)}"
+        )
+
 
 async def find_matches_by_match_score(start_match_score: int = 0, end_match_score: int = 100,
                                      entity_type: str = "Individual", tenant_id: str = RELTIO_TENANT,
@@ -45,55 +99,26 @@ async def find_matches_by_match_score(start_match_score: int = 0, end_match_scor
                 offset=offset
             )
         except ValueError as e:
-            logger.warning(f"Validation error in find_matches_by_match_score: {str(e)}")
+            logger.warning("Validation error in find_matches_by_match_score: %s", e)
             return create_error_response(
                 "VALIDATION_ERROR",
                 f"Invalid input parameters: {str(e)}"
             )
         
-        try:
-            headers = get_reltio_headers()
-        except Exception as e:
-            logger.error(f"Authentication error: {str(e)}")
-            return create_error_response(
-                "AUTHENTICATION_ERROR",
-                "Failed to authenticate with Reltio API"
-            )
-        
-        # Special URL construction specifically for search endpoint
-        url = get_reltio_url("entities/_search", "api", request.tenant_id)
-        
-        # Validate connection security
-        try:
-            validate_connection_security(url, headers)
-        except SecurityError as e:
-            logger.error(f"Security error: {str(e)}")
-            return create_error_response(
-                "SECURITY_ERROR",
-                "Security requirements not met"
-            )
-        
-        # Use exact string from Postman to ensure identical formatting but with validated inputs
-        filter_expression = f"(range(potentialMatches.matchScore,{request.start_match_score},{request.end_match_score}) and equals(type,'configuration/entityTypes/{request.entity_type}')"
-        
         # Build the payload to exactly match the Postman request
         payload = {
-            "filter": filter_expression,
-            "select": "uri,label,type,relevanceScores",
-            "max":  min(request.max_results, 10),
-            "offset": request.offset,
-            "scoreEnabled": False,
-            "options": "ovOnly",
-            "activeness": "active"
+            **_MATCH_SEARCH_PAYLOAD,
+            "filter": _MATCH_SCORE_FILTER.format(
+                start=request.start_match_score,
+                end=request.end_match_score,
+                entity_type=escape_filter_value(request.entity_type)
+            ),
+            "max": request.max_results,
+            "offset": request.offset
         }
-        try:
-            result = http_request(url, method='POST', headers=headers, data=payload)
-        except Exception as e:
-            logger.error(f"API request error: {str(e)}")
-            return create_error_response(
-                "SERVER_ERROR",
-                f"Failed to retrieve matches: {str(e)}"
-            ) 
+        result, error = await _call_match_api("entities/_search", request.tenant_id, "Failed to retrieve matches", payload=payload)
+        if error:
+            return error
 
         try:
             await ActivityLog.execute_and_log_activity(
@@ -101,12 +126,11 @@ async def find_matches_by_match_score(start_match_score: int = 0, end_match_scor
                 description=f"find_matches_by_match_score_tool : Successfully fetched potential matches for entity type {request.entity_type} with match score between {request.start_match_score} and {request.end_match_score}"
             )
         except Exception as log_error:
-            logger.error(f"Activity logging failed for find_matches_by_match_score: {str(log_error)}")
+            logger.error("Activity logging failed for find_matches_by_match_score: %s", log_error)
        
         # Return appropriate response based on results
         if result and len(result) > 0:
-            result=[{"uri":match["uri"],"label":match["label"],"type":match["type"]} for match in result]
-            return yaml.dump(result,sort_keys=False)
+            return {"matches": [{"uri": match["uri"], "label": match["label"], "type": match["type"]} for match in result]}
         else:
             return {
                 "message": f"No potential matches found for entity type {request.entity_type} with match score between {request.start_match_score} and {request.end_match_score}.",
@@ -114,7 +138,7 @@ async def find_matches_by_match_score(start_match_score: int = 0, end_match_scor
             }
     except Exception as e:
         # Log the error
-        logger.error(f"Unexpected error in find_matches_by_match_score: {str(e)}")
+        logger.error("Unexpected error in find_matches_by_match_score: %s", e)
         
         # Return a sanitized error response
         return create_error_response(
@@ -150,54 +174,25 @@ async def find_matches_by_confidence(confidence_level: str = "Low confidence", e
                 offset=offset
             )
         except ValueError as e:
-            logger.warning(f"Validation error in find_matches_by_confidence: {str(e)}")
+            logger.warning("Validation error in find_matches_by_confidence: %s", e)
             return create_error_response(
                 "VALIDATION_ERROR",
                 f"Invalid input parameters: {str(e)}"
             )
         
-        try:
-            headers = get_reltio_headers()
-        except Exception as e:
-            logger.error(f"Authentication error: {str(e)}")
-            return create_error_response(
-                "AUTHENTICATION_ERROR",
-                "Failed to authenticate with Reltio API"
-            )
-        
-        # Special URL construction specifically for search endpoint
-        url = get_reltio_url("entities/_search", "api", request.tenant_id)
-        
-        # Validate connection security
-        try:
-            validate_connection_security(url, headers)
-        except SecurityError as e:
-            logger.error(f"Security error: {str(e)}")
-            return create_error_response(
-                "SECURITY_ERROR",
-                "Security requirements not met"
-            )
-        
-        filter_expression = f"(equals(type,'configuration/entityTypes/{request.entity_type}') and equals(relevanceScores.actionLabel,'{request.confidence_level}')) and equals(type,'configuration/entityTypes/{request.entity_type}')"
-        
         # Build the payload to exactly match the Postman request
         payload = {
-            "filter": filter_expression,
-            "select": "uri,label,type,relevanceScores",
-            "max": min(request.max_results, 10),
-            "offset":  request.offset,
-            "scoreEnabled": False,
-            "options": "ovOnly",
-            "activeness": "active"
+            **_MATCH_SEARCH_PAYLOAD,
+            "filter": _CONFIDENCE_FILTER.format(
+                entity_type=escape_filter_value(request.entity_type),
+                confidence_level=escape_filter_value(request.confidence_level)
+            ),
+            "max": request.max_results,
+            "offset": request.offset
         }
-        try:
-            result = http_request(url, method='POST', headers=headers, data=payload)
-        except Exception as e:
-            logger.error(f"API request error: {str(e)}")
-            return create_error_response(
-                "SERVER_ERROR",
-                f"Failed to retrieve matches: {str(e)}"
-            )
+        result, error = await _call_match_api("entities/_search", request.tenant_id, "Failed to retrieve matches", payload=payload)
+        if error:
+            return error
         
         try:
             await ActivityLog.execute_and_log_activity(
@@ -205,12 +200,11 @@ async def find_matches_by_confidence(confidence_level: str = "Low confidence", e
                 description=f"find_matches_by_confidence_tool : Successfully fetched potential matches for entity type {request.entity_type} with confidence level {request.confidence_level}"
             )
         except Exception as log_error:
-            logger.error(f"Activity logging failed for find_matches_by_confidence: {str(log_error)}")
+            logger.error("Activity logging failed for find_matches_by_confidence: %s", log_error)
         
         # Return appropriate response based on results
         if result and len(result) > 0:
-            result=[{"uri":match["uri"],"label":match["label"],"type":match["type"]} for match in result]
-            return yaml.dump(result,sort_keys=False)
+            return {"matches": [{"uri": match["uri"], "label": match["label"], "type": match["type"]} for match in result]}
         else:
             return {
                 "message": f"No potential matches found for entity type {request.entity_type} with confidence level {request.confidence_level}.",
@@ -218,7 +212,7 @@ async def find_matches_by_confidence(confidence_level: str = "Low confidence", e
             }
     except Exception as e:
         # Log the error
-        logger.error(f"Unexpected error in find_matches_by_confidence: {str(e)}")
+        logger.error("Unexpected error in find_matches_by_confidence: %s", e)
         
         # Return a sanitized error response
         return create_error_response(
@@ -248,76 +242,57 @@ async def get_total_matches(min_matches: int = 0, tenant_id: str = RELTIO_TENANT
                 tenant_id=tenant_id
             )
         except ValueError as e:
-            logger.warning(f"Validation error in get_total_matches: {str(e)}")
+            logger.warning("Validation error in get_total_matches: %s", e)
             return create_error_response(
                 "VALIDATION_ERROR",
                 f"Invalid input parameters: {str(e)}"
             )
         
-        try:
-            headers = get_reltio_headers()
-        except Exception as e:
-            logger.error(f"Authentication error: {str(e)}")
-            return create_error_response(
-                "AUTHENTICATION_ERROR",
-                "Failed to authenticate with Reltio API"
-            )
-        
-        # Construct URL for the total endpoint
-        url = get_reltio_url("entities/_total", "api", request.tenant_id)
-        
-        # Validate connection security
-        try:
-            validate_connection_security(url, headers)
-        except SecurityError as e:
-            logger.error(f"Security error: {str(e)}")
-            return create_error_response(
-                "SECURITY_ERROR",
-                "Security requirements not met"
-            )
-        
-        # Build the payload for the total request
-        filter_expression = f"(gt(matches,'{request.min_matches}'))"
-        
-        payload = {
-            "filter": filter_expression,
-            "options": "searchByOv,ovOnly",
-            "activeness": "active"
-        }
-        
-        try:
-            result = http_request(url, method='POST', headers=headers, data=payload)
-        except Exception as e:
-            logger.error(f"API request error: {str(e)}")
-            return create_error_response(
-                "SERVER_ERROR",
-                f"Failed to retrieve total matches count: {str(e)}"
-            )
-        
-        # Return the total count
-        if result and "total" in result:
-            try:
-                await ActivityLog.execute_and_log_activity(
-                    tenant_id=tenant_id,
-                    description=f"get_total_matches : Found {result['total']} entities with more than {request.min_matches} potential matches."
-                )
-            except Exception as log_error:
-                logger.error(f"Activity logging failed for get_total_matches: {str(log_error)}")
-            return {
+        cache_key = ("total", request.tenant_id, tenant_generation(request.tenant_id), request.min_matches)
+        response = _count_cache.get(cache_key)
+        if response is None:
+            # Build the payload for the total request
+            filter_expression = _MIN_MATCHES_FILTER.format(min_matches=request.min_matches)
+            
+            payload = {
+                "filter": filter_expression,
+                "options": "searchByOv,ovOnly",
+                "activeness": "active"
+            }
+            
+            result, error = await _call_match_api("entities/_total", request.tenant_id, "Failed to retrieve total matches count", payload=payload)
+            if error:
+                return error
+            
+            if not (result and "total" in result):
+                return {
+                    "error": "RESPONSE_ERROR",
+                    "message": "API response did not contain a total count",
+                    "details": result
+                }
+            response = {
                 "total": result["total"],
                 "min_matches": request.min_matches,
                 "message": f"Found {result['total']} entities with more than {request.min_matches} potential matches."
             }
-        else:
-            return {
-                "error": "RESPONSE_ERROR",
-                "message": "API response did not contain a total count",
-                "details": result
-            }
+            _count_cache.set(cache_key, response)
+        
+        # Cached counts are still reported to the activity log
+        try:
+            await ActivityLog.execute_and_log_activity(
+                tenant_id=tenant_id,
+                label=ActivityLogLabel.ENTITY_TOTAL_MATCHES.value,
+                client_type=ACTIVITY_CLIENT,
+                description=f"get_total_matches : {response['message']}"
+            )
+        except Exception as log_error:
+            logger.error("Activity logging failed for get_total_matches: %s", log_error)
+        # Callers get their own copy so changing the result cannot alter the cached one
+        return copy.deepcopy(response)
             
     except Exception as e:
         # Log the error
-        logger.error(f"Unexpected error in get_total_matches: {str(e)}")
+        logger.error("Unexpected error in get_total_matches: %s", e)
         
         # Return a sanitized error response
         return create_error_response(
@@ -347,81 +322,62 @@ async def get_total_matches_by_entity_type(min_matches: int = 0, tenant_id: str
                 tenant_id=tenant_id
             )
         except ValueError as e:
-            logger.warning(f"Validation error in get_total_matches_by_entity_type: {str(e)}")
+            logger.warning("Validation error in get_total_matches_by_entity_type: %s", e)
             return create_error_response(
                 "VALIDATION_ERROR",
                 f"Invalid input parameters: {str(e)}"
             )
         
-        try:
-            headers = get_reltio_headers()
-        except Exception as e:
-            logger.error(f"Authentication error: {str(e)}")
-            return create_error_response(
-                "AUTHENTICATION_ERROR",
-                "Failed to authenticate with Reltio API"
-            )
-        
-        # Construct the facets URL with query parameters
-        # Need to escape % character in the filter query parameter
-        filter_param = f"(gt(matches,'{request.min_matches}'))"
-        
-        # Using params dict for proper URL encoding
-        params = {
-            "activeness": "active",
-            "filter": filter_param,
-            "options": "searchByOv,ovOnly"
-        }
-        
-        url = get_reltio_url("entities/_facets", "api", request.tenant_id)
-        
-        # Validate connection security
-        try:
-            validate_connection_security(url, headers)
-        except SecurityError as e:
-            logger.error(f"Security error: {str(e)}")
-            return create_error_response(
-                "SECURITY_ERROR",
-                "Security requirements not met"
-            )
-        
-        # Fixed payload for facets
-        payload = [{"fieldName": "type", "pageSize": 101, "pageNo": 1}]
-        
-        try:
-            result = http_request(url, method='POST', headers=headers, data=payload, params=params)
-        except Exception as e:
-            logger.error(f"API request error: {str(e)}")
-            return create_error_response(
-                "SERVER_ERROR",
-                f"Failed to retrieve match facets: {str(e)}"
-            )
-        
-        # Return the facet counts
-        if result and "type" in result:
-            try:
-                await ActivityLog.execute_and_log_activity(
-                    tenant_id=tenant_id,
-                    description=f"get_total_matches_by_entity_type : Found entities by type with more than {request.min_matches} potential matches."
-                )
-            except Exception as log_error:
-                logger.error(f"Activity logging failed for get_total_matches_by_entity_type: {str(log_error)}")
-
-            return {
+        cache_key = ("type_counts", request.tenant_id, tenant_generation(request.tenant_id), request.min_matches)
+        response = _count_cache.get(cache_key)
+        if response is None:
+            # Construct the facets URL with query parameters
+            # Need to escape % character in the filter query parameter
+            filter_param = _MIN_MATCHES_FILTER.format(min_matches=request.min_matches)
+            
+            # Using params dict for proper URL encoding
+            params = {
+                "activeness": "active",
+                "filter": filter_param,
+                "options": "searchByOv,ovOnly"
+            }
+            
+            # Fixed payload for facets
+            payload = [{"fieldName": "type", "pageSize": 101, "pageNo": 1}]
+            
+            result, error = await _call_match_api("entities/_facets", request.tenant_id, "Failed to retrieve match facets", payload=payload, params=params)
+            if error:
+                return error
+            
+            if not (result and "type" in result):
+                return {
+                    "error": "RESPONSE_ERROR",
+                    "message": "API response did not contain facet counts",
+                    "details": result
+                }
+            response = {
                 "type_counts": result["type"],
                 "min_matches": request.min_matches,
                 "message": f"Found entities by type with more than {request.min_matches} potential matches."
             }
-        else:
-            return {
-                "error": "RESPONSE_ERROR",
-                "message": "API response did not contain facet counts",
-                "details": result
-            }
+            _count_cache.set(cache_key, response)
+        
+        # Cached counts are still reported to the activity log
+        try:
+            await ActivityLog.execute_and_log_activity(
+                tenant_id=tenant_id,
+                label=ActivityLogLabel.ENTITY_TOTAL_MATCHES.value,
+                client_type=ACTIVITY_CLIENT,
+                description=f"get_total_matches_by_entity_type : {response['message']}"
+            )
+        except Exception as log_error:
+            logger.error("Activity logging failed for get_total_matches_by_entity_type: %s", log_error)
+        # Callers get their own copy so changing the result cannot alter the cached one
+        return copy.deepcopy(response)
             
     except Exception as e:
         # Log the error
-        logger.error(f"Unexpected error in get_total_matches_by_entity_type: {str(e)}")
+        logger.error("Unexpected error in get_total_matches_by_entity_type: %s", e)
         
         # Return a sanitized error response
         return create_error_response(
@@ -466,39 +422,18 @@ async def find_potential_matches(search_type: str = "match_rule", filter: str =
                 search_filters=search_filters
             )
         except ValueError as e:
-            logger.warning(f"Validation error in find_potential_matches: {str(e)}")
+            logger.warning("Validation error in find_potential_matches: %s", e)
             return create_error_response(
                 "VALIDATION_ERROR",
                 f"Invalid input parameters: {str(e)}"
             )
         
-        try:
-            headers = get_reltio_headers()
-        except Exception as e:
-            logger.error(f"Authentication error: {str(e)}")
-            return create_error_response(
-                "AUTHENTICATION_ERROR",
-                "Failed to authenticate with Reltio API"
-            )
-        
-        # Special URL construction specifically for search endpoint
-        url = get_reltio_url("entities/_search", "api", request.tenant_id)
-        
-        # Validate connection security
-        try:
-            validate_connection_security(url, headers)
-        except SecurityError as e:
-            logger.error(f"Security error: {str(e)}")
-            return create_error_response(
-                "SECURITY_ERROR",
-                "Security requirements not met"
-            )
-        
-        # Build filter expression based on search type
+        # Build filter expression based on search type; values quoted in the filter are escaped
+        entity_type = escape_filter_value(request.entity_type)
         if request.search_type == "match_rule":
             # For match rule: equals(matchRules,<match_rule_id>)
             match_filter = request.filter.split('/')[-1]
-            primary_filter = f"equals(matchRules,'configuration/entityTypes/{request.entity_type}/matchGroups/{match_filter}')"
+            primary_filter = f"equals(matchRules,'configuration/entityTypes/{entity_type}/matchGroups/{escape_filter_value(match_filter)}')"
         elif request.search_type == "score":
             # For score: range(potentialMatches.matchScore,start,end)
             start_score, end_score = request.filter.split(',')
@@ -507,10 +442,10 @@ async def find_potential_matches(search_type: str = "match_rule", filter: str =
             primary_filter = f"range(relevanceScores.relevance,{(start_score)/100},{(end_score)/100})"
         elif request.search_type == "confidence":
             # For confidence: equals(relevanceScores.actionLabel,'confidence_level')
-            primary_filter = f"equals(relevanceScores.actionLabel,'{request.filter}')"
+            primary_filter = f"equals(relevanceScores.actionLabel,'{escape_filter_value(request.filter)}')"
         
         # Combine primary filter with entity type filter
-        entity_type_filter = f"equals(type,'configuration/entityTypes/{request.entity_type}')"
+        entity_type_filter = f"equals(type,'configuration/entityTypes/{entity_type}')"
         
         # Combine all filters
         filter_parts = [primary_filter, entity_type_filter]
@@ -520,27 +455,19 @@ async def find_potential_matches(search_type: str = "match_rule", filter: str =
             filter_parts.append(request.search_filters.strip())
         
         # Create final filter expression with proper parentheses
-        filter_expression = f"({' and '.join(filter_parts)})"
+        filter_expression = "(" + " and ".join(filter_parts) + ")"
         
         # Build the payload to match the pattern from existing functions
         payload = {
+            **_MATCH_SEARCH_PAYLOAD,
             "filter": filter_expression,
-            "select": "uri,label,type,relevanceScores",
-            "max": min(request.max_results, 10),
-            "offset": request.offset,
-            "scoreEnabled": False,
-            "options": "ovOnly",
-            "activeness": "active"
+            "max": request.max_results,
+            "offset": request.offset
         }
         
-        try:
-            result = http_request(url, method='POST', headers=headers, data=payload)
-        except Exception as e:
-            logger.error(f"API request error: {str(e)}")
-            return create_error_response(
-                "SERVER_ERROR",
-                f"Failed to retrieve matches: {str(e)}"
-            )
+        result, error = await _call_match_api("entities/_search", request.tenant_id, "Failed to retrieve matches", payload=payload)
+        if error:
+            return error
         
         try:
             await ActivityLog.execute_and_log_activity(
@@ -556,12 +483,12 @@ async def find_potential_matches(search_type: str = "match_rule", filter: str =
                 })
             )
         except Exception as log_error:
-            logger.error(f"Activity logging failed for find_potential_matches: {str(log_error)}")
+            logger.error("Activity logging failed for find_potential_matches: %s", log_error)
 
         # Return appropriate response based on results
         if result and len(result) > 0:
             result = [{"uri": match["uri"], "label": match["label"], "type": match["type"]} for match in result]
-            return yaml.dump(result, sort_keys=False)
+            return yaml.dump(result, sort_keys=False, Dumper=YAML_DUMPER)
         else:
             return {
                 "message": f"No potential matches found for entity type {request.entity_type} with {request.search_type} filter '{request.filter}'.",
@@ -569,7 +496,7 @@ async def find_potential_matches(search_type: str = "match_rule", filter: str =
             }
     except Exception as e:
         # Log the error
-        logger.error(f"Unexpected error in find_potential_matches: {str(e)}")
+        logger.error("Unexpected error in find_potential_matches: %s", e)
         
         # Return a sanitized error response
         return create_error_response(
@@ -599,46 +526,22 @@ async def get_potential_match_apis(min_matches: int = 0, tenant_id: str = RELTIO
                 tenant_id=tenant_id
             )
         except Exception as e:
-            logger.error(f"Validation error in get_potential_match_apis: {str(e)}")
+            logger.error("Validation error in get_potential_match_apis: %s", e)
             return create_error_response(
                 "VALIDATION_ERROR",
                 f"Invalid input parameters: {str(e)}"
             )
 
-        try:
-            headers = get_reltio_headers()
-        except Exception as e:
-            logger.error(f"Authentication error: {str(e)}")
-            return create_error_response(
-                "AUTHENTICATION_ERROR",
-                "Failed to authenticate with Reltio API"
-            )
-
-        url = get_reltio_url("entities/_facets", "api", request.tenant_id)
-        try:
-            validate_connection_security(url, headers)
-        except SecurityError as e:
-            logger.error(f"Security error: {str(e)}")
-            return create_error_response(
-                "SECURITY_ERROR",
-                "Security requirements not met"
-            )
-        
-        filter_expression = f"(gt(matches,'{request.min_matches}'))"
+        filter_expression = _MIN_MATCHES_FILTER.format(min_matches=request.min_matches)
         params = {
             "filter": filter_expression,
             "facet": "matchRules,type",
             "activeness": "active",
             "options": "searchByOv,ovOnly"
         }
-        try:
-            result = http_request(url, headers=headers, params=params)
-        except Exception as e:
-            logger.error(f"API request error: {str(e)}")
-            return create_error_response(
-                "SERVER_ERROR",
-                f"Failed to retrieve potential match APIs: {str(e)}"
-            )
+        result, error = await _call_match_api("entities/_facets", request.tenant_id, "Failed to retrieve potential match APIs", params=params, method='GET')
+        if error:
+            return error
         
         # Process the result to calculate sum of type values
         if result and "type" in result:
@@ -658,7 +561,7 @@ async def get_potential_match_apis(min_matches: int = 0, tenant_id: str = RELTIO
                         description=f"get_potential_matches_stats_tool : Found total potential match  with type and match rules with more than {request.min_matches} matches."
                     )
                 except Exception as log_error:
-                    logger.error(f"Activity logging failed for get_potential_match_apis: {str(log_error)}")
+                    logger.error("Activity logging failed for get_potential_match_apis: %s", log_error)
         else:
             return {
                 "error": "RESPONSE_ERROR",
@@ -670,7 +573,7 @@ async def get_potential_match_apis(min_matches: int = 0, tenant_id: str = RELTIO
         
         
     except Exception as e:
-        logger.error(f"Unexpected error in get_potential_match_apis: {str(e)}")
+        logger.error("Unexpected error in get_potential_match_apis: %s", e)
         return create_error_response(
             "SERVER_ERROR",
             "An unexpected error occurred while getting potential match APIs"
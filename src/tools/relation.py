@@ -3,11 +3,12 @@ from typing import List, Dict, Any, Optional
 import yaml
 from src.constants import ACTIVITY_CLIENT
 from src.env import RELTIO_TENANT
-from src.util.api import get_reltio_url, http_request, create_error_response, validate_connection_security
+from src.util.api import HTTP_REQUEST_ERRORS, get_reltio_url, http_request_async, create_error_response, validate_connection_security
 from src.util.auth import get_reltio_headers
+from src.util.exceptions import ReltioHTTPError
 from src.util.models import RelationIdRequest, CreateRelationsRequest, GetEntityRelationsRequest, RelationSearchRequest
 from src.util.activity_log import ActivityLog
-from src.tools.util import ActivityLogLabel, simplify_reltio_attributes
+from src.tools.util import ActivityLogLabel, simplify_reltio_attributes, YAML_DUMPER
 
 # Configure logging
 logger = logging.getLogger("mcp.server.reltio")
@@ -57,12 +58,12 @@ async def get_relation_details(relation_id: str, tenant_id: str = RELTIO_TENANT)
         
         # Make the request with timeout
         try:
-            relation = http_request(url, headers=headers)
-        except Exception as e:
+            relation = await http_request_async(url, headers=headers)
+        except ReltioHTTPError as e:
             logger.error(f"API request error: {str(e)}")
             
             # Check if it's a 404 error (relation not found)
-            if "404" in str(e):
+            if e.status_code == 404:
                 return create_error_response(
                     "RESOURCE_NOT_FOUND",
                     f"Relation with ID {request.relation_id} not found"
@@ -72,6 +73,12 @@ async def get_relation_details(relation_id: str, tenant_id: str = RELTIO_TENANT)
                 "SERVER_ERROR",
                 "Failed to retrieve relation details from Reltio API"
             )
+        except HTTP_REQUEST_ERRORS as e:
+            logger.error(f"API request error: {str(e)}")
+            return create_error_response(
+                "SERVER_ERROR",
+                "Failed to retrieve relation details from Reltio API"
+            )
         
         try:
             await ActivityLog.execute_and_log_activity(
@@ -82,8 +89,9 @@ async def get_relation_details(relation_id: str, tenant_id: str = RELTIO_TENANT)
             )
         except Exception as log_error:
             logger.error(f"Activity logging failed for get_relation_details: {str(log_error)}")
-        relation["attributes"]=simplify_reltio_attributes(relation["attributes"])
-        return yaml.dump(relation, sort_keys=False)
+        if relation.get("attributes"):
+            relation["attributes"]=simplify_reltio_attributes(relation["attributes"])
+        return relation
     except Exception as e:
         # Log the error
         logger.error(f"Unexpected error in get_relation_details: {str(e)}")
@@ -269,7 +277,7 @@ async def create_relationships(relations: list, options: str = None, tenant_id:
         
         # Make the API request
         try:
-            result = http_request(url, method='POST', headers=headers, data=payload, params=params if params else None)
+            result = await http_request_async(url, method='POST', headers=headers, data=payload, params=params if params else None)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             return create_error_response(
@@ -291,7 +299,7 @@ async def create_relationships(relations: list, options: str = None, tenant_id:
             logger.error(f"Activity logging failed for create_relationships: {str(log_error)}")
         
         # Return the result as YAML for better readability
-        return yaml.dump(result, sort_keys=False)
+        return yaml.dump(result, sort_keys=False, Dumper=YAML_DUMPER)
         
     except Exception as e:
         # Log the error
@@ -354,7 +362,7 @@ async def delete_relation(relation_id: str, tenant_id: str = RELTIO_TENANT) -> d
         
         # Make the DELETE request
         try:
-            result = http_request(url, method='DELETE', headers=headers)
+            result = await http_request_async(url, method='DELETE', headers=headers)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             
@@ -371,7 +379,7 @@ async def delete_relation(relation_id: str, tenant_id: str = RELTIO_TENANT) -> d
             )
         
         # Return the result as YAML for better readability
-        return yaml.dump(result, sort_keys=False)
+        return yaml.dump(result, sort_keys=False, Dumper=YAML_DUMPER)
         
     except Exception as e:
         # Log the error
@@ -525,7 +533,7 @@ async def get_entity_relations(entity_id: str, entity_types: list, sort_by: str
         
         # Make the API request
         try:
-            result = http_request(url, method='POST', headers=headers, data=payload, params=params if params else None)
+            result = await http_request_async(url, method='POST', headers=headers, data=payload, params=params if params else None)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             
@@ -553,7 +561,7 @@ async def get_entity_relations(entity_id: str, entity_types: list, sort_by: str
             logger.error(f"Activity logging failed for get_entity_relations: {str(log_error)}")
         
         # Return the result as YAML for better readability
-        return yaml.dump(result, sort_keys=False)
+        return yaml.dump(result, sort_keys=False, Dumper=YAML_DUMPER)
         
     except Exception as e:
         # Log the error
@@ -658,7 +666,7 @@ async def search_relations(filter: str = "", select: str = "", max: int = 10, of
                 
         # Make the API request using POST method as recommended by Reltio
         try:
-            result = http_request(url, method='POST', headers=headers, data=request_body)
+            result = await http_request_async(url, method='POST', headers=headers, data=request_body)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             
@@ -703,7 +711,7 @@ async def search_relations(filter: str = "", select: str = "", max: int = 10, of
             result["attributes"] = simplify_reltio_attributes(result["attributes"])
         
         # Return the result as YAML for better readability
-        return yaml.dump(result, sort_keys=False)
+        return yaml.dump(result, sort_keys=False, Dumper=YAML_DUMPER)
         
     except Exception as e:
         # Log the error
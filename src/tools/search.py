@@ -1,17 +1,75 @@
 import json
+from typing import Any, Dict, Iterable, Iterator, Union
 import logging
 import yaml
-from src.constants import ACTIVITY_CLIENT
-from src.env import RELTIO_TENANT
-from src.util.api import get_reltio_url, http_request, create_error_response, validate_connection_security
+from src.constants import ACTIVITY_CLIENT, MAX_RESULTS_LIMIT, SEARCH_CACHE_MAXSIZE, SEARCH_CACHE_TTL
+from src.env import RELTIO_TENANT, RELTIO_MAX_PAGE_SIZE
+from src.util.api import get_reltio_url, http_request_async, create_error_response, validate_connection_security
 from src.util.auth import get_reltio_headers
+from src.util.batcher import RequestCoalescer
+from src.util.cache import TTLCache, tenant_generation
 from src.util.models import EntitySearchRequest
 from src.util.activity_log import ActivityLog
-from src.tools.util import ActivityLogLabel, create_search_activity_description, simplify_reltio_attributes
+from src.tools.util import ActivityLogLabel, YAML_DUMPER, create_search_activity_description, simplify_reltio_attributes
 
 # Configure logging
 logger = logging.getLogger("mcp.server.reltio")
 
+# Largest page a single search call returns
+MAX_PAGE_SIZE = max(1, min(RELTIO_MAX_PAGE_SIZE, MAX_RESULTS_LIMIT))
+# Identical searches issued concurrently share one Reltio call
+_search_coalescer = RequestCoalescer()
+# Rendered results of recent searches, dropped when the tenant's data is written to
+_search_cache = TTLCache(SEARCH_CACHE_MAXSIZE, SEARCH_CACHE_TTL)
+
+
+def _build_search_payload(search_request: EntitySearchRequest, offset: int) -> Dict[str, Any]:
+    """Build the entities/_search payload for one page of a validated search"""
+    payload = {
+        "filter": search_request.filter,
+        "select": search_request.select,
+        "max": search_request.max_results,
+        "offset": offset,
+        "scoreEnabled": False,
+        "options": search_request.options,
+        "activeness": search_request.activeness
+    }
+
+    if search_request.sort:
+        payload["sort"] = search_request.sort
+        payload["order"] = search_request.order
+    return payload
+
+
+def _simplify_search_results(entities: Iterable[Dict[str, Any]], select: str) -> Iterator[Union[str, Dict[str, Any]]]:
+    """Lazily reduce raw search hits to the selected fields, keyed by entity URI"""
+    # Output keys in select order; every attributes.* field collapses into one "attributes" key
+    # placed where the first of them appears
+    output_fields = list(dict.fromkeys(
+        "attributes" if field.startswith("attributes") else field
+        for field in select.split(',') if field != "uri"
+    ))
+    for entity in entities:
+        entity_dict = {
+            field: simplify_reltio_attributes(entity["attributes"]) if field == "attributes" else entity[field]
+            for field in output_fields
+        }
+        yield {entity["uri"]: entity_dict} if entity_dict else entity["uri"]
+
+
+async def _log_search_activity(tenant_id: str, filter: str, entity_type: str, options: str) -> None:
+    """Record a search in the tenant activity log; a logging failure never fails the search"""
+    try:
+        activity_description = create_search_activity_description(filter, entity_type, options)
+        await ActivityLog.execute_and_log_activity(
+            tenant_id=tenant_id,
+            label=ActivityLogLabel.USER_SEARCH.value,
+            client_type=ACTIVITY_CLIENT,
+            description=json.dumps(activity_description)
+        )
+    except Exception as log_error:
+        logger.error("Activity logging failed for search_entities_tool: %s", log_error)
+
 
 async def search_entities(filter: str = "", entity_type: str = "",
                               tenant_id: str = RELTIO_TENANT, max_results: int = 10,
@@ -26,7 +84,7 @@ async def search_entities(filter: str = "", entity_type: str = "",
         filter (str): Enables entities filtering by a condition. Format for filter query parameter: filter=({Condition Type}[AND/OR {Condition Type}]*).
         entity_type (str): Entity type to filter by (e.g., 'Individual', 'Organization')
         tenant_id (str): Tenant ID for the Reltio environment. Defaults to RELTIO_TENANT env value.
-        max_results (int): Maximum number of results to return. Defaults to 10.
+        max_results (int): Maximum number of results to return. Defaults to 10, capped at MAX_PAGE_SIZE.
         sort (str): Attribute name to sort by.
         order (str): Sort order ('asc' or 'desc'). Defaults to 'asc'.
         select (str): Comma-separated list of fields to select in the response.
@@ -47,7 +105,7 @@ async def search_entities(filter: str = "", entity_type: str = "",
                 filter=filter,
                 entity_type=entity_type,
                 tenant_id=tenant_id,
-                max_results=min(max_results, 10),
+                max_results=min(max_results, MAX_PAGE_SIZE),
                 sort=sort,
                 order=order,
                 select=select,
@@ -56,7 +114,7 @@ async def search_entities(filter: str = "", entity_type: str = "",
                 offset=offset
             )
         except ValueError as e:
-            logger.warning(f"Validation error in search_entities_tool: {str(e)}")
+            logger.warning("Validation error in search_entities_tool: %s", e)
             return create_error_response(
                 "VALIDATION_ERROR",
                 f"Invalid input parameters: {str(e)}"
@@ -71,66 +129,44 @@ async def search_entities(filter: str = "", entity_type: str = "",
             # Validate connection security
             validate_connection_security(url, headers)
         except Exception as e:
-            logger.error(f"Authentication or security error: {str(e)}")
+            logger.error("Authentication or security error: %s", e)
             return create_error_response(
                 "AUTHENTICATION_ERROR",
                 "Failed to authenticate with Reltio API"
             )
         
-        # Build the payload
-        payload = {
-            "filter": search_request.filter,
-            "select": search_request.select,
-            "max": min(search_request.max_results, 10),
-            "offset": search_request.offset,
-            "scoreEnabled": False,
-            "options": search_request.options,
-            "activeness": search_request.activeness
-        }
-
-        if search_request.sort:
-            payload["sort"] = search_request.sort
-            payload["order"] = search_request.order
+        payload = _build_search_payload(search_request, search_request.offset)
+        
+        payload_key = json.dumps(payload, sort_keys=True, default=str)
+        cache_key = (url, tenant_generation(search_request.tenant_id), payload_key, select)
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            # A cached answer is still a search by the user, so it is logged like any other
+            await _log_search_activity(tenant_id, filter, entity_type, options)
+            return cached
         
         # Make the request with timeout
         try:
-            result = http_request(url, method='POST', headers=headers, data=payload)
+            result = await _search_coalescer.run(
+                (url, payload_key),
+                lambda: http_request_async(url, method='POST', headers=headers, data=payload)
+            )
         except Exception as e:
-            logger.error(f"API request error: {str(e)}")
+            logger.error("API request error: %s", e)
             return create_error_response(
                 "SERVER_ERROR",
                 "Failed to retrieve search results from Reltio API"
             )
 
-        try:
-            
-            activity_description = create_search_activity_description(filter, entity_type, options)
-            await ActivityLog.execute_and_log_activity(
-                tenant_id=tenant_id,
-                label=ActivityLogLabel.USER_SEARCH.value,
-                client_type=ACTIVITY_CLIENT,
-                description=json.dumps(activity_description)
-            )
-        except Exception as log_error:
-            logger.error(f"Activity logging failed for search_entities_tool: {str(log_error)}")
+        await _log_search_activity(tenant_id, filter, entity_type, options)
         
-        filtered_result=[]
-        select_fields = [field for field in select.split(',') if field != "uri"]
-        for entity in result:
-            entity_dict = {}
-            for field in select_fields:
-                if field.startswith("attributes"):
-                    entity_dict["attributes"] = simplify_reltio_attributes(entity["attributes"])
-                else:
-                    entity_dict[field] = entity[field]
-            if entity_dict == {}:
-                filtered_result.append(entity["uri"])
-            else:
-                filtered_result.append({entity["uri"]: entity_dict})
-        return yaml.dump(filtered_result, sort_keys=False)
+        filtered_result = list(_simplify_search_results(result, select))
+        output = yaml.dump(filtered_result, Dumper=YAML_DUMPER, sort_keys=False)
+        _search_cache.set(cache_key, output)
+        return output
     except Exception as e:
         # Log the error
-        logger.error(f"Unexpected error in search_entities_tool: {str(e)}")
+        logger.error("Unexpected error in search_entities_tool: %s", e)
         
         # Return a sanitized error response
         return create_error_response(
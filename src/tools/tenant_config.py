@@ -1,20 +1,156 @@
+import asyncio
+import functools
 import logging
-import yaml
-from src.constants import ACTIVITY_CLIENT
-from src.env import RELTIO_TENANT
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from src.constants import ACTIVITY_CLIENT, BUSINESS_CONFIG_CACHE_MAXSIZE, RENDERED_RESPONSE_CACHE_MAXSIZE
+from src.env import RELTIO_TENANT, RELTIO_CONFIG_CACHE_TTL, RELTIO_CACHE_DIR
 from src.util.api import (
+    HTTP_REQUEST_ERRORS,
     get_reltio_url,
-    http_request, 
+    http_request_async, 
     create_error_response, 
     validate_connection_security
 )
 from src.util.auth import get_reltio_headers
+from src.util.batcher import RequestCoalescer
+from src.util.cache import FileCache, TTLCache
+from src.util.exceptions import ReltioHTTPError
 from src.util.activity_log import ActivityLog
-from src.tools.util import ActivityLogLabel
+from src.tools.util import ActivityLogLabel, dump_tool_response
 
 # Configure logging
 logger = logging.getLogger("mcp.server.reltio")
-   
+
+# Business configurations by tenant: fresh copies for RELTIO_CONFIG_CACHE_TTL seconds, and the
+# last one fetched successfully, kept in memory (and on disk when RELTIO_CACHE_DIR is set) to fall back on
+_config_cache = TTLCache(BUSINESS_CONFIG_CACHE_MAXSIZE, RELTIO_CONFIG_CACHE_TTL)
+_last_known_configs: Dict[str, dict] = {}
+_config_store = FileCache(RELTIO_CACHE_DIR)
+_config_fetches = RequestCoalescer()
+# Type definitions by URI for each tenant, keyed to the business configuration they were built from
+_type_indexes: Dict[str, Tuple[dict, Dict[str, Dict[str, dict]]]] = {}
+# Tool responses rendered from each tenant's business configuration, keyed by tool and arguments
+_rendered_responses: Dict[str, Tuple[dict, Dict[tuple, str]]] = {}
+_INDEXED_TYPE_KEYS = (
+    "entityTypes", "changeRequestTypes", "relationTypes", "interactionTypes", "graphTypes", "groupingTypes"
+)
+
+# A list of type definitions, or the same definitions indexed by URI
+TypeDefinitions = Union[List[dict], Dict[str, dict]]
+
+
+def _get_request_headers(url: str) -> Tuple[Optional[dict], Optional[dict]]:
+    """Authenticate and validate the connection for a tenant configuration request
+    
+    Returns:
+        A (headers, error_response) tuple; error_response is None on success
+    """
+    try:
+        headers = get_reltio_headers()
+        validate_connection_security(url, headers)
+    except Exception as e:
+        logger.error(f"Authentication or security error: {str(e)}")
+        return None, create_error_response(
+            "AUTHENTICATION_ERROR",
+            "Failed to authenticate with Reltio API"
+        )
+    return headers, None
+
+async def _fetch_business_config(tenant_id: str, url: str, headers: dict) -> dict:
+    """Fetch the business configuration of a tenant and persist it to fall back on"""
+    business_config = await http_request_async(url, headers=headers)
+    try:
+        await asyncio.to_thread(_config_store.store, f"business_config-{tenant_id}", business_config)
+    except OSError as e:
+        logger.warning(f"Could not persist business configuration for {tenant_id}: {str(e)}")
+    return business_config
+
+async def _get_business_config(tenant_id: str) -> Tuple[Optional[dict], Optional[dict]]:
+    """Get the business configuration of a tenant, reusing a recently fetched copy when there is one
+    
+    Returns:
+        A (business_config, error_response) tuple; error_response is None on success
+    """
+    business_config = _config_cache.get(tenant_id)
+    if business_config is not None:
+        return business_config, None
+    
+    url = get_reltio_url("configuration/_noInheritance", "api", tenant_id)
+    headers, error = _get_request_headers(url)
+    if error:
+        return None, error
+    
+    try:
+        # Concurrent misses for the same tenant share one request
+        business_config = await _config_fetches.run(tenant_id, lambda: _fetch_business_config(tenant_id, url, headers))
+    except HTTP_REQUEST_ERRORS as e:
+        stale_config = _last_known_configs.get(tenant_id)
+        if isinstance(e, ReltioHTTPError) and e.status_code < 500:
+            # The tenant refused or no longer has the configuration (e.g. access revoked),
+            # so the last known copy must not be served in its place
+            _last_known_configs.pop(tenant_id, None)
+            stale_config = None
+            try:
+                await asyncio.to_thread(_config_store.discard, f"business_config-{tenant_id}")
+            except OSError as discard_error:
+                logger.warning(f"Could not remove persisted business configuration for {tenant_id}: {str(discard_error)}")
+        elif stale_config is None:
+            stale_config = await asyncio.to_thread(_config_store.load, f"business_config-{tenant_id}")
+        if stale_config is not None:
+            logger.warning(f"Serving last known business configuration for {tenant_id}: {str(e)}")
+            return stale_config, None
+        logger.error(f"API request error: {str(e)}")
+        return None, create_error_response(
+            "API_REQUEST_ERROR",
+            f"Failed to retrieve business configuration: {str(e)}"
+        )
+    
+    _config_cache.set(tenant_id, business_config)
+    _last_known_configs[tenant_id] = business_config
+    return business_config, None
+
+def _get_type_index(tenant_id: str, business_config: dict) -> Dict[str, Dict[str, dict]]:
+    """Get the type definitions of a business configuration indexed by URI, building them once per configuration"""
+    cached = _type_indexes.get(tenant_id)
+    if cached is not None and cached[0] is business_config:
+        return cached[1]
+    type_index = {
+        key: {type_def.get("uri", ""): type_def for type_def in business_config.get(key, [])}
+        for key in _INDEXED_TYPE_KEYS
+    }
+    _type_indexes[tenant_id] = (business_config, type_index)
+    return type_index
+
+def _render_from_config(tenant_id: str, business_config: dict, key: tuple, build: Callable[[], dict]) -> str:
+    """Render a tool response derived from a business configuration, reusing the text rendered for the same request"""
+    cached = _rendered_responses.get(tenant_id)
+    if cached is None or cached[0] is not business_config or len(cached[1]) >= RENDERED_RESPONSE_CACHE_MAXSIZE:
+        cached = (business_config, {})
+        _rendered_responses[tenant_id] = cached
+    rendered = cached[1].get(key)
+    if rendered is None:
+        rendered = dump_tool_response(build())
+        cached[1][key] = rendered
+    return rendered
+
+def _find_type(uri: str, types: TypeDefinitions) -> Optional[dict]:
+    """Find a type definition by URI"""
+    if isinstance(types, dict):
+        return types.get(uri)
+    return next((type_def for type_def in types if type_def.get("uri", "") == uri), None)
+
+async def warm_business_config(tenant_id: str = RELTIO_TENANT) -> None:
+    """Fetch the access token and business configuration of a tenant ahead of its first tool call"""
+    try:
+        # The token request is synchronous, so make it off the event loop
+        await asyncio.to_thread(get_reltio_headers)
+        _, error = await _get_business_config(tenant_id)
+    except Exception as e:
+        logger.warning(f"Could not prefetch business configuration for {tenant_id}: {str(e)}")
+        return
+    if error:
+        logger.warning(f"Could not prefetch business configuration for {tenant_id}: {error['error']['message']}")
+
 async def get_business_configuration(tenant_id: str = RELTIO_TENANT) -> dict:
     """Get business configuration for a tenant
     Args:
@@ -27,30 +163,10 @@ async def get_business_configuration(tenant_id: str = RELTIO_TENANT) -> dict:
         Exception: If there's an error getting the business configuration
     """
     try:
-        # Construct URL with validated tenant ID
-        url = get_reltio_url("configuration/_noInheritance", "api", tenant_id)
-        
-        try:
-            headers = get_reltio_headers()
-            
-            # Validate connection security
-            validate_connection_security(url, headers)
-        except Exception as e:
-            logger.error(f"Authentication or security error: {str(e)}")
-            return create_error_response(
-                "AUTHENTICATION_ERROR",
-                "Failed to authenticate with Reltio API"
-            )
-        
+        business_config, error = await _get_business_config(tenant_id)
+        if error:
+            return error
         response = {}
-        try:
-            business_config = http_request(url, headers=headers)
-        except Exception as e:
-            logger.error(f"API request error: {str(e)}")
-            return create_error_response(
-                "API_REQUEST_ERROR",
-                f"Failed to retrieve business configuration: {str(e)}"
-            )
         
         response["uri"] = business_config.get("uri", {})
         response["description"] = business_config.get("description", {})
@@ -79,23 +195,14 @@ async def get_tenant_permissions_metadata(tenant_id: str = RELTIO_TENANT) -> dic
     try:
         # Construct URL with validated tenant ID
         url = get_reltio_url("", "permissions", tenant_id)
-        
-        try:
-            headers = get_reltio_headers()
-            
-            # Validate connection security
-            validate_connection_security(url, headers)
-        except Exception as e:
-            logger.error(f"Authentication or security error: {str(e)}")
-            return create_error_response(
-                "AUTHENTICATION_ERROR",
-                "Failed to authenticate with Reltio API"
-            )
+        headers, error = _get_request_headers(url)
+        if error:
+            return error
         
         # Make the request with timeout
         try:
-            permissions_metadata = http_request(url, headers=headers)
-        except Exception as e:
+            permissions_metadata = await http_request_async(url, headers=headers)
+        except HTTP_REQUEST_ERRORS as e:
             logger.error(f"API request error: {str(e)}")
             return create_error_response(
                 "API_REQUEST_ERROR",
@@ -112,7 +219,7 @@ async def get_tenant_permissions_metadata(tenant_id: str = RELTIO_TENANT) -> dic
         except Exception as log_error:
             logger.error(f"Activity logging failed for get_tenant_permissions_metadata: {str(log_error)}")
 
-        return yaml.dump(permissions_metadata,sort_keys=False)
+        return dump_tool_response(permissions_metadata)
     
     except Exception as e:
         logger.error(f"Error in get_tenant_permissions_metadata: {str(e)}")
@@ -121,44 +228,35 @@ async def get_tenant_permissions_metadata(tenant_id: str = RELTIO_TENANT) -> dic
             f"An error occurred while retrieving tenant permissions metadata: {str(e)}"
         )
 
+def _summarize_tenant_metadata(business_config: dict) -> dict:
+    """Summarize a business configuration as its scalar fields and the number of each kind of definition"""
+    response = {}
+    response["uri"] = business_config.get("uri", "")
+    response["description"] = business_config.get("description", "")
+    response["schemaVersion"] = business_config.get("schemaVersion", "")
+    response["sources"] = len(business_config.get("sources", []))
+    response["label"] = business_config.get("label", "")
+    response["createdTime"] = business_config.get("createdTime", "")
+    response["updatedTime"] = business_config.get("updatedTime", "")
+    response["createdBy"] = business_config.get("createdBy", "")
+    response["updatedBy"] = business_config.get("updatedBy", "")
+    response["entityTypes"] = len(business_config.get("entityTypes", []))
+    response["changeRequestTypes"] = len(business_config.get("changeRequestTypes", []))
+    response["relationTypes"] = len(business_config.get("relationTypes", []))
+    response["interactionTypes"] = len(business_config.get("interactionTypes", []))
+    response["graphTypes"] = len(business_config.get("graphTypes", []))
+    response["survivorshipStrategies"] = len(business_config.get("survivorshipStrategies", []))
+    response["groupingTypes"] = len(business_config.get("groupingTypes", []))
+    return response
+
 async def get_tenant_metadata(tenant_id: str = RELTIO_TENANT) -> dict:
     """Get the tenant metadata details from the business configuration for a specific tenant"""
     try:
-        url = get_reltio_url("configuration/_noInheritance", "api", tenant_id)
-        try:
-            headers = get_reltio_headers()
-            validate_connection_security(url, headers)
-        except Exception as e:
-            logger.error(f"Authentication or security error: {str(e)}")
-            return create_error_response(
-                "AUTHENTICATION_ERROR",
-                "Failed to authenticate with Reltio API"
-            )
-        response = {}
-        try:
-            business_config = http_request(url, headers=headers)
-        except Exception as e:
-            logger.error(f"API request error: {str(e)}")
-            return create_error_response(
-                "API_REQUEST_ERROR",
-                f"Failed to retrieve business configuration: {str(e)}"
-            )
-        response["uri"] = business_config.get("uri", "")
-        response["description"] = business_config.get("description", "")
-        response["schemaVersion"] = business_config.get("schemaVersion", "")
-        response["sources"] = len(business_config.get("sources", []))
-        response["label"] = business_config.get("label", "")
-        response["createdTime"] = business_config.get("createdTime", "")
-        response["updatedTime"] = business_config.get("updatedTime", "")
-        response["createdBy"] = business_config.get("createdBy", "")
-        response["updatedBy"] = business_config.get("updatedBy", "")
-        response["entityTypes"] = len(business_config.get("entityTypes", []))
-        response["changeRequestTypes"] = len(business_config.get("changeRequestTypes", []))
-        response["relationTypes"] = len(business_config.get("relationTypes", []))
-        response["interactionTypes"] = len(business_config.get("interactionTypes", []))
-        response["graphTypes"] = len(business_config.get("graphTypes", []))
-        response["survivorshipStrategies"] = len(business_config.get("survivorshipStrategies", []))
-        response["groupingTypes"] = len(business_config.get("groupingTypes", []))
+        business_config, error = await _get_business_config(tenant_id)
+        if error:
+            return error
+        rendered = _render_from_config(tenant_id, business_config, ("tenant_metadata",),
+                                       lambda: _summarize_tenant_metadata(business_config))
         try:
             await ActivityLog.execute_and_log_activity(
                 tenant_id=tenant_id,
@@ -168,7 +266,7 @@ async def get_tenant_metadata(tenant_id: str = RELTIO_TENANT) -> dict:
             )
         except Exception as log_error:
             logger.error(f"Activity logging failed for get_tenant_metadata: {str(log_error)}")
-        return yaml.dump(response, sort_keys=False)
+        return rendered
     except Exception as e:
         logger.error(f"Error in get_tenant_metadata: {str(e)}")
         return create_error_response(
@@ -176,93 +274,59 @@ async def get_tenant_metadata(tenant_id: str = RELTIO_TENANT) -> dict:
             f"An error occurred while retrieving tenant metadata: {str(e)}"
         )
 
+# (field, default) pairs copied out of business configuration definitions
+_URI_FIELDS = (("uri", ""),)
+_LABELED_FIELDS = (("uri", ""), ("label", ""))
+_DESCRIBED_FIELDS = (("uri", ""), ("label", ""), ("description", ""))
+_GROUPING_SUMMARY_FIELDS = (("uri", ""), ("description", ""))
+_GROUPING_FIELDS = (("uri", ""), ("description", ""), ("source", ""))
+_INTERACTION_ATTRIBUTE_FIELDS = (("label", ""), ("name", ""), ("type", ""))
+_MEMBER_TYPE_FIELDS = (("name", ""),)
+
+def _project(definition: dict, fields: tuple) -> dict:
+    """Copy the given fields out of a definition, using each field's default when it is missing"""
+    return {field: definition.get(field, default) for field, default in fields}
+
+def _project_attribute(attr: dict) -> dict:
+    """Summarize an entity or relation type attribute; spelled out because types can carry hundreds of attributes"""
+    return {
+        "label": attr.get("label", ""),
+        "name": attr.get("name", ""),
+        "description": attr.get("description", ""),
+        "type": attr.get("type", ""),
+        "required": attr.get("required", False),
+        "searchable": attr.get("searchable", False)
+    }
+
+def _project_graph_type(graph_type: dict) -> dict:
+    """Summarize a graph type; its relationship type list gets a fresh default rather than a shared one"""
+    graph_info = _project(graph_type, _LABELED_FIELDS)
+    graph_info["relationshipTypeURIs"] = graph_type.get("relationshipTypeURIs", [])
+    return graph_info
+
+# How get_data_model_definition summarizes each kind of type, in response order
+_DATA_MODEL_PROJECTIONS = (
+    ("entityTypes", functools.partial(_project, fields=_DESCRIBED_FIELDS)),
+    ("changeRequestTypes", functools.partial(_project, fields=_URI_FIELDS)),
+    ("relationTypes", functools.partial(_project, fields=_DESCRIBED_FIELDS)),
+    ("interactionTypes", functools.partial(_project, fields=_LABELED_FIELDS)),
+    ("graphTypes", _project_graph_type),
+    ("survivorshipStrategies", functools.partial(_project, fields=_LABELED_FIELDS)),
+    ("groupingTypes", functools.partial(_project, fields=_GROUPING_SUMMARY_FIELDS)),
+)
+
 async def get_data_model_definition(object_type: list, tenant_id: str = RELTIO_TENANT) -> dict:
     """Get complete details about the data model definition from the business configuration for a specific tenant"""
     try:
-        url = get_reltio_url("configuration/_noInheritance", "api", tenant_id)
-        try:
-            headers = get_reltio_headers()
-            validate_connection_security(url, headers)
-        except Exception as e:
-            logger.error(f"Authentication or security error: {str(e)}")
-            return create_error_response(
-                "AUTHENTICATION_ERROR",
-                "Failed to authenticate with Reltio API"
-            )
-        response = {}
-        try:
-            business_config = http_request(url, headers=headers)
-        except Exception as e:
-            logger.error(f"API request error: {str(e)}")
-            return create_error_response(
-                "API_REQUEST_ERROR",
-                f"Failed to retrieve business configuration: {str(e)}"
-            )
-        if len(object_type) == 0 or "entityTypes" in object_type:
-            processed_entity_types = []
-            for entity_type in business_config.get("entityTypes", []):
-                entity_info = {
-                    "uri": entity_type.get("uri", ""),
-                    "label": entity_type.get("label", ""),
-                    "description": entity_type.get("description", "")
-                }
-                processed_entity_types.append(entity_info)
-            response["entityTypes"] = processed_entity_types
-        if len(object_type) == 0 or "changeRequestTypes" in object_type:
-            processed_change_request_types = []
-            for change_request_type in business_config.get("changeRequestTypes", []):
-                change_request_info = {
-                    "uri": change_request_type.get("uri", "")
-                }
-                processed_change_request_types.append(change_request_info)
-            response["changeRequestTypes"] = processed_change_request_types
-        if len(object_type) == 0 or "relationTypes" in object_type:
-            processed_relation_types = []
-            for relation_type in business_config.get("relationTypes", []):
-                relation_info = {
-                    "uri": relation_type.get("uri", ""),
-                    "label": relation_type.get("label", ""),
-                    "description": relation_type.get("description", "")
-                }
-                processed_relation_types.append(relation_info)
-            response["relationTypes"] = processed_relation_types
-        if len(object_type) == 0 or "interactionTypes" in object_type:
-            processed_interaction_types = []
-            for interaction_type in business_config.get("interactionTypes", []):
-                interaction_info = {
-                    "uri": interaction_type.get("uri", ""),
-                    "label": interaction_type.get("label", "")
-                }
-                processed_interaction_types.append(interaction_info)
-            response["interactionTypes"] = processed_interaction_types
-        if len(object_type) == 0 or "graphTypes" in object_type:
-            processed_graph_types = []
-            for graph_type in business_config.get("graphTypes", []):
-                graph_info = {
-                    "uri": graph_type.get("uri", ""),
-                    "label": graph_type.get("label", ""),
-                    "relationshipTypeURIs": graph_type.get("relationshipTypeURIs", [])
-                }
-                processed_graph_types.append(graph_info)
-            response["graphTypes"] = processed_graph_types
-        if len(object_type) == 0 or "survivorshipStrategies" in object_type:
-            processed_survivorship_strategies = []
-            for survivorship_strategy in business_config.get("survivorshipStrategies", []):
-                survivorship_info = {
-                    "uri": survivorship_strategy.get("uri", ""),
-                    "label": survivorship_strategy.get("label", "")
-                }
-                processed_survivorship_strategies.append(survivorship_info)
-            response["survivorshipStrategies"] = processed_survivorship_strategies
-        if len(object_type) == 0 or "groupingTypes" in object_type:
-            processed_grouping_types = []
-            for grouping_type in business_config.get("groupingTypes", []):
-                grouping_info = {
-                    "uri": grouping_type.get("uri", ""),
-                    "description": grouping_type.get("description", "")
-                }
-                processed_grouping_types.append(grouping_info)
-            response["groupingTypes"] = processed_grouping_types
+        business_config, error = await _get_business_config(tenant_id)
+        if error:
+            return error
+        wanted = frozenset(object_type)
+        rendered = _render_from_config(tenant_id, business_config, ("data_model", wanted), lambda: {
+            key: [project(type_def) for type_def in business_config.get(key, [])]
+            for key, project in _DATA_MODEL_PROJECTIONS
+            if not wanted or key in wanted
+        })
         try:
             await ActivityLog.execute_and_log_activity(
                 tenant_id=tenant_id,
@@ -272,7 +336,7 @@ async def get_data_model_definition(object_type: list, tenant_id: str = RELTIO_T
             )
         except Exception as log_error:
             logger.error(f"Activity logging failed for get_data_model_definition: {str(log_error)}")
-        return yaml.dump(response,sort_keys=False)
+        return rendered
     except Exception as e:
         logger.error(f"Error in get_data_model_definition: {str(e)}")
         return create_error_response(
@@ -282,132 +346,60 @@ async def get_data_model_definition(object_type: list, tenant_id: str = RELTIO_T
 
 # Utility functions for extracting definitions from business_config
 
-def get_entity_type_definition_util(entity_type: str, entity_types: list) -> dict:
-    for e_type in entity_types:
-        if e_type.get("uri", "") == entity_type:
-            entity_info = {
-                "uri": e_type.get("uri", ""),
-                "label": e_type.get("label", ""),
-                "description": e_type.get("description", ""),
-                "attributes": []
-            }
-            attributes = e_type.get("attributes", [])
-            for attr in attributes:
-                attr_info = {
-                    "label": attr.get("label", ""),
-                    "name": attr.get("name", ""),
-                    "description": attr.get("description", ""),
-                    "type": attr.get("type", ""),
-                    "required": attr.get("required", False),
-                    "searchable": attr.get("searchable", False)
-                }
-                entity_info["attributes"].append(attr_info)
-            return entity_info
-    return {}
-
-def get_change_request_type_definition_util(change_request_type: str, change_request_types: list) -> dict:
-    for cr_type in change_request_types:
-        if cr_type.get("uri", "") == change_request_type:
-            change_request_info = {
-                "uri": cr_type.get("uri", "")
-            }
-            return change_request_info
-    return {}
-
-def get_relation_type_definition_util(relation_type: str, relation_types: list) -> dict:
-    for r_type in relation_types:
-        if r_type.get("uri", "") == relation_type:
-            relation_info = {
-                "uri": r_type.get("uri", ""),
-                "label": r_type.get("label", ""),
-                "description": r_type.get("description", ""),
-                "startObject": r_type.get("startObject", {}).get("objectTypeURI", ""),
-                "endObject": r_type.get("endObject", {}).get("objectTypeURI", ""),
-                "attributes": []
-            }
-            attributes = r_type.get("attributes", [])
-            for attr in attributes:
-                attr_info = {
-                    "label": attr.get("label", ""),
-                    "name": attr.get("name", ""),
-                    "description": attr.get("description", ""),
-                    "type": attr.get("type", ""),
-                    "required": attr.get("required", False),
-                    "searchable": attr.get("searchable", False)
-                }
-                relation_info["attributes"].append(attr_info)
-            return relation_info
-    return {}
-
-def get_interaction_type_definition_util(interaction_type: str, interaction_types: list) -> dict:
-    for i_type in interaction_types:
-        if i_type.get("uri", "") == interaction_type:
-            interaction_info = {
-                "uri": i_type.get("uri", ""),
-                "label": i_type.get("label", ""),
-                "memberTypes": [],
-                "attributes": []
-            }
-            member_types = i_type.get("memberTypes", [])
-            for member_type in member_types:
-                member_info = {
-                    "name": member_type.get("name", "")
-                }
-                interaction_info["memberTypes"].append(member_info)
-            attributes = i_type.get("attributes", [])
-            for attr in attributes:
-                attr_info = {
-                    "label": attr.get("label", ""),
-                    "name": attr.get("name", ""),
-                    "type": attr.get("type", "")
-                }
-                interaction_info["attributes"].append(attr_info)
-            return interaction_info
-    return {}
-
-def get_graph_type_definition_util(graph_type: str, graph_types: list) -> dict:
-    for g_type in graph_types:
-        if g_type.get("uri", "") == graph_type:
-            graph_info = {
-                "uri": g_type.get("uri", ""),
-                "label": g_type.get("label", ""),
-                "relationshipTypeURIs": g_type.get("relationshipTypeURIs", [])
-            }
-            return graph_info
-    return {}
-
-def get_grouping_type_definition_util(grouping_type: str, grouping_types: list) -> dict:
-    for g_type in grouping_types:
-        if g_type.get("uri", "") == grouping_type:
-            grouping_info = {
-                "uri": g_type.get("uri", ""),
-                "description": g_type.get("description", ""),
-                "source": g_type.get("source", "")
-            }
-            return grouping_info
-    return {}
+def get_entity_type_definition_util(entity_type: str, entity_types: TypeDefinitions) -> dict:
+    e_type = _find_type(entity_type, entity_types)
+    if e_type is None:
+        return {}
+    entity_info = _project(e_type, _DESCRIBED_FIELDS)
+    entity_info["attributes"] = list(map(_project_attribute, e_type.get("attributes", [])))
+    return entity_info
+
+def get_change_request_type_definition_util(change_request_type: str, change_request_types: TypeDefinitions) -> dict:
+    cr_type = _find_type(change_request_type, change_request_types)
+    if cr_type is None:
+        return {}
+    return _project(cr_type, _URI_FIELDS)
+
+def get_relation_type_definition_util(relation_type: str, relation_types: TypeDefinitions) -> dict:
+    r_type = _find_type(relation_type, relation_types)
+    if r_type is None:
+        return {}
+    relation_info = _project(r_type, _DESCRIBED_FIELDS)
+    relation_info["startObject"] = r_type.get("startObject", {}).get("objectTypeURI", "")
+    relation_info["endObject"] = r_type.get("endObject", {}).get("objectTypeURI", "")
+    relation_info["attributes"] = list(map(_project_attribute, r_type.get("attributes", [])))
+    return relation_info
+
+def get_interaction_type_definition_util(interaction_type: str, interaction_types: TypeDefinitions) -> dict:
+    i_type = _find_type(interaction_type, interaction_types)
+    if i_type is None:
+        return {}
+    interaction_info = _project(i_type, _LABELED_FIELDS)
+    interaction_info["memberTypes"] = [_project(member_type, _MEMBER_TYPE_FIELDS) for member_type in i_type.get("memberTypes", [])]
+    interaction_info["attributes"] = [_project(attr, _INTERACTION_ATTRIBUTE_FIELDS) for attr in i_type.get("attributes", [])]
+    return interaction_info
+
+def get_graph_type_definition_util(graph_type: str, graph_types: TypeDefinitions) -> dict:
+    g_type = _find_type(graph_type, graph_types)
+    if g_type is None:
+        return {}
+    return _project_graph_type(g_type)
+
+def get_grouping_type_definition_util(grouping_type: str, grouping_types: TypeDefinitions) -> dict:
+    g_type = _find_type(grouping_type, grouping_types)
+    if g_type is None:
+        return {}
+    return _project(g_type, _GROUPING_FIELDS)
 
 async def get_entity_type_definition(entity_type: str, tenant_id: str = RELTIO_TENANT) -> dict:
     try:
-        url = get_reltio_url("configuration/_noInheritance", "api", tenant_id)
-        try:
-            headers = get_reltio_headers()
-            validate_connection_security(url, headers)
-        except Exception as e:
-            logger.error(f"Authentication or security error: {str(e)}")
-            return create_error_response(
-                "AUTHENTICATION_ERROR",
-                "Failed to authenticate with Reltio API"
-            )
-        try:
-            business_config = http_request(url, headers=headers)
-        except Exception as e:
-            logger.error(f"API request error: {str(e)}")
-            return create_error_response(
-                "API_REQUEST_ERROR",
-                f"Failed to retrieve business configuration: {str(e)}"
-            )
-        response = get_entity_type_definition_util(entity_type, business_config.get("entityTypes", []))
+        business_config, error = await _get_business_config(tenant_id)
+        if error:
+            return error
+        rendered = _render_from_config(
+            tenant_id, business_config, ("entityTypes", entity_type),
+            lambda: get_entity_type_definition_util(entity_type, _get_type_index(tenant_id, business_config)["entityTypes"])
+        )
         try:
             await ActivityLog.execute_and_log_activity(
                 tenant_id=tenant_id,
@@ -417,7 +409,7 @@ async def get_entity_type_definition(entity_type: str, tenant_id: str = RELTIO_T
             )
         except Exception as log_error:
             logger.error(f"Activity logging failed for get_entity_type_definition: {str(log_error)}")
-        return yaml.dump(response,sort_keys=False)
+        return rendered
     except Exception as e:
         logger.error(f"Error in get_entity_type_definition: {str(e)}")
         return create_error_response(
@@ -427,25 +419,13 @@ async def get_entity_type_definition(entity_type: str, tenant_id: str = RELTIO_T
 
 async def get_change_request_type_definition(change_request_type: str, tenant_id: str = RELTIO_TENANT) -> dict:
     try:
-        url = get_reltio_url("configuration/_noInheritance", "api", tenant_id)
-        try:
-            headers = get_reltio_headers()
-            validate_connection_security(url, headers)
-        except Exception as e:
-            logger.error(f"Authentication or security error: {str(e)}")
-            return create_error_response(
-                "AUTHENTICATION_ERROR",
-                "Failed to authenticate with Reltio API"
-            )
-        try:
-            business_config = http_request(url, headers=headers)
-        except Exception as e:
-            logger.error(f"API request error: {str(e)}")
-            return create_error_response(
-                "API_REQUEST_ERROR",
-                f"Failed to retrieve business configuration: {str(e)}"
-            )
-        response = get_change_request_type_definition_util(change_request_type, business_config.get("changeRequestTypes", []))
+        business_config, error = await _get_business_config(tenant_id)
+        if error:
+            return error
+        rendered = _render_from_config(
+            tenant_id, business_config, ("changeRequestTypes", change_request_type),
+            lambda: get_change_request_type_definition_util(change_request_type, _get_type_index(tenant_id, business_config)["changeRequestTypes"])
+        )
         try:
             await ActivityLog.execute_and_log_activity(
                 tenant_id=tenant_id,
@@ -455,7 +435,7 @@ async def get_change_request_type_definition(change_request_type: str, tenant_id
             )
         except Exception as log_error:
             logger.error(f"Activity logging failed for get_change_request_type_definition: {str(log_error)}")
-        return yaml.dump(response,sort_keys=False)
+        return rendered
     except Exception as e:
         logger.error(f"Error in get_change_request_type_definition: {str(e)}")
         return create_error_response(
@@ -465,25 +445,13 @@ async def get_change_request_type_definition(change_request_type: str, tenant_id
 
 async def get_relation_type_definition(relation_type: str, tenant_id: str = RELTIO_TENANT) -> dict:
     try:
-        url = get_reltio_url("configuration/_noInheritance", "api", tenant_id)
-        try:
-            headers = get_reltio_headers()
-            validate_connection_security(url, headers)
-        except Exception as e:
-            logger.error(f"Authentication or security error: {str(e)}")
-            return create_error_response(
-                "AUTHENTICATION_ERROR",
-                "Failed to authenticate with Reltio API"
-            )
-        try:
-            business_config = http_request(url, headers=headers)
-        except Exception as e:
-            logger.error(f"API request error: {str(e)}")
-            return create_error_response(
-                "API_REQUEST_ERROR",
-                f"Failed to retrieve business configuration: {str(e)}"
-            )
-        response = get_relation_type_definition_util(relation_type, business_config.get("relationTypes", []))
+        business_config, error = await _get_business_config(tenant_id)
+        if error:
+            return error
+        rendered = _render_from_config(
+            tenant_id, business_config, ("relationTypes", relation_type),
+            lambda: get_relation_type_definition_util(relation_type, _get_type_index(tenant_id, business_config)["relationTypes"])
+        )
         try:
             await ActivityLog.execute_and_log_activity(
                 tenant_id=tenant_id,
@@ -493,7 +461,7 @@ async def get_relation_type_definition(relation_type: str, tenant_id: str = RELT
             )
         except Exception as log_error:
             logger.error(f"Activity logging failed for get_relation_type_definition: {str(log_error)}")
-        return yaml.dump(response,sort_keys=False)
+        return rendered
     except Exception as e:
         logger.error(f"Error in get_relation_type_definition: {str(e)}")
         return create_error_response(
@@ -503,25 +471,13 @@ async def get_relation_type_definition(relation_type: str, tenant_id: str = RELT
 
 async def get_interaction_type_definition(interaction_type: str, tenant_id: str = RELTIO_TENANT) -> dict:
     try:
-        url = get_reltio_url("configuration/_noInheritance", "api", tenant_id)
-        try:
-            headers = get_reltio_headers()
-            validate_connection_security(url, headers)
-        except Exception as e:
-            logger.error(f"Authentication or security error: {str(e)}")
-            return create_error_response(
-                "AUTHENTICATION_ERROR",
-                "Failed to authenticate with Reltio API"
-            )
-        try:
-            business_config = http_request(url, headers=headers)
-        except Exception as e:
-            logger.error(f"API request error: {str(e)}")
-            return create_error_response(
-                "API_REQUEST_ERROR",
-                f"Failed to retrieve business configuration: {str(e)}"
-            )
-        response = get_interaction_type_definition_util(interaction_type, business_config.get("interactionTypes", []))
+        business_config, error = await _get_business_config(tenant_id)
+        if error:
+            return error
+        rendered = _render_from_config(
+            tenant_id, business_config, ("interactionTypes", interaction_type),
+            lambda: get_interaction_type_definition_util(interaction_type, _get_type_index(tenant_id, business_config)["interactionTypes"])
+        )
         try:
             await ActivityLog.execute_and_log_activity(
                 tenant_id=tenant_id,
@@ -531,7 +487,7 @@ async def get_interaction_type_definition(interaction_type: str, tenant_id: str
             )
         except Exception as log_error:
             logger.error(f"Activity logging failed for get_interaction_type_definition: {str(log_error)}")
-        return yaml.dump(response,sort_keys=False)
+        return rendered
     except Exception as e:
         logger.error(f"Error in get_interaction_type_definition: {str(e)}")
         return create_error_response(
@@ -541,25 +497,13 @@ async def get_interaction_type_definition(interaction_type: str, tenant_id: str
 
 async def get_graph_type_definition(graph_type: str, tenant_id: str = RELTIO_TENANT) -> dict:
     try:
-        url = get_reltio_url("configuration/_noInheritance", "api", tenant_id)
-        try:
-            headers = get_reltio_headers()
-            validate_connection_security(url, headers)
-        except Exception as e:
-            logger.error(f"Authentication or security error: {str(e)}")
-            return create_error_response(
-                "AUTHENTICATION_ERROR",
-                "Failed to authenticate with Reltio API"
-            )
-        try:
-            business_config = http_request(url, headers=headers)
-        except Exception as e:
-            logger.error(f"API request error: {str(e)}")
-            return create_error_response(
-                "API_REQUEST_ERROR",
-                f"Failed to retrieve business configuration: {str(e)}"
-            )
-        response = get_graph_type_definition_util(graph_type, business_config.get("graphTypes", []))
+        business_config, error = await _get_business_config(tenant_id)
+        if error:
+            return error
+        rendered = _render_from_config(
+            tenant_id, business_config, ("graphTypes", graph_type),
+            lambda: get_graph_type_definition_util(graph_type, _get_type_index(tenant_id, business_config)["graphTypes"])
+        )
         try:
             await ActivityLog.execute_and_log_activity(
                 tenant_id=tenant_id,
@@ -569,7 +513,7 @@ async def get_graph_type_definition(graph_type: str, tenant_id: str = RELTIO_TEN
             )
         except Exception as log_error:
             logger.error(f"Activity logging failed for get_graph_type_definition: {str(log_error)}")
-        return yaml.dump(response,sort_keys=False)
+        return rendered
     except Exception as e:
         logger.error(f"Error in get_graph_type_definition: {str(e)}")
         return create_error_response(
@@ -579,25 +523,13 @@ async def get_graph_type_definition(graph_type: str, tenant_id: str = RELTIO_TEN
 
 async def get_grouping_type_definition(grouping_type: str, tenant_id: str = RELTIO_TENANT) -> dict:
     try:
-        url = get_reltio_url("configuration/_noInheritance", "api", tenant_id)
-        try:
-            headers = get_reltio_headers()
-            validate_connection_security(url, headers)
-        except Exception as e:
-            logger.error(f"Authentication or security error: {str(e)}")
-            return create_error_response(
-                "AUTHENTICATION_ERROR",
-                "Failed to authenticate with Reltio API"
-            )
-        try:
-            business_config = http_request(url, headers=headers)
-        except Exception as e:
-            logger.error(f"API request error: {str(e)}")
-            return create_error_response(
-                "API_REQUEST_ERROR",
-                f"Failed to retrieve business configuration: {str(e)}"
-            )
-        response = get_grouping_type_definition_util(grouping_type, business_config.get("groupingTypes", []))
+        business_config, error = await _get_business_config(tenant_id)
+        if error:
+            return error
+        rendered = _render_from_config(
+            tenant_id, business_config, ("groupingTypes", grouping_type),
+            lambda: get_grouping_type_definition_util(grouping_type, _get_type_index(tenant_id, business_config)["groupingTypes"])
+        )
         try:
             await ActivityLog.execute_and_log_activity(
                 tenant_id=tenant_id,
@@ -607,10 +539,64 @@ async def get_grouping_type_definition(grouping_type: str, tenant_id: str = RELT
             )
         except Exception as log_error:
             logger.error(f"Activity logging failed for get_grouping_type_definition: {str(log_error)}")
-        return yaml.dump(response,sort_keys=False)
+        return rendered
     except Exception as e:
         logger.error(f"Error in get_grouping_type_definition: {str(e)}")
         return create_error_response(
             "INTERNAL_SERVER_ERROR",
             f"An error occurred while retrieving grouping type definition: {str(e)}"
         )
+
+# Definition helper for each kind of type, keyed by the kind segment of a type URI
+_TYPE_DEFINITION_UTILS = {
+    "entityTypes": get_entity_type_definition_util,
+    "changeRequestTypes": get_change_request_type_definition_util,
+    "relationTypes": get_relation_type_definition_util,
+    "interactionTypes": get_interaction_type_definition_util,
+    "graphTypes": get_graph_type_definition_util,
+    "groupingTypes": get_grouping_type_definition_util,
+}
+
+def _resolve_type_definitions(type_index: Dict[str, Dict[str, dict]], type_uris: List[str]) -> dict:
+    """Look up each type URI in the index of the kind named by its second segment"""
+    response = {}
+    for type_uri in type_uris:
+        uri_parts = type_uri.split("/")
+        kind = uri_parts[1] if len(uri_parts) > 2 else ""
+        definition_util = _TYPE_DEFINITION_UTILS.get(kind)
+        response[type_uri] = definition_util(type_uri, type_index[kind]) if definition_util else {}
+    return response
+
+async def get_type_definitions(type_uris: List[str], tenant_id: str = RELTIO_TENANT) -> dict:
+    """Get the definitions of several types at once from the business configuration of a specific tenant
+    Args:
+        type_uris (List[str]): Type URIs such as "configuration/entityTypes/Individual" or "configuration/relationTypes/HasAddress".
+        tenant_id (str): Tenant ID for the Reltio environment. Defaults to RELTIO_TENANT env value.
+    
+    Returns:
+        The definition of each type keyed by its URI; unknown types map to an empty definition
+    """
+    try:
+        business_config, error = await _get_business_config(tenant_id)
+        if error:
+            return error
+        rendered = _render_from_config(
+            tenant_id, business_config, ("type_definitions", tuple(type_uris)),
+            lambda: _resolve_type_definitions(_get_type_index(tenant_id, business_config), type_uris)
+        )
+        try:
+            await ActivityLog.execute_and_log_activity(
+                tenant_id=tenant_id,
+                label=ActivityLogLabel.TYPE_DEFINITIONS.value,
+                client_type=ACTIVITY_CLIENT,
+                description=f"get_type_definitions_tool : MCP server successfully fetched {len(type_uris)} type definitions for tenant {tenant_id}"
+            )
+        except Exception as log_error:
+            logger.error(f"Activity logging failed for get_type_definitions: {str(log_error)}")
+        return rendered
+    except Exception as e:
+        logger.error(f"Error in get_type_definitions: {str(e)}")
+        return create_error_response(
+            "INTERNAL_SERVER_ERROR",
+            f"An error occurred while retrieving type definitions: {str(e)}"
+        )
@@ -4,7 +4,7 @@ import time
 from src.constants import ACTIVITY_CLIENT
 from src.env import RELTIO_TENANT, RELTIO_AUTH_SERVER
 from src.util.api import (
-    http_request, 
+    http_request_async, 
     create_error_response, 
     validate_connection_security,
     get_reltio_url
@@ -47,7 +47,7 @@ async def get_users_summary(tenant_id: str = RELTIO_TENANT) -> dict:
             )
         
         try:
-            users_data = http_request(url, headers=headers)
+            users_data = await http_request_async(url, headers=headers)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             return create_error_response(
@@ -194,7 +194,7 @@ async def get_user_details(username: str, tenant_id: str = RELTIO_TENANT) -> dic
             )
         
         try:
-            users_data = http_request(url, headers=headers)
+            users_data = await http_request_async(url, headers=headers)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             return create_error_response(
@@ -257,7 +257,7 @@ async def get_users_by_role_and_tenant(role: str, tenant_id: str = RELTIO_TENANT
             )
         
         try:
-            users_data = http_request(url, headers=headers)
+            users_data = await http_request_async(url, headers=headers)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             return create_error_response(
@@ -323,7 +323,7 @@ async def get_users_by_group(group: str, tenant_id: str = RELTIO_TENANT) -> dict
             )
         
         try:
-            users_data = http_request(url, headers=headers)
+            users_data = await http_request_async(url, headers=headers)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             return create_error_response(
@@ -433,7 +433,7 @@ async def check_user_activity(username: str, days_back: int = 7, tenant_id: str
             )
         
         try:
-            activities_response = http_request(base_url, params=params, headers=headers)
+            activities_response = await http_request_async(base_url, params=params, headers=headers)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             return create_error_response(
@@ -1,12 +1,32 @@
 import logging
 from typing import List, Dict, Any, Optional
 import enum
+import json
+import yaml
 
 from src.constants import RELEVANCE_SCORE_NOT_AVAILABLE
+from src.env import RELTIO_TOOL_FORMAT
 
 # Configure logging
 logger = logging.getLogger("mcp.server.reltio")
+
+# LibYAML-backed dumper when PyYAML was built with it, pure-Python safe dumper otherwise
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+def dump_tool_response(data: Any) -> str:
+    """Render a tool response as text in the format selected by RELTIO_TOOL_FORMAT
+    
+    YAML is the default; compact JSON is much cheaper to produce for large responses
+    and is equally readable by MCP clients.
+    """
+    if RELTIO_TOOL_FORMAT == "json":
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return yaml.dump(data, Dumper=YAML_DUMPER, sort_keys=False)
    
+def escape_filter_value(value: str) -> str:
+    """Escape backslashes and single quotes so a value can be embedded in a quoted Reltio filter literal"""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
 def simplify_reltio_attributes(attributes_dict, preserve_metadata=False):
     """
     Simplifies a Reltio-style attributes dictionary by extracting 'value' fields,
@@ -21,25 +41,48 @@ def simplify_reltio_attributes(attributes_dict, preserve_metadata=False):
         # Return full attribute details without simplification
         return attributes_dict
     
-    # Original simplification logic
+    # Nested attribute values are walked with an explicit stack rather than recursion; each nested
+    # result dict is placed in its parent first and filled in when it is popped
     result = {}
-    for key, value_list in attributes_dict.items():
-        if isinstance(value_list, list) and value_list:
+    stack = [(result, attributes_dict)]
+    while stack:
+        target, attributes = stack.pop()
+        for key, value_list in attributes.items():
+            if not (isinstance(value_list, list) and value_list):
+                continue
+            if len(value_list) == 1:
+                # Most attributes hold a single value, which is stored directly without a list
+                try:
+                    value = value_list[0]['value']
+                except (TypeError, KeyError):
+                    continue
+                if isinstance(value, dict):
+                    nested = {}
+                    stack.append((nested, value))
+                    value = nested
+                target[key] = value
+                continue
             simplified_list = []
             for item in value_list:
-                if isinstance(item, dict) and 'value' in item:
-                    if isinstance(item['value'], dict):
-                        simplified_list.append(simplify_reltio_attributes(item['value'], preserve_metadata))
-                    else:
-                        simplified_list.append(item['value'])
+                # Well-formed items are dicts with a 'value'; anything else is skipped
+                try:
+                    value = item['value']
+                except (TypeError, KeyError):
+                    continue
+                if isinstance(value, dict):
+                    nested = {}
+                    stack.append((nested, value))
+                    simplified_list.append(nested)
+                else:
+                    simplified_list.append(value)
             
             if not simplified_list:
                 continue
 
             if len(simplified_list) == 1:
-                result[key] = simplified_list[0]
+                target[key] = simplified_list[0]
             else:
-                result[key] = simplified_list
+                target[key] = simplified_list
     return result
 
 def slim_crosswalks(cws: List[Dict[str, Any]], preserve_details=False) -> List[Dict[str, Any]]:
@@ -89,7 +132,7 @@ def format_entity_matches(matches: List[Dict[str, Any]]) -> Dict[str, Any]:
         "matchRules":d["matchRules"],
         "createdTime":d["createdTime"],
         "relevance":d.get("relevance",RELEVANCE_SCORE_NOT_AVAILABLE),
-        "label":d.get("label",None)} for d in matches}
+        "label":d.get("label")} for d in matches}
 
 def format_unified_entity_matches(matches: List[Dict[str, Any]], match_entities: Dict[str, Dict[str, Any]] = None) -> Dict[str, Any]:
     """
@@ -200,6 +243,7 @@ class ActivityLogLabel(enum.Enum):
     INTERACTION_TYPE_DEFINITION="INTERACTION_TYPE_DEFINITION"
     GRAPH_TYPE_DEFINITION="GRAPH_TYPE_DEFINITION"
     GROUPING_TYPE_DEFINITION="GROUPING_TYPE_DEFINITION"
+    TYPE_DEFINITIONS="TYPE_DEFINITIONS"
     TENANT_PERMISSIONS_METADATA="TENANT_PERMISSIONS_METADATA"
     GET_MERGE_ACTIVITIES="GET_MERGE_ACTIVITIES"
     USER_SUMMARY="USER_SUMMARY"
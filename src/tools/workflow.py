@@ -1,3 +1,5 @@
+import asyncio
+import functools
 import logging
 from typing import List, Dict, Any, Optional
 import yaml
@@ -7,9 +9,10 @@ from src.env import RELTIO_TENANT, RELTIO_ENVIRONMENT
 from src.util.api import (
     create_error_response, 
     validate_connection_security,
-    http_request
+    http_request_async
 )
 from src.util.auth import get_reltio_headers
+from src.util.session import http_session, get_http_executor
 from src.util.activity_log import ActivityLog
 from src.util.models import GetPossibleAssigneesRequest, RetrieveTasksRequest, GetTaskDetailsRequest, StartProcessInstanceRequest, ExecuteTaskActionRequest
 from src.tools.util import ActivityLogLabel
@@ -26,7 +29,7 @@ def get_workflow_url(endpoint: str, tenant_id: str) -> str:
 def http_request_workflow(url: str, method: str = 'POST', data=None, headers=None, params=None) -> dict:
     """Make an HTTP request to workflow API and return the JSON response"""
     try:
-        response = requests.request(
+        response = http_session.request(
             method=method,
             url=url,
             json=data,
@@ -43,6 +46,13 @@ def http_request_workflow(url: str, method: str = 'POST', data=None, headers=Non
         raise ValueError(f"Workflow API request failed: {str(e)}")
 
 
+async def _run_workflow_request(url: str, **kwargs) -> dict:
+    """Run http_request_workflow on the dedicated HTTP executor without blocking the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(
+        get_http_executor(), functools.partial(http_request_workflow, url, **kwargs)
+    )
+
+
 async def get_user_workflow_tasks(assignee: str, tenant_id: str = RELTIO_TENANT, offset: int = 0, 
                                   max_results: int = 10) -> dict:
     """Get workflow tasks for a specific user with total count and detailed task information
@@ -85,7 +95,7 @@ async def get_user_workflow_tasks(assignee: str, tenant_id: str = RELTIO_TENANT,
         }
         
         try:
-            workflow_response = http_request_workflow(url, method='POST', data=request_body, headers=headers)
+            workflow_response = await _run_workflow_request(url, method='POST', data=request_body, headers=headers)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             return create_error_response(
@@ -179,7 +189,7 @@ async def reassign_workflow_task(task_id: str, assignee: str, tenant_id: str = R
         }]
         
         try:
-            reassign_response = http_request_workflow(url, method='PUT', data=request_body, headers=headers)
+            reassign_response = await _run_workflow_request(url, method='PUT', data=request_body, headers=headers)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             return create_error_response(
@@ -279,7 +289,7 @@ async def get_possible_assignees(tenant_id: str = RELTIO_TENANT, tasks: Optional
                 request_body["exclude"] = request.exclude
         
         try:
-            assignees_response = http_request_workflow(url, method='POST', data=request_body, headers=headers)
+            assignees_response = await _run_workflow_request(url, method='POST', data=request_body, headers=headers)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             return create_error_response(
@@ -439,7 +449,7 @@ async def retrieve_tasks(
             request_body["max"] = min(request_body["max"], 100)
         
         try:
-            workflow_response = http_request_workflow(url, method='POST', data=request_body, headers=headers, params=params)
+            workflow_response = await _run_workflow_request(url, method='POST', data=request_body, headers=headers, params=params)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             return create_error_response(
@@ -574,7 +584,7 @@ async def get_task_details(
             params["showTaskLocalVariables"] = "true"
         
         try:
-            workflow_response = http_request_workflow(url, method='GET', headers=headers, params=params)
+            workflow_response = await _run_workflow_request(url, method='GET', headers=headers, params=params)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             return create_error_response(
@@ -701,7 +711,7 @@ async def start_process_instance(
             request_body["variables"] = request.variables
         
         try:
-            process_response = http_request(url, method='POST', data=request_body, headers=headers)
+            process_response = await http_request_async(url, method='POST', data=request_body, headers=headers)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             
@@ -819,7 +829,7 @@ async def execute_task_action(
             request_body["processInstanceComment"] = request.process_instance_comment
         
         try:
-            action_response = http_request(url, method='POST', data=request_body, headers=headers)
+            action_response = await http_request_async(url, method='POST', data=request_body, headers=headers)
         except Exception as e:
             logger.error(f"API request error: {str(e)}")
             
@@ -1,18 +1,25 @@
-import uuid
-from typing import Dict, Any
+import asyncio
+import os
+from typing import Dict, Any, Optional
 import logging
-from src.constants import ACTIVITY_LOG_LABEL
-from src.util.api import get_reltio_url, get_reltio_headers, http_request, validate_connection_security, create_error_response
+from src.constants import ACTIVITY_LOG_LABEL, ACTIVITY_LOG_BATCH_SIZE, ACTIVITY_LOG_FLUSH_INTERVAL
+from src.util.api import get_reltio_url, get_reltio_headers, http_request_async, validate_connection_security, create_error_response
 
 # Configure logging
 logger = logging.getLogger("mcp.server.reltio")
 
 class ActivityLog:
+    # Pending activity records drained by a background flusher so tools do not wait on the write
+    _queue: Optional[asyncio.Queue] = None
+    _flusher_task: Optional[asyncio.Task] = None
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+
     @staticmethod
     def generate_activity_id() -> str:
         """Generate a unique activity ID in the format d7f7-22cd-a022424f"""
-        uuid_hex = uuid.uuid4().hex
-        return f"{uuid_hex[:4]}-{uuid_hex[4:8]}-{uuid_hex[8:16]}"
+        # Only 16 hex digits are used, so draw 8 random bytes rather than building a full UUID
+        id_hex = os.urandom(8).hex()
+        return f"{id_hex[:4]}-{id_hex[4:8]}-{id_hex[8:16]}"
 
     @staticmethod
     def create_request_body(
@@ -70,7 +77,7 @@ class ActivityLog:
                 )
             
             # Make the API call
-            response = http_request(
+            response = await http_request_async(
                 method="POST",
                 url=url,
                 data=request_body,
@@ -83,6 +90,57 @@ class ActivityLog:
             logger.error(f"Error logging activity: {str(e)}")
             raise Exception(f"Failed to log activity: {str(e)}")
 
+    @staticmethod
+    def _ensure_flusher() -> asyncio.Queue:
+        """Create the queue and start the flusher for the running event loop if needed"""
+        loop = asyncio.get_running_loop()
+        if ActivityLog._loop is not loop or ActivityLog._flusher_task is None or ActivityLog._flusher_task.done():
+            if ActivityLog._loop is not loop:
+                ActivityLog._queue = asyncio.Queue()
+                ActivityLog._loop = loop
+            ActivityLog._flusher_task = loop.create_task(ActivityLog._flusher())
+        return ActivityLog._queue
+
+    @staticmethod
+    async def _flusher():
+        """Drain queued activities, writing up to ACTIVITY_LOG_BATCH_SIZE of them concurrently"""
+        queue = ActivityLog._queue
+        while True:
+            batch = [await queue.get()]
+            deadline = asyncio.get_running_loop().time() + ACTIVITY_LOG_FLUSH_INTERVAL
+            while len(batch) < ACTIVITY_LOG_BATCH_SIZE:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            results = await asyncio.gather(
+                *[ActivityLog.log_activity(*record) for record in batch],
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error in activity log flusher: {str(result)}")
+            for _ in batch:
+                queue.task_done()
+
+    @staticmethod
+    async def flush():
+        """Wait until every queued activity has been written, then stop the flusher"""
+        if ActivityLog._loop is not asyncio.get_running_loop():
+            return
+        task = ActivityLog._flusher_task
+        if task is not None and not task.done():
+            await ActivityLog._queue.join()
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        ActivityLog._flusher_task = None
+
     @staticmethod
     async def execute_and_log_activity(
         tenant_id: str,
@@ -92,20 +150,20 @@ class ActivityLog:
         items:list[dict]=None
     ) -> Any:
         """
-        Log an activity
+        Queue an activity to be logged by the background flusher
         
         Args:
             tenant_id (str): The tenant ID for the Reltio environment
             description (str): Description for the activity
             
         Raises:
-            Exception: If there's an error during activity logging
+            Exception: If the activity cannot be queued
         """
         try:
             # Create request body
             request_body = ActivityLog.create_request_body(label,description,items)
-            # Log the activity
-            await ActivityLog.log_activity(tenant_id, request_body,client_type)
+            # Queue the activity; the flusher writes it off the request path
+            ActivityLog._ensure_flusher().put_nowait((tenant_id, request_body, client_type))
             
         except Exception as e:
             logger.error(f"Error in execute_and_log_activity: {str(e)}")
@@ -1,22 +1,60 @@
 import asyncio
+import functools
+import json
 import logging
 from typing import Optional, Dict, Any, Union
+from urllib.parse import urlparse
 
+import httpx
 import requests
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder is used without it
+    orjson = None
 from requests.exceptions import HTTPError
 
-from src.constants import ERROR_CODES, REQUIRE_TLS, ALLOWED_ORIGINS, DEFAULT_TIMEOUT
+from src.constants import ERROR_CODES, REQUIRE_TLS, ALLOWED_ORIGINS, DEFAULT_TIMEOUT, MAX_CONCURRENT_REQUESTS, KEEPALIVE_EXPIRY
 from src.env import RELTIO_ENVIRONMENT
 from src.util.auth import get_reltio_headers
-from src.util.exceptions import SecurityError, TimeoutError
+from src.util.exceptions import ReltioHTTPError, SecurityError, TimeoutError
+from src.util.session import http_session
 
 # Configure logging
 logger = logging.getLogger("mcp.server.reltio")
 
+# Errors raised by http_request/http_request_async for a failed call: transport errors, non-success
+# responses and undecodable bodies (orjson's decode error subclasses json.JSONDecodeError)
+HTTP_REQUEST_ERRORS = (httpx.HTTPError, requests.RequestException, ReltioHTTPError, json.JSONDecodeError)
+
+# Origin allow-list as a set for constant-time membership checks
+_ALLOWED_ORIGINS = frozenset(ALLOWED_ORIGINS)
+
+# Detail keys that are safe to echo back to the client in an error response
+_SAFE_DETAIL_KEYS = frozenset(("field", "resource", "error_type"))
+
+# Shared async client so connections (and their TLS sessions) are reused across tool calls
+_async_client: Optional[httpx.AsyncClient] = None
+# Caps in-flight requests at the pool size so callers wait here rather than inside httpx
+_request_semaphore: Optional[asyncio.Semaphore] = None
+
+def _dump_json(data: Any) -> bytes:
+    """Encode a request body as compact UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _load_json(content: bytes) -> Any:
+    """Decode a JSON response body"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+@functools.lru_cache(maxsize=256)
 def get_reltio_url(path: str, partial_path: str, tenant: str):
     """Build a Reltio API URL"""
     return f"https://{RELTIO_ENVIRONMENT}.reltio.com/reltio/{partial_path}/{tenant}/{path}"
 
+@functools.lru_cache(maxsize=256)
 def get_reltio_export_job_url(path: str, tenant: str):
     """Build a Reltio Export Job API URL"""
     return f"https://{RELTIO_ENVIRONMENT}.reltio.com/jobs/export/{tenant}/{path}"
@@ -29,43 +67,105 @@ def http_request(url: str,
                  retry_on_401: bool = True
                  ) -> Any:
     """Make an HTTP request and return the JSON response"""
+    body = None
+    if data is not None:
+        body = _dump_json(data)
+        if not headers or 'Content-Type' not in headers:
+            headers = {**(headers or {}), 'Content-Type': 'application/json'}
     try:
-        response = requests.request(
+        response = http_session.request(
             method=method,
             url=url,
             params=params,
-            json=data,
+            data=body,
             headers=headers,
             timeout=DEFAULT_TIMEOUT
         )
         response.raise_for_status()
-        return response.json()
+        return _load_json(response.content)
     
     except HTTPError as e:
         error_message = e.response.text
         if e.response.status_code == 401 and retry_on_401 and "invalid_token" in error_message:
             if headers and 'Authorization' in headers:
-                headers = get_reltio_headers()
+                headers = get_reltio_headers(force_refresh=True)
                 return http_request(url, method, params, data, headers, retry_on_401=False)
-        raise ValueError(f"API request failed: {e.response.status_code} - {error_message}")
+        raise ReltioHTTPError(e.response.status_code, error_message)
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared pooled async HTTP client, creating it on first use"""
+    global _async_client, _request_semaphore
+    if _async_client is None or _async_client.is_closed:
+        _async_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONCURRENT_REQUESTS,
+                max_keepalive_connections=20,
+                keepalive_expiry=KEEPALIVE_EXPIRY
+            ),
+            timeout=DEFAULT_TIMEOUT
+        )
+        _request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    return _async_client
+
+async def close_async_client():
+    """Close the shared async HTTP client and release its pooled connections"""
+    global _async_client
+    if _async_client is not None:
+        client, _async_client = _async_client, None
+        await client.aclose()
+
+async def http_request_async(url: str,
+                             method: str = 'GET',
+                             params: Optional[Dict[str, Union[str, int, float]]] = None,
+                             data: Optional[Any] = None,
+                             headers: Optional[Dict[str, str]] = None,
+                             retry_on_401: bool = True
+                             ) -> Any:
+    """Make an HTTP request on the shared async client and return the JSON response"""
+    client = get_async_client()
+    content = None
+    if data is not None:
+        content = _dump_json(data)
+        if not headers or 'Content-Type' not in headers:
+            headers = {**(headers or {}), 'Content-Type': 'application/json'}
+    # The permit is released before any 401 retry so a retry never waits on its own caller
+    async with _request_semaphore:
+        response = await client.request(
+            method=method,
+            url=url,
+            params=params,
+            content=content,
+            headers=headers
+        )
+    try:
+        response.raise_for_status()
+        return _load_json(response.content)
+
+    except httpx.HTTPStatusError as e:
+        error_message = e.response.text
+        if e.response.status_code == 401 and retry_on_401 and "invalid_token" in error_message:
+            if headers and 'Authorization' in headers:
+                headers = get_reltio_headers(force_refresh=True)
+                return await http_request_async(url, method, params, data, headers, retry_on_401=False)
+        raise ReltioHTTPError(e.response.status_code, error_message)
 
 def extract_entity_id(uri: str):
     """Extract entity ID from URI"""
     if not uri:
         return "N/A"
-    return uri.split("/")[-1]
+    return uri.rsplit("/", 1)[-1]
 
 def extract_change_request_id(uri: str):
     """Extract change request ID from URI"""
     if not uri:
         return None
-    return uri.split("/")[-1]
+    return uri.rsplit("/", 1)[-1]
 
 def extract_relation_id(uri: str):
     """Extract relation ID from URI"""
     if not uri:
         return "N/A"
-    return uri.split("/")[-1]
+    return uri.rsplit("/", 1)[-1]
 
 def extract_name(attributes: dict):
     """Extract name from entity attributes"""
@@ -74,11 +174,14 @@ def extract_name(attributes: dict):
         return name_attr[0].get("value", "N/A")
     return "N/A"
 
-def validate_connection_security(url: str, headers: Optional[Dict[str, str]] = None):
-    from urllib.parse import urlparse
-    parsed_url = urlparse(url)
+@functools.lru_cache(maxsize=256)
+def _url_scheme(url: str) -> str:
+    """Parse the scheme of a URL; tools reach the same few URLs on every call"""
+    return urlparse(url).scheme
 
-    if REQUIRE_TLS and parsed_url.scheme != "https":
+def validate_connection_security(url: str, headers: Optional[Dict[str, str]] = None):
+    # Reltio URLs are built lowercase, so the prefix check settles nearly every call without parsing
+    if REQUIRE_TLS and not url.startswith("https://") and _url_scheme(url) != "https":
         raise SecurityError(
             "Insecure connection",
             "TLS is required for all connections"
@@ -86,7 +189,7 @@ def validate_connection_security(url: str, headers: Optional[Dict[str, str]] = N
 
     if headers and "Origin" in headers:
         origin = headers["Origin"]
-        if origin not in ALLOWED_ORIGINS:
+        if origin not in _ALLOWED_ORIGINS:
             raise SecurityError(
                 "Invalid origin",
                 f"Origin {origin} is not allowed"
@@ -108,13 +211,9 @@ async def http_request_with_timeout(url: str,
         logger.error(f"Security validation failed: {str(e)}")
         raise
 
-    loop = asyncio.get_running_loop()
     try:
         return await asyncio.wait_for(
-            loop.run_in_executor(
-                None,
-                lambda: http_request(url, method, params, data, headers, retry_on_401)
-            ),
+            http_request_async(url, method, params, data, headers, retry_on_401),
             timeout=timeout
         )
     except asyncio.TimeoutError:
@@ -127,11 +226,7 @@ async def http_request_with_timeout(url: str,
 
 def create_error_response(code_key: str, message: str, details: dict = None):
     code = ERROR_CODES.get(code_key, 500)
-    safe_details = {}
-    if details:
-        for key, value in details.items():
-            if key in ["field", "resource", "error_type"]:
-                safe_details[key] = str(value)
+    safe_details = {key: str(value) for key, value in (details or {}).items() if key in _SAFE_DETAIL_KEYS}
 
     return {
         "error": {
@@ -1,42 +1,61 @@
-import json
+import threading
+import time
 import requests
-import requests
-from src.constants import HEADER_SOURCE_TAG
+from src.constants import DEFAULT_TIMEOUT, HEADER_SOURCE_TAG, TOKEN_DEFAULT_TTL, TOKEN_EXPIRY_MARGIN
 from src.env import RELTIO_CLIENT_BASIC_TOKEN, RELTIO_AUTH_SERVER
+from src.util.session import http_session
 
+# Cached access token shared by all tool calls until shortly before it expires
+_token_cache = {"value": None, "expires_at": 0.0}
+_token_lock = threading.Lock()
 
-from src.env import RELTIO_CLIENT_BASIC_TOKEN, RELTIO_AUTH_SERVER
+# Token endpoint and client credentials are fixed for the life of the process
+_AUTH_URL = f'{RELTIO_AUTH_SERVER}/oauth/token?grant_type=client_credentials'
+_AUTH_HEADERS = {"Authorization": f"Basic {RELTIO_CLIENT_BASIC_TOKEN}"}
+
+def _token_is_valid() -> bool:
+    return _token_cache["value"] is not None and time.monotonic() < _token_cache["expires_at"] - TOKEN_EXPIRY_MARGIN
 
-def get_access_token():
+def get_access_token(force_refresh: bool = False):
     """Get Reltio access token using environment variables
     Args:
         force_refresh: If True, forces a new token to be retrieved regardless of cache
     """
-    # Get token from Reltio
-    auth_url = f'{RELTIO_AUTH_SERVER}/oauth/token?grant_type=client_credentials'
-    
-    headers = {
-        "Authorization": f"Basic {RELTIO_CLIENT_BASIC_TOKEN}"
-    }
-    
+    if not force_refresh and _token_is_valid():
+        return _token_cache["value"]
+
+    with _token_lock:
+        # Another caller may have refreshed the token while we waited for the lock
+        if not force_refresh and _token_is_valid():
+            return _token_cache["value"]
+        access_token, expires_in = _fetch_access_token()
+        _token_cache["value"] = access_token
+        _token_cache["expires_at"] = time.monotonic() + expires_in
+        return access_token
+
+def _fetch_access_token():
+    """Request a new access token from the Reltio auth server"""
     try:
-        response = requests.post(auth_url, headers=headers)
+        response = http_session.post(_AUTH_URL, headers=_AUTH_HEADERS, timeout=DEFAULT_TIMEOUT)
         response.raise_for_status()
         result = response.json()
         access_token = result['access_token']
-        return access_token
+        return access_token, float(result.get('expires_in') or TOKEN_DEFAULT_TTL)
     except requests.exceptions.RequestException as e:
         error_message = str(e)
         if hasattr(e, 'response') and e.response is not None:
             error_message = e.response.text
         raise ValueError(f"Authentication failed: {error_message}")
 
-def get_reltio_headers():
-    """Get headers for Reltio API with auth token (using requests version)"""
-    token = get_access_token()
+def get_reltio_headers(force_refresh: bool = False, content_type: str = 'application/json'):
+    """Get headers for Reltio API with auth token (using requests version)
+    
+    A new dict is built on every call, so callers may add request-specific headers to it.
+    """
+    token = get_access_token(force_refresh)
     return {
         'Authorization': f'Bearer {token}',
-        'Content-Type': 'application/json',
+        'Content-Type': content_type,
         'Accept': 'application/json',
         'Source': HEADER_SOURCE_TAG
     }
@@ -0,0 +1,34 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class RequestCoalescer:
+    """Share a single in-flight call between concurrent callers that ask for the same key"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Await call() for key, or join the identical call that is already running
+        
+        Args:
+            key: Hashable description of the request; callers with equal keys share one result
+            call: Zero-argument coroutine function that performs the request
+        
+        Returns:
+            The result of the shared call; its exception is raised to every waiting caller
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        # Shield so one caller being cancelled does not cancel the request for the others
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved even if every waiting caller was cancelled
+            future.exception()
@@ -0,0 +1,105 @@
+import json
+import os
+import re
+import tempfile
+import time
+from typing import Any, Dict, Hashable, Optional
+
+# Per-tenant counters bumped by write tools; mixing them into cache keys drops stale reads after a write
+_tenant_generations: Dict[str, int] = {}
+
+
+def tenant_generation(tenant_id: str) -> int:
+    """Return the current data generation of a tenant"""
+    return _tenant_generations.get(tenant_id, 0)
+
+
+def invalidate_tenant(tenant_id: str) -> None:
+    """Mark every cached read for a tenant as stale after a write to its data"""
+    _tenant_generations[tenant_id] = _tenant_generations.get(tenant_id, 0) + 1
+
+
+class TTLCache:
+    """Bounded in-process cache whose entries expire a fixed number of seconds after being stored"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: Dict[Hashable, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if it is missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting expired entries and then the oldest one when full"""
+        if len(self._entries) >= self.maxsize:
+            now = time.monotonic()
+            for stale_key in [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]:
+                del self._entries[stale_key]
+            if len(self._entries) >= self.maxsize:
+                self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class FileCache:
+    """JSON documents persisted under a directory so they survive server restarts
+
+    Writes go to a temporary file that is renamed into place, so a reader never sees a partial document.
+    An empty directory disables the cache.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, re.sub(r"[^A-Za-z0-9_.-]", "_", key) + ".json")
+
+    def load(self, key: str) -> Optional[Any]:
+        """Return the document stored under key, or None if there is no readable one"""
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key: str, value: Any) -> None:
+        """Persist value under key, replacing any earlier document"""
+        if not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def discard(self, key: str) -> None:
+        """Remove the document stored under key, if there is one"""
+        if not self.directory:
+            return
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
@@ -33,6 +33,13 @@ class ResourceNotFoundError(ReltioApiError):
         message = f"{resource_type} with ID {resource_id} not found"
         super().__init__(404, message, details)
 
+class ReltioHTTPError(ReltioApiError, ValueError):
+    """Exception for non-success HTTP responses from the Reltio API"""
+    def __init__(self, status_code, body=""):
+        self.status_code = status_code
+        self.body = body
+        super().__init__(status_code, f"API request failed: {status_code} - {body}")
+
 class SecurityError(ReltioApiError):
     """Exception for security-related errors"""
     def __init__(self, message, details=None):
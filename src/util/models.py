@@ -19,6 +19,11 @@ from src.env import RELTIO_TENANT
 from src.util.api import extract_entity_id, extract_relation_id, extract_change_request_id
 import re
 
+# Translation table that deletes characters which are unsafe in a free-text query
+_UNSAFE_QUERY_CHARS = str.maketrans('', '', '<>\'";')
+# Task ID pattern, compiled once at import
+_TASK_ID_RE = re.compile(r'^[a-zA-Z0-9-_]+$')
+
 # Entity-related models
 class EntityIdRequest(BaseModel):
     """Model for requests with entity ID"""
@@ -102,17 +107,11 @@ class MergeEntitiesRequest(BaseModel):
         if len(v) != 2:
             raise ValueError("Exactly two entity IDs must be provided")
             
-        # Format entity IDs to ensure they have the required prefix
-        formatted_ids = []
-        for entity_id in v:
-            # Extract ID if it's in the format "entities/<entity_id>"
-            if entity_id.startswith("entities/"):
-                formatted_ids.append(entity_id)
-            else:
-                # Add prefix if it's just the ID
-                formatted_ids.append(f"entities/{extract_entity_id(entity_id)}")
-        
-        return formatted_ids
+        # Keep "entities/<entity_id>" as given and add the prefix to bare IDs
+        return [
+            entity_id if entity_id.startswith("entities/") else f"entities/{extract_entity_id(entity_id)}"
+            for entity_id in v
+        ]
 
 class RejectMatchRequest(BaseModel):
     """Model for rejecting a match between two entities"""
@@ -158,7 +157,7 @@ class EntitySearchRequest(BaseModel):
         default=10,
         ge=1,
         le=MAX_RESULTS_LIMIT,
-        description="Maximum number of results to return per call (capped at 10 by the tool layer). Use this for paging."
+        description="Maximum number of results to return per call (capped at RELTIO_MAX_PAGE_SIZE by the tool layer). Use this for paging."
     )
     sort: Optional[str] = Field(
         default="",
@@ -191,7 +190,7 @@ class EntitySearchRequest(BaseModel):
     def sanitize_query(cls, v):
         if v:
             # Remove any potentially dangerous characters
-            v = re.sub(r'[<>\'";]', '', v)
+            v = v.translate(_UNSAFE_QUERY_CHARS)
         return v
     
     @field_validator('filter')
@@ -206,9 +205,10 @@ class EntitySearchRequest(BaseModel):
     @field_validator('order')
     @classmethod
     def validate_order(cls, v):
-        if v.lower() not in ['asc', 'desc']:
+        order = v.lower()
+        if order not in ['asc', 'desc']:
             raise ValueError("Order must be 'asc' or 'desc'")
-        return v.lower()
+        return order
 
     @model_validator(mode='after')
     def validate_offset_max_combination(self):
@@ -327,14 +327,6 @@ class GetTotalMatchesRequest(BaseModel):
         default=RELTIO_TENANT,
         description="Tenant ID"
     )
-    
-    @field_validator('min_matches')
-    @classmethod
-    def validate_min_matches(cls, v):
-        """Validate min_matches is a non-negative integer"""
-        if v < 0:
-            raise ValueError("min_matches must be a non-negative integer")
-        return v
 
 class GetMatchFacetsRequest(BaseModel):
     """Model for getting potential matches facets by entity type"""
@@ -347,14 +339,6 @@ class GetMatchFacetsRequest(BaseModel):
         default=RELTIO_TENANT,
         description="Tenant ID"
     )
-    
-    @field_validator('min_matches')
-    @classmethod
-    def validate_min_matches(cls, v):
-        """Validate min_matches is a non-negative integer"""
-        if v < 0:
-            raise ValueError("min_matches must be a non-negative integer")
-        return v
 
 # Relation-related models
 class RelationIdRequest(BaseModel):
@@ -379,6 +363,7 @@ class MergeActivitiesRequest(BaseModel):
     """Model for retrieving merge activities"""
     timestamp_gt: int = Field(
         ...,
+        gt=0,
         description="Filter events with timestamp greater than this value (in milliseconds since epoch)"
     )
     event_types: Optional[List[str]] = Field(
@@ -387,6 +372,7 @@ class MergeActivitiesRequest(BaseModel):
     )
     timestamp_lt: Optional[int] = Field(
         None,
+        gt=0,
         description="Optional filter for events with timestamp less than this value (in milliseconds since epoch)"
     )
     entity_type: Optional[Annotated[str, StringConstraints(strip_whitespace=True, max_length=MAX_ENTITY_TYPE_LENGTH)]] = Field(
@@ -413,22 +399,6 @@ class MergeActivitiesRequest(BaseModel):
         description="Maximum number of results to return"
     )
     
-    @field_validator('timestamp_gt')
-    @classmethod
-    def validate_timestamp_gt(cls, v):
-        """Validate timestamp_gt is a positive integer"""
-        if v <= 0:
-            raise ValueError("timestamp_gt must be a positive integer")
-        return v
-    
-    @field_validator('timestamp_lt')
-    @classmethod
-    def validate_timestamp_lt(cls, v):
-        """Validate timestamp_lt is a positive integer"""
-        if v is not None and v <= 0:
-            raise ValueError("timestamp_lt must be a positive integer")
-        return v
-        
     @model_validator(mode='after')
     def validate_timestamps(self):
         """Validate that timestamp_lt > timestamp_gt if both are provided"""
@@ -694,9 +664,12 @@ class RelationSearchRequest(BaseModel):
     @field_validator('order')
     @classmethod
     def validate_order(cls, v):
-        if v and v.lower() not in ['asc', 'desc']:
+        if not v:
+            return "asc"
+        order = v.lower()
+        if order not in ['asc', 'desc']:
             raise ValueError("Order must be 'asc' or 'desc'")
-        return v.lower() if v else "asc"
+        return order
 
     @field_validator('activeness')
     @classmethod
@@ -757,9 +730,12 @@ class EntityInteractionsRequest(BaseModel):
     @field_validator('order')
     @classmethod
     def validate_order(cls, v):
-        if v and v.lower() not in ['asc', 'desc']:
+        if not v:
+            return "asc"
+        order = v.lower()
+        if order not in ['asc', 'desc']:
             raise ValueError("Order must be 'asc' or 'desc'")
-        return v.lower() if v else "asc"
+        return order
     
     @model_validator(mode='after')
     def validate_offset_max_combination(self):
@@ -1073,7 +1049,7 @@ class GetTaskDetailsRequest(BaseModel):
         v = v.strip()
         
         # Check for valid characters (alphanumeric, hyphens, underscores)
-        if not re.match(r'^[a-zA-Z0-9-_]+$', v):
+        if not _TASK_ID_RE.match(v):
             raise ValueError("Task ID can only contain alphanumeric characters, hyphens, and underscores")
         
         return v
@@ -1355,11 +1331,3 @@ class GetPotentialMatchApisRequest(BaseModel):
         default=RELTIO_TENANT,
         description="Tenant ID"
     )
-    
-    @field_validator('min_matches')
-    @classmethod
-    def validate_min_matches(cls, v):
-        """Validate min_matches is a non-negative integer"""
-        if v < 0:
-            raise ValueError("min_matches must be a non-negative integer")
-        return v 
\ No newline at end of file
@@ -0,0 +1,34 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.constants import HTTP_EXECUTOR_WORKERS, MAX_CONCURRENT_REQUESTS
+
+# Shared session for the synchronous (requests-based) calls, so keep-alive connections and their
+# TLS sessions are reused across token fetches, workflow calls and http_request
+http_session = requests.Session()
+http_session.mount("https://", HTTPAdapter(pool_maxsize=MAX_CONCURRENT_REQUESTS))
+
+# Dedicated pool for blocking calls made on http_session from async code, so they do not queue
+# behind other work on the event loop's small default executor
+_http_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_http_executor() -> ThreadPoolExecutor:
+    """Return the dedicated HTTP executor, creating it on first use"""
+    global _http_executor
+    if _http_executor is None:
+        _http_executor = ThreadPoolExecutor(max_workers=HTTP_EXECUTOR_WORKERS, thread_name_prefix="reltio-http")
+    return _http_executor
+
+
+def close_http_resources():
+    """Shut down the HTTP executor and close http_session's pooled connections; both are
+    recreated on next use (requests reopens pools on demand after Session.close)"""
+    global _http_executor
+    if _http_executor is not None:
+        executor, _http_executor = _http_executor, None
+        executor.shutdown(wait=False)
+    http_session.close()
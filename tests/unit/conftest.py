@@ -0,0 +1,21 @@
+import pytest
+import pytest_asyncio
+
+from src.tools.tenant_config import _config_store
+from src.util.activity_log import ActivityLog
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def stop_activity_log_flusher():
+    """Stop the background activity flusher before each test's event loop is closed"""
+    yield
+    task = ActivityLog._flusher_task
+    if task is not None and not task.done():
+        task.cancel()
+    ActivityLog._flusher_task = None
+
+
+@pytest.fixture(autouse=True)
+def isolate_config_store(tmp_path, monkeypatch):
+    """Persist business configurations under a per-test temporary directory, never a real one"""
+    monkeypatch.setattr(_config_store, "directory", str(tmp_path / "reltio-mcp"))
@@ -0,0 +1,42 @@
+import re
+import pytest
+from unittest.mock import patch, AsyncMock
+
+from src.util.activity_log import ActivityLog
+
+
+def test_generate_activity_id_format():
+    activity_ids = {ActivityLog.generate_activity_id() for _ in range(100)}
+    assert len(activity_ids) == 100
+    assert all(re.fullmatch(r"[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{8}", activity_id) for activity_id in activity_ids)
+
+
+@pytest.mark.asyncio
+class TestActivityLogQueue:
+
+    @patch("src.util.activity_log.ActivityLog.log_activity", new_callable=AsyncMock)
+    async def test_execute_and_log_activity_queues_without_writing(self, mock_log_activity):
+        await ActivityLog.execute_and_log_activity("tenant", "LABEL", "CLIENT", "description", [{"objectUri": "entities/1"}])
+        mock_log_activity.assert_not_awaited()
+
+        await ActivityLog.flush()
+        mock_log_activity.assert_awaited_once_with(
+            "tenant",
+            {"label": "LABEL", "description": "description", "items": [{"objectUri": "entities/1"}]},
+            "CLIENT"
+        )
+
+    @patch("src.util.activity_log.ActivityLog.log_activity", new_callable=AsyncMock)
+    async def test_flush_writes_every_queued_activity(self, mock_log_activity):
+        for i in range(5):
+            await ActivityLog.execute_and_log_activity("tenant", "LABEL", "CLIENT", f"description {i}")
+        await ActivityLog.flush()
+        assert mock_log_activity.await_count == 5
+
+    @patch("src.util.activity_log.ActivityLog.log_activity", new_callable=AsyncMock)
+    async def test_flusher_survives_write_errors(self, mock_log_activity):
+        mock_log_activity.side_effect = [Exception("API down"), {"ok": True}]
+        await ActivityLog.execute_and_log_activity("tenant", "LABEL", "CLIENT", "first")
+        await ActivityLog.execute_and_log_activity("tenant", "LABEL", "CLIENT", "second")
+        await ActivityLog.flush()
+        assert mock_log_activity.await_count == 2
@@ -1,21 +1,44 @@
+import asyncio
+import json
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
+import httpx
 from requests.exceptions import HTTPError
 
 from src.util.api import (
+    get_reltio_url,
     http_request,
+    http_request_async,
+    http_request_with_timeout,
+    get_async_client,
+    close_async_client,
     extract_entity_id,
     extract_relation_id,
     extract_name,
     validate_connection_security,
     create_error_response,
     SecurityError,
+    ReltioHTTPError,
+    HTTP_REQUEST_ERRORS,
     ALLOWED_ORIGINS,
     DEFAULT_TIMEOUT
 )
+from src.util.auth import get_reltio_headers
+from src.util.exceptions import TimeoutError as ReltioTimeoutError
 
 class TestUtils(unittest.TestCase):
 
+    def test_get_reltio_url_is_memoized(self):
+        url = get_reltio_url("entities/_search", "api", "tenant")
+        self.assertTrue(url.endswith("/reltio/api/tenant/entities/_search"))
+        self.assertIs(get_reltio_url("entities/_search", "api", "tenant"), url)
+
+    def test_http_request_errors_exclude_plain_value_errors(self):
+        self.assertIsInstance(ReltioHTTPError(500, "Server Error"), HTTP_REQUEST_ERRORS)
+        self.assertIsInstance(httpx.ConnectError("refused"), HTTP_REQUEST_ERRORS)
+        self.assertIsInstance(json.JSONDecodeError("bad", "", 0), HTTP_REQUEST_ERRORS)
+        self.assertNotIsInstance(ValueError("bug"), HTTP_REQUEST_ERRORS)
+
     def test_extract_entity_id(self):
         self.assertEqual(extract_entity_id("https://url/entity/123ABC"), "123ABC")
         self.assertEqual(extract_entity_id(None), "N/A")
@@ -35,6 +58,9 @@ class TestUtils(unittest.TestCase):
         headers = {"Origin": ALLOWED_ORIGINS[0]}
         self.assertTrue(validate_connection_security(url, headers))
 
+    def test_validate_connection_security_uppercase_scheme(self):
+        self.assertTrue(validate_connection_security("HTTPS://api.reltio.com/reltio/api/tenant/entities"))
+
     def test_validate_connection_security_insecure(self):
         url = "http://insecure.url"
         headers = {}
@@ -53,11 +79,11 @@ class TestUtils(unittest.TestCase):
         self.assertIn("field", response["error"]["details"])
         self.assertNotIn("extra", response["error"]["details"])
 
-    @patch('requests.request')
+    @patch('src.util.api.http_session.request')
     def test_http_request_get_success(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {'success': True}
+        mock_response.content = b'{"success": true}'
         mock_response.raise_for_status.return_value = None
         mock_request.return_value = mock_response
 
@@ -67,16 +93,16 @@ class TestUtils(unittest.TestCase):
             method='GET',
             url='https://example.com',
             params=None,
-            json=None,
+            data=None,
             headers=None,
             timeout=DEFAULT_TIMEOUT
         )
 
-    @patch('requests.request')
+    @patch('src.util.api.http_session.request')
     def test_http_request_post_success(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {'success': True}
+        mock_response.content = b'{"success": true}'
         mock_response.raise_for_status.return_value = None
         mock_request.return_value = mock_response
 
@@ -86,12 +112,23 @@ class TestUtils(unittest.TestCase):
             method='POST',
             url='https://example.com',
             params=None,
-            json=None,
+            data=None,
             headers=None,
             timeout=DEFAULT_TIMEOUT
         )
 
-    @patch('requests.request')
+    @patch('src.util.api.http_session.request')
+    def test_http_request_sends_compact_json_body(self, mock_request):
+        mock_response = MagicMock()
+        mock_response.content = b'[]'
+        mock_request.return_value = mock_response
+
+        result = http_request('https://example.com', method='POST', data={'key': 'value'})
+        self.assertEqual(result, [])
+        self.assertEqual(mock_request.call_args.kwargs['data'], b'{"key":"value"}')
+        self.assertEqual(mock_request.call_args.kwargs['headers'], {'Content-Type': 'application/json'})
+
+    @patch('src.util.api.http_session.request')
     def test_http_request_raises_value_error_on_http_error(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 404
@@ -102,3 +139,89 @@ class TestUtils(unittest.TestCase):
         with self.assertRaises(ValueError) as context:
             http_request('https://example.com')
         self.assertIn('API request failed: 404', str(context.exception))
+        self.assertIsInstance(context.exception, ReltioHTTPError)
+        self.assertEqual(context.exception.status_code, 404)
+
+
+class TestAsyncHttpRequest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncTearDown(self):
+        await close_async_client()
+
+    async def test_get_async_client_is_shared(self):
+        client = get_async_client()
+        self.assertIs(client, get_async_client())
+        await close_async_client()
+        self.assertIsNot(client, get_async_client())
+
+    @patch('src.util.auth.get_access_token', return_value='token')
+    async def test_async_client_negotiates_compressed_responses(self, mock_token):
+        self.assertIn('gzip', get_async_client().headers['accept-encoding'])
+        # Per-request headers must not override the encodings the client can decode
+        self.assertNotIn('Accept-Encoding', get_reltio_headers())
+
+    async def test_http_request_async_limits_concurrency(self):
+        in_flight = 0
+        peak = 0
+
+        async def slow_request(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={}, request=httpx.Request('GET', 'https://example.com'))
+
+        with patch('src.util.api.MAX_CONCURRENT_REQUESTS', 2), \
+             patch.object(httpx.AsyncClient, 'request', new=slow_request):
+            await asyncio.gather(*[http_request_async('https://example.com') for _ in range(6)])
+        self.assertEqual(peak, 2)
+
+    async def test_http_request_async_post_success(self):
+        response = httpx.Response(200, json={'success': True}, request=httpx.Request('POST', 'https://example.com'))
+        with patch.object(httpx.AsyncClient, 'request', new=AsyncMock(return_value=response)) as mock_request:
+            result = await http_request_async('https://example.com', method='POST', data={'key': 'value'})
+        self.assertEqual(result, {'success': True})
+        mock_request.assert_awaited_once_with(
+            method='POST',
+            url='https://example.com',
+            params=None,
+            content=b'{"key":"value"}',
+            headers={'Content-Type': 'application/json'}
+        )
+
+    async def test_http_request_async_json_without_orjson(self):
+        response = httpx.Response(200, content='{"name":"Zoë"}'.encode(), request=httpx.Request('POST', 'https://example.com'))
+        with patch('src.util.api.orjson', None), \
+             patch.object(httpx.AsyncClient, 'request', new=AsyncMock(return_value=response)) as mock_request:
+            result = await http_request_async('https://example.com', method='POST', data={'name': 'Zoë'}, headers={'Content-Type': 'application/json'})
+        self.assertEqual(result, {'name': 'Zoë'})
+        self.assertEqual(mock_request.await_args.kwargs['content'], '{"name":"Zoë"}'.encode())
+
+    async def test_http_request_async_raises_value_error_on_http_error(self):
+        request = httpx.Request('GET', 'https://example.com')
+        response = httpx.Response(404, text='Not Found', request=request)
+        with patch.object(httpx.AsyncClient, 'request', new=AsyncMock(return_value=response)):
+            with self.assertRaises(ValueError) as context:
+                await http_request_async('https://example.com')
+        self.assertIn('API request failed: 404', str(context.exception))
+
+    @patch('src.util.api.get_reltio_headers')
+    async def test_http_request_async_retries_on_invalid_token(self, mock_headers):
+        mock_headers.return_value = {'Authorization': 'Bearer new'}
+        request = httpx.Request('GET', 'https://example.com')
+        expired = httpx.Response(401, text='invalid_token', request=request)
+        ok = httpx.Response(200, json={'success': True}, request=request)
+        with patch.object(httpx.AsyncClient, 'request', new=AsyncMock(side_effect=[expired, ok])) as mock_request:
+            result = await http_request_async('https://example.com', headers={'Authorization': 'Bearer old'})
+        self.assertEqual(result, {'success': True})
+        self.assertEqual(mock_request.await_args.kwargs['headers'], {'Authorization': 'Bearer new'})
+        mock_headers.assert_called_once_with(force_refresh=True)
+
+    async def test_http_request_with_timeout_uses_async_client(self):
+        async def hanging_request(*args, **kwargs):
+            await asyncio.sleep(1)
+
+        with patch.object(httpx.AsyncClient, 'request', new=hanging_request):
+            with self.assertRaises(ReltioTimeoutError):
+                await http_request_with_timeout('https://example.com', timeout=0.01)
@@ -0,0 +1,48 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+from src.util import auth
+from src.util.auth import get_access_token, get_reltio_headers
+
+
+class TestAccessTokenCache(unittest.TestCase):
+
+    def setUp(self):
+        auth._token_cache.update({"value": None, "expires_at": 0.0})
+
+    def _token_response(self, token, expires_in=3600):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"access_token": token, "expires_in": expires_in}
+        return mock_response
+
+    @patch('src.util.auth.http_session.post')
+    def test_token_is_reused_until_expiry(self, mock_post):
+        mock_post.return_value = self._token_response("token1")
+        self.assertEqual(get_access_token(), "token1")
+        self.assertEqual(get_access_token(), "token1")
+        mock_post.assert_called_once()
+
+    @patch('src.util.auth.http_session.post')
+    def test_expired_token_is_refreshed(self, mock_post):
+        mock_post.side_effect = [self._token_response("token1", expires_in=10), self._token_response("token2")]
+        self.assertEqual(get_access_token(), "token1")
+        self.assertEqual(get_access_token(), "token2")
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch('src.util.auth.http_session.post')
+    def test_force_refresh_bypasses_cache(self, mock_post):
+        mock_post.side_effect = [self._token_response("token1"), self._token_response("token2")]
+        get_reltio_headers()
+        headers = get_reltio_headers(force_refresh=True)
+        self.assertEqual(headers["Authorization"], "Bearer token2")
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch('src.util.auth.http_session.post')
+    def test_headers_are_a_fresh_dict_per_call(self, mock_post):
+        mock_post.return_value = self._token_response("token1")
+        first = get_reltio_headers()
+        first["Globalid"] = "client"
+        second = get_reltio_headers(content_type="text/plain")
+        self.assertNotIn("Globalid", second)
+        self.assertEqual(second["Content-Type"], "text/plain")
+        self.assertEqual(first["Content-Type"], "application/json")
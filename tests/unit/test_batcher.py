@@ -0,0 +1,57 @@
+import asyncio
+import pytest
+
+from src.util.batcher import RequestCoalescer
+
+
+@pytest.mark.asyncio
+class TestRequestCoalescer:
+
+    async def test_concurrent_identical_calls_share_one_request(self):
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return ["entities/1"]
+
+        results = await asyncio.gather(*[coalescer.run("key", call) for _ in range(5)])
+        assert results == [["entities/1"]] * 5
+        assert calls == 1
+
+    async def test_different_keys_are_not_coalesced(self):
+        coalescer = RequestCoalescer()
+        calls = []
+
+        async def call(key):
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            return key
+
+        results = await asyncio.gather(coalescer.run("a", lambda: call("a")), coalescer.run("b", lambda: call("b")))
+        assert results == ["a", "b"]
+        assert sorted(calls) == ["a", "b"]
+
+    async def test_completed_call_is_not_reused(self):
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await coalescer.run("key", call) == 1
+        assert await coalescer.run("key", call) == 2
+
+    async def test_error_is_raised_to_every_caller(self):
+        coalescer = RequestCoalescer()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            raise ValueError("API failed")
+
+        results = await asyncio.gather(coalescer.run("key", call), coalescer.run("key", call), return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
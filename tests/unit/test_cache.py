@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.util.cache import FileCache, TTLCache, invalidate_tenant, tenant_generation
+
+
+class TestTTLCache(unittest.TestCase):
+
+    def test_get_returns_stored_value(self):
+        cache = TTLCache(maxsize=10, ttl=30)
+        cache.set("key", {"total": 1})
+        self.assertEqual(cache.get("key"), {"total": 1})
+        self.assertIsNone(cache.get("missing"))
+
+    @patch("src.util.cache.time.monotonic")
+    def test_entries_expire_after_ttl(self, mock_monotonic):
+        cache = TTLCache(maxsize=10, ttl=30)
+        mock_monotonic.return_value = 100.0
+        cache.set("key", "value")
+        mock_monotonic.return_value = 129.0
+        self.assertEqual(cache.get("key"), "value")
+        mock_monotonic.return_value = 130.0
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(len(cache), 0)
+
+    def test_oldest_entry_evicted_when_full(self):
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+        self.assertEqual(cache.get("c"), 3)
+
+
+class TestTenantGeneration(unittest.TestCase):
+
+    def test_invalidate_bumps_only_that_tenant(self):
+        before = tenant_generation("tenant-a")
+        other = tenant_generation("tenant-b")
+        invalidate_tenant("tenant-a")
+        self.assertEqual(tenant_generation("tenant-a"), before + 1)
+        self.assertEqual(tenant_generation("tenant-b"), other)
+
+
+class TestFileCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def test_store_then_load_round_trips(self):
+        cache = FileCache(os.path.join(self.tmp_dir.name, "nested"))
+        cache.store("business_config-tenant/1", {"uri": "configuration"})
+        self.assertEqual(cache.load("business_config-tenant/1"), {"uri": "configuration"})
+        self.assertEqual(os.listdir(cache.directory), ["business_config-tenant_1.json"])
+
+    def test_missing_or_corrupt_document_loads_as_none(self):
+        cache = FileCache(self.tmp_dir.name)
+        self.assertIsNone(cache.load("missing"))
+        with open(os.path.join(self.tmp_dir.name, "corrupt.json"), "w") as f:
+            f.write("{")
+        self.assertIsNone(cache.load("corrupt"))
+
+    def test_discard_removes_document(self):
+        cache = FileCache(self.tmp_dir.name)
+        cache.store("key", {"uri": "configuration"})
+        cache.discard("key")
+        cache.discard("key")
+        self.assertIsNone(cache.load("key"))
+
+    def test_empty_directory_disables_cache(self):
+        cache = FileCache("")
+        cache.store("key", {"uri": "configuration"})
+        self.assertIsNone(cache.load("key"))
@@ -6,7 +6,8 @@ from src.util.exceptions import (
     AuthorizationError,
     ResourceNotFoundError,
     SecurityError,
-    TimeoutError
+    TimeoutError,
+    ReltioHTTPError
 )
 
 class TestReltioExceptions(unittest.TestCase):
@@ -53,3 +54,11 @@ class TestReltioExceptions(unittest.TestCase):
         self.assertEqual(err.code, 408)
         self.assertIn("FetchData timed out after 10 seconds", err.message)
         self.assertEqual(err.details, {"url": "/api/data"})
+
+    def test_reltio_http_error(self):
+        err = ReltioHTTPError(404, "Not Found")
+        self.assertEqual(err.status_code, 404)
+        self.assertEqual(err.body, "Not Found")
+        self.assertEqual(err.code, 404)
+        self.assertIn("API request failed: 404 - Not Found", str(err))
+        self.assertIsInstance(err, ValueError)
@@ -170,6 +170,11 @@ class TestEntitySearchRequest(unittest.TestCase):
         self.assertNotIn('<', request.query)
         self.assertNotIn('>', request.query)
     
+    def test_query_sanitization_removes_quotes_and_semicolons(self):
+        """Test query sanitization removes quotes and semicolons and keeps other text"""
+        request = EntitySearchRequest(query='O\'Brien "Jr"; <b>x</b>')
+        self.assertEqual(request.query, 'OBrien Jr bx/b')
+    
     def test_filter_validation_balanced_parentheses(self):
         """Test filter validation for balanced parentheses"""
         with self.assertRaises(ValidationError):
@@ -240,6 +245,11 @@ class TestMatchScoreRequest(unittest.TestCase):
         with self.assertRaises(ValidationError):
             MatchScoreRequest(offset=9995, max_results=10)
 
+    def test_entity_type_stored_unescaped(self):
+        """Test entity type keeps its quotes; escaping happens where the filter is built"""
+        request = MatchScoreRequest(entity_type="O'Type")
+        self.assertEqual(request.entity_type, "O'Type")
+
 
 class TestConfidenceLevelRequest(unittest.TestCase):
     """Test ConfidenceLevelRequest model"""
@@ -264,6 +274,11 @@ class TestConfidenceLevelRequest(unittest.TestCase):
         with self.assertRaises(ValidationError):
             ConfidenceLevelRequest(offset=9995, max_results=10)
 
+    def test_confidence_level_stored_unescaped(self):
+        """Test confidence level keeps its quotes; escaping happens where the filter is built"""
+        request = ConfidenceLevelRequest(confidence_level="High') or (true")
+        self.assertEqual(request.confidence_level, "High') or (true")
+
 
 class TestGetTotalMatchesRequest(unittest.TestCase):
     """Test GetTotalMatchesRequest model"""
@@ -22,6 +22,44 @@ class TestServerInitialization:
         assert src.server.logger.name == "mcp.server.reltio"
 
 
+@pytest.mark.asyncio
+class TestLifespan:
+    """Tests for the server lifespan."""
+
+    @patch('src.server.close_http_resources')
+    @patch('src.server.close_async_client')
+    @patch('src.server.ActivityLog.flush')
+    @patch('src.server.RELTIO_PREFETCH_CONFIG', False)
+    async def test_resources_released_after_last_session(self, mock_flush, mock_close_client,
+                                                         mock_close_http):
+        """Test that the shared clients and executor are only released when the last session ends."""
+        async with src.server.lifespan(src.server.mcp):
+            async with src.server.lifespan(src.server.mcp):
+                pass
+            mock_close_client.assert_not_called()
+            mock_close_http.assert_not_called()
+
+        mock_flush.assert_awaited_once()
+        mock_close_client.assert_awaited_once()
+        mock_close_http.assert_called_once()
+
+    @patch('src.tools.workflow.http_request_workflow')
+    @patch('src.server.close_async_client')
+    @patch('src.server.ActivityLog.flush')
+    @patch('src.server.RELTIO_PREFETCH_CONFIG', False)
+    async def test_workflow_requests_work_in_later_session(self, mock_flush, mock_close_client, mock_request):
+        """Test that a session opened after the previous one closed can still run workflow requests."""
+        from src.tools.workflow import _run_workflow_request
+        mock_request.return_value = {"data": []}
+
+        async with src.server.lifespan(src.server.mcp):
+            assert await _run_workflow_request("https://example.com/first") == {"data": []}
+        async with src.server.lifespan(src.server.mcp):
+            assert await _run_workflow_request("https://example.com/second") == {"data": []}
+
+        assert mock_request.call_count == 2
+
+
 @pytest.mark.asyncio
 class TestSearchEntitiesEndpoint:
     """Tests for the search_entities endpoint."""
@@ -79,6 +117,23 @@ class TestGetEntityEndpoint:
         mock_get_entity.assert_called_once_with("entity_id", {"attributes": []}, "tenant_id")
         assert result == {"id": "entity_id", "name": "Test Entity"}
 
+@pytest.mark.asyncio
+class TestGetEntitiesEndpoint:
+    """Tests for the get_entities endpoint."""
+    
+    @patch('src.server.get_entities_details')
+    async def test_get_entities(self, mock_get_entities):
+        """Test get_entities function."""
+        # Setup mock
+        mock_get_entities.return_value = {"entities/e1": {"attributes": {}}}
+        
+        # Call the function
+        result = await src.server.get_entities_tool(["e1"], None, "tenant_id")
+        
+        # Verify the tool was called with correct parameters
+        mock_get_entities.assert_called_once_with(["e1"], None, "tenant_id")
+        assert result == {"entities/e1": {"attributes": {}}}
+
 @pytest.mark.asyncio
 class TestUpdateEntityAttributesEndpoint:
     """Tests for the update_entity_attributes endpoint."""
@@ -45,7 +45,7 @@ class TestGetMergeActivities:
     """Test cases for the get_merge_activities function."""
 
     @patch("src.tools.activity.yaml.dump")
-    @patch("src.tools.activity.http_request")
+    @patch("src.tools.activity.http_request_async")
     @patch("src.tools.activity.get_reltio_headers")
     @patch("src.tools.activity.validate_connection_security")
     async def test_get_merge_activities_success(
@@ -100,7 +100,7 @@ class TestGetMergeActivities:
         assert result["error"]["code_key"] == "VALIDATION_ERROR"
         mock_validate_security.assert_not_called()
 
-    @patch("src.tools.activity.http_request")
+    @patch("src.tools.activity.http_request_async")
     @patch("src.tools.activity.get_reltio_headers")
     @patch("src.tools.activity.validate_connection_security")
     async def test_get_merge_activities_security_validation_failure(self, mock_validate_security, mock_get_headers, mock_http_request):
@@ -122,7 +122,7 @@ class TestGetMergeActivities:
         mock_get_headers.assert_called_once_with()
         mock_http_request.assert_not_called()
 
-    @patch("src.tools.activity.http_request")
+    @patch("src.tools.activity.http_request_async")
     @patch("src.tools.activity.get_reltio_headers")
     @patch("src.tools.activity.validate_connection_security")
     async def test_get_merge_activities_api_error(self, mock_validate_security, mock_get_headers, mock_http_request):
@@ -149,7 +149,7 @@ class TestGetMergeActivities:
         mock_get_headers.assert_called_once_with()
         assert mock_http_request.called
 
-    @patch("src.tools.activity.http_request")
+    @patch("src.tools.activity.http_request_async")
     @patch("src.tools.activity.get_reltio_headers")
     @patch("src.tools.activity.validate_connection_security")
     async def test_get_merge_activities_exception(self, mock_validate_security, mock_get_headers, mock_http_request):
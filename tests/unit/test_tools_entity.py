@@ -1,9 +1,11 @@
 import pytest
 from unittest.mock import patch, MagicMock
+from src.util.exceptions import ReltioHTTPError
 import yaml
 
 from src.tools.entity import (
     get_entity_details, 
+    get_entities_details,
     update_entity_attributes, 
     get_entity_match_history, 
     get_entity_matches, 
@@ -24,7 +26,7 @@ TENANT_ID = "test-tenant"
 
 @pytest.mark.asyncio
 class TestGetEntityDetails:
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -47,7 +49,7 @@ class TestGetEntityDetails:
             result = yaml.safe_load(result)
         assert result["error"]["code_key"] == "VALIDATION_ERROR"
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security", side_effect=Exception("Auth failed"))
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -61,7 +63,7 @@ class TestGetEntityDetails:
             result = yaml.safe_load(result)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.entity.http_request", side_effect=Exception("404 Not Found"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("404 Not Found"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -75,7 +77,7 @@ class TestGetEntityDetails:
             result = yaml.safe_load(result)
         assert result["error"]["code_key"] == "RESOURCE_NOT_FOUND"
 
-    @patch("src.tools.entity.http_request", side_effect=Exception("Internal Server Error"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("Internal Server Error"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -89,9 +91,89 @@ class TestGetEntityDetails:
             result = yaml.safe_load(result)
         assert result["error"]["code_key"] == "SERVER_ERROR"
 
+    @patch("src.tools.entity.http_request_async")
+    @patch("src.tools.entity.validate_connection_security")
+    @patch("src.tools.entity.get_reltio_headers")
+    @patch("src.tools.entity.get_reltio_url")
+    @patch("src.tools.entity.EntityIdRequest")
+    async def test_returns_native_dict(self, mock_request_model, mock_get_url, mock_headers, mock_validate, mock_http):
+        mock_request_model.return_value.entity_id = ENTITY_ID
+        mock_request_model.return_value.tenant_id = TENANT_ID
+        mock_get_url.return_value = "https://reltio.api/entities/123ABC"
+        mock_headers.return_value = {"Authorization": "Bearer token"}
+        mock_http.return_value = {
+            "attributes": {"FirstName": [{"value": "John"}]},
+            "crosswalks": [{"uri": "entities/123ABC/crosswalks/cw1", "type": "configuration/sources/Reltio", "value": "123ABC"}]
+        }
+
+        result = await get_entity_details(ENTITY_ID, None, TENANT_ID)
+        assert isinstance(result, dict)
+        assert result["attributes"] == {"FirstName": "John"}
+        assert result["crosswalks"][0]["id"] == "cw1"
+
+@pytest.mark.asyncio
+class TestGetEntitiesDetails:
+    @patch("src.tools.entity.ActivityLog.execute_and_log_activity")
+    @patch("src.tools.entity.http_request_async")
+    @patch("src.tools.entity.validate_connection_security")
+    @patch("src.tools.entity.get_reltio_headers")
+    async def test_successful_response(self, mock_headers, mock_validate, mock_http, mock_log):
+        mock_headers.return_value = {"Authorization": "Bearer token"}
+        mock_http.side_effect = lambda url, headers=None: {
+            "label": url.rsplit("/", 1)[-1],
+            "attributes": {"FirstName": [{"value": url.rsplit("/", 1)[-1]}]}
+        }
+
+        result = await get_entities_details(["entity1", "entity2"], None, TENANT_ID)
+        assert result == {
+            "entities/entity1": {"attributes": {"FirstName": "entity1"}},
+            "entities/entity2": {"attributes": {"FirstName": "entity2"}}
+        }
+        assert mock_http.call_count == 2
+        mock_validate.assert_called_once()
+        mock_log.assert_called_once()
+        assert mock_log.call_args.kwargs["items"] == [
+            {"objectUri": "entities/entity1"},
+            {"objectUri": "entities/entity2"}
+        ]
+
+    @patch("src.tools.entity.ActivityLog.execute_and_log_activity")
+    @patch("src.tools.entity.http_request_async")
+    @patch("src.tools.entity.validate_connection_security")
+    @patch("src.tools.entity.get_reltio_headers")
+    async def test_partial_failure(self, mock_headers, mock_validate, mock_http, mock_log):
+        mock_headers.return_value = {"Authorization": "Bearer token"}
+
+        def fake_request(url, headers=None):
+            if url.endswith("missing1"):
+                raise ReltioHTTPError(404, "Not Found")
+            if url.endswith("entity404"):
+                raise ReltioHTTPError(500, "Internal error for entities/entity404")
+            return {"attributes": {}}
+        mock_http.side_effect = fake_request
+
+        result = await get_entities_details(["entity1", "missing1", "entity404"], None, TENANT_ID)
+        assert result["entities/entity1"] == {"attributes": {}}
+        assert result["entities/missing1"]["error"]["code_key"] == "RESOURCE_NOT_FOUND"
+        # An ID that happens to contain "404" is not mistaken for a missing entity
+        assert result["entities/entity404"]["error"]["code_key"] == "SERVER_ERROR"
+
+    async def test_validation_error(self):
+        result = await get_entities_details(["!invalid_id!"], None, TENANT_ID)
+        assert result["error"]["code_key"] == "VALIDATION_ERROR"
+
+    async def test_empty_ids(self):
+        result = await get_entities_details([], None, TENANT_ID)
+        assert result["error"]["code_key"] == "VALIDATION_ERROR"
+
+    @patch("src.tools.entity.get_reltio_headers", side_effect=Exception("Auth failed"))
+    async def test_authentication_error(self, _):
+        result = await get_entities_details(["entity1"], None, TENANT_ID)
+        assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
+
 @pytest.mark.asyncio
 class TestUpdateEntityAttributes:
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -115,7 +197,7 @@ class TestUpdateEntityAttributes:
             result = yaml.safe_load(result)
         assert result["error"]["code_key"] == "VALIDATION_ERROR"
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security", side_effect=Exception("Auth failed"))
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -129,7 +211,7 @@ class TestUpdateEntityAttributes:
             result = yaml.safe_load(result)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.entity.http_request", side_effect=Exception("404 Not Found"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("404 Not Found"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -143,7 +225,7 @@ class TestUpdateEntityAttributes:
             result = yaml.safe_load(result)
         assert result["error"]["code_key"] == "RESOURCE_NOT_FOUND"
 
-    @patch("src.tools.entity.http_request", side_effect=Exception("Internal Server Error"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("Internal Server Error"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -161,7 +243,7 @@ class TestUpdateEntityAttributes:
 @pytest.mark.asyncio
 class TestGetEntityMatches:
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_url")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
@@ -206,7 +288,7 @@ class TestGetEntityMatches:
             result = yaml.safe_load(result)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.entity.http_request", side_effect=Exception("404 Not Found"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("404 Not Found"))
     @patch("src.tools.entity.get_reltio_url")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
@@ -221,7 +303,7 @@ class TestGetEntityMatches:
             result = yaml.safe_load(result)
         assert result["error"]["code_key"] == "RESOURCE_NOT_FOUND"
 
-    @patch("src.tools.entity.http_request", side_effect=[[], {"id": ENTITY_ID}])
+    @patch("src.tools.entity.http_request_async", side_effect=[[], {"id": ENTITY_ID}])
     @patch("src.tools.entity.get_reltio_url")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
@@ -236,7 +318,7 @@ class TestGetEntityMatches:
         assert "matches" in parsed_result
         assert parsed_result["matches"] == []
 
-    @patch("src.tools.entity.http_request", side_effect=[["match1", "match2"], Exception("Source fetch failed")])
+    @patch("src.tools.entity.http_request_async", side_effect=[["match1", "match2"], Exception("Source fetch failed")])
     @patch("src.tools.entity.get_reltio_url", side_effect=[
         "https://api/entities/123ABC/_transitiveMatches",
         "https://api/entities/123ABC"
@@ -258,7 +340,7 @@ class TestGetEntityMatches:
 @pytest.mark.asyncio
 class TestGetEntityMatchHistory:
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_url")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
@@ -298,7 +380,7 @@ class TestGetEntityMatchHistory:
             result = yaml.safe_load(result)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.entity.http_request", side_effect=Exception("404"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("404"))
     @patch("src.tools.entity.get_reltio_url")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
@@ -313,7 +395,7 @@ class TestGetEntityMatchHistory:
             result = yaml.safe_load(result)
         assert result["error"]["code_key"] == "RESOURCE_NOT_FOUND"
 
-    @patch("src.tools.entity.http_request", side_effect=[[], {"id": ENTITY_ID}])
+    @patch("src.tools.entity.http_request_async", side_effect=[[], {"id": ENTITY_ID}])
     @patch("src.tools.entity.get_reltio_url")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
@@ -328,7 +410,7 @@ class TestGetEntityMatchHistory:
         assert "match_history" in parsed_result
         assert parsed_result["match_history"] == []
 
-    @patch("src.tools.entity.http_request", side_effect=[[{"id": "h1"}], Exception("Source fetch error")])
+    @patch("src.tools.entity.http_request_async", side_effect=[[{"id": "h1"}], Exception("Source fetch error")])
     @patch("src.tools.entity.get_reltio_url", side_effect=[
         "https://api/entities/123ABC/_crosswalkTree",
         "https://api/entities/123ABC"
@@ -347,7 +429,7 @@ class TestGetEntityMatchHistory:
 
 @pytest.mark.asyncio
 class TestMergeEntities:
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -390,7 +472,7 @@ class TestMergeEntities:
         result = await merge_entities(entity_ids, TENANT_ID)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
     
-    @patch("src.tools.entity.http_request", side_effect=Exception("404 Not Found"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("404 Not Found"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -406,7 +488,7 @@ class TestMergeEntities:
         result = await merge_entities(entity_ids, TENANT_ID)
         assert result["error"]["code_key"] == "RESOURCE_NOT_FOUND"
     
-    @patch("src.tools.entity.http_request", side_effect=Exception("400 Bad Request"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("400 Bad Request"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -422,7 +504,7 @@ class TestMergeEntities:
         result = await merge_entities(entity_ids, TENANT_ID)
         assert result["error"]["code_key"] == "INVALID_REQUEST"
     
-    @patch("src.tools.entity.http_request", side_effect=Exception("Internal Server Error"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("Internal Server Error"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -440,7 +522,7 @@ class TestMergeEntities:
 
 @pytest.mark.asyncio
 class TestRejectEntityMatch:
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -464,7 +546,7 @@ class TestRejectEntityMatch:
             headers=mock_headers.return_value
         )
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -503,7 +585,7 @@ class TestRejectEntityMatch:
         result = await reject_entity_match(source_id, target_id, TENANT_ID)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
     
-    @patch("src.tools.entity.http_request", side_effect=Exception("404 Not Found"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("404 Not Found"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -520,7 +602,7 @@ class TestRejectEntityMatch:
         result = await reject_entity_match(source_id, target_id, TENANT_ID)
         assert result["error"]["code_key"] == "RESOURCE_NOT_FOUND"
     
-    @patch("src.tools.entity.http_request", side_effect=Exception("400 Bad Request"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("400 Bad Request"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -537,7 +619,7 @@ class TestRejectEntityMatch:
         result = await reject_entity_match(source_id, target_id, TENANT_ID)
         assert result["error"]["code_key"] == "INVALID_REQUEST"
     
-    @patch("src.tools.entity.http_request", side_effect=Exception("Internal Server Error"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("Internal Server Error"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -556,7 +638,7 @@ class TestRejectEntityMatch:
 
 @pytest.mark.asyncio
 class TestExportMergeTree:
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -570,7 +652,7 @@ class TestExportMergeTree:
         assert isinstance(result, dict)
         assert result["status"] == "completed"
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security", side_effect=Exception("Auth failed"))
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -578,7 +660,7 @@ class TestExportMergeTree:
         result = await export_merge_tree("dummy.svr@email.com", TENANT_ID)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.entity.http_request", side_effect=Exception("Internal Server Error"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("Internal Server Error"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -590,7 +672,7 @@ class TestExportMergeTree:
 class TestUnmergeEntityByContributor:
     """Test cases for the unmerge_entity_by_contributor function."""
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_unmerge_entity_by_contributor_success(self, mock_validate_security, mock_get_headers, mock_http_request):
@@ -634,14 +716,14 @@ class TestUnmergeEntityByContributor:
         assert result["error"]["code_key"] == "VALIDATION_ERROR"
         assert "Invalid entity ID" in result["error"]["message"]
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_unmerge_entity_by_contributor_not_found(self, mock_validate_security, mock_get_headers, mock_http_request):
         """Test unmerge with entity not found error."""
         # Setup mocks
         mock_get_headers.return_value = {"Authorization": "Bearer token"}
-        mock_http_request.side_effect = Exception("API Error: 404 Not Found")
+        mock_http_request.side_effect = ReltioHTTPError(404, "Not Found")
 
         # Call the function
         result = await unmerge_entity_by_contributor("origin", "contributor", "test_tenant")
@@ -655,7 +737,7 @@ class TestUnmergeEntityByContributor:
 class TestUnmergeEntityTreeByContributor:
     """Test cases for the unmerge_entity_tree_by_contributor function."""
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_unmerge_entity_tree_by_contributor_success(self, mock_validate_security, mock_get_headers, mock_http_request):
@@ -699,14 +781,14 @@ class TestUnmergeEntityTreeByContributor:
         assert result["error"]["code_key"] == "VALIDATION_ERROR"
         assert "Invalid entity ID" in result["error"]["message"]
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_unmerge_entity_tree_by_contributor_not_found(self, mock_validate_security, mock_get_headers, mock_http_request):
         """Test tree unmerge with entity not found error."""
         # Setup mocks
         mock_get_headers.return_value = {"Authorization": "Bearer token"}
-        mock_http_request.side_effect = Exception("API Error: 404 Not Found")
+        mock_http_request.side_effect = ReltioHTTPError(404, "Not Found")
 
         # Call the function
         result = await unmerge_entity_tree_by_contributor("origin", "contributor", "test_tenant")
@@ -722,7 +804,7 @@ class TestGetEntityWithMatches:
     """Test suite for get_entity_with_matches function"""
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -780,7 +862,7 @@ class TestCreateEntities:
     """Test suite for create_entities function"""
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -812,7 +894,7 @@ class TestCreateEntities:
         assert "error" in result
         assert result["error"]["code_key"] == "VALIDATION_ERROR"
     
-    @patch("src.tools.entity.http_request", side_effect=Exception("400 Bad Request"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("400 Bad Request"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -838,7 +920,7 @@ class TestGetEntityHops:
     """Test suite for get_entity_hops function"""
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -872,7 +954,7 @@ class TestGetEntityHops:
         assert "error" in result
         assert result["error"]["code_key"] == "VALIDATION_ERROR"
     
-    @patch("src.tools.entity.http_request", side_effect=Exception("404 Not Found"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("404 Not Found"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -895,7 +977,7 @@ class TestGetEntityParents:
     """Test suite for get_entity_parents function"""
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -932,7 +1014,7 @@ class TestGetEntityParents:
         assert "error" in result
         assert result["error"]["code_key"] == "VALIDATION_ERROR"
     
-    @patch("src.tools.entity.http_request", side_effect=Exception("404 Not Found"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("404 Not Found"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1042,7 +1124,7 @@ class TestGetEntityDetailsAdditional:
     """Additional test cases for get_entity_details to increase coverage"""
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1064,7 +1146,7 @@ class TestGetEntityDetailsAdditional:
         parsed_result = yaml.safe_load(result) if isinstance(result, str) else result
         assert isinstance(parsed_result, (dict, list))
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1101,7 +1183,7 @@ class TestUpdateEntityAttributesAdditional:
     """Additional test cases for update_entity_attributes"""
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1134,7 +1216,7 @@ class TestUpdateEntityAttributesAdditional:
 class TestGetEntityMatchesAdditional:
     """Additional test cases for get_entity_matches"""
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_url")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
@@ -1157,7 +1239,7 @@ class TestGetEntityMatchesAdditional:
         parsed_result = yaml.safe_load(result) if isinstance(result, str) else result
         assert "source_entity" in parsed_result
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_url")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
@@ -1199,7 +1281,7 @@ class TestGetEntityMatchesAdditional:
         assert result["error"]["code_key"] == "SECURITY_ERROR"
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_url")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
@@ -1256,7 +1338,7 @@ class TestGetEntityMatchHistoryAdditional:
         assert result["error"]["code_key"] == "SECURITY_ERROR"
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_url")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
@@ -1280,7 +1362,7 @@ class TestGetEntityMatchHistoryAdditional:
         assert isinstance(parsed_result, (dict, list))
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.entity.http_request", side_effect=[[], {"id": ENTITY_ID}])
+    @patch("src.tools.entity.http_request_async", side_effect=[[], {"id": ENTITY_ID}])
     @patch("src.tools.entity.get_reltio_url")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
@@ -1311,7 +1393,7 @@ class TestMergeEntitiesAdditional:
     """Additional test cases for merge_entities"""
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1343,7 +1425,7 @@ class TestRejectEntityMatchAdditional:
     """Additional test cases for reject_entity_match"""
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1376,7 +1458,7 @@ class TestExportMergeTreeAdditional:
     """Additional test cases for export_merge_tree"""
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_export_job_url")
@@ -1400,7 +1482,7 @@ class TestExportMergeTreeAdditional:
 class TestUnmergeEntityByContributorAdditional:
     """Additional test cases for unmerge_entity_by_contributor"""
     
-    @patch("src.tools.entity.http_request", side_effect=Exception("400 Bad Request"))
+    @patch("src.tools.entity.http_request_async", side_effect=ReltioHTTPError(400, "Bad Request"))
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_invalid_request_error(self, mock_validate_security, mock_get_headers, mock_http_request):
@@ -1412,7 +1494,7 @@ class TestUnmergeEntityByContributorAdditional:
         assert "error" in result
         assert result["error"]["code_key"] == "INVALID_REQUEST"
     
-    @patch("src.tools.entity.http_request", side_effect=Exception("500 Internal Server Error"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("500 Internal Server Error"))
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_server_error(self, mock_validate_security, mock_get_headers, mock_http_request):
@@ -1433,7 +1515,7 @@ class TestUnmergeEntityByContributorAdditional:
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_activity_log_failure(self, mock_validate_security, mock_get_headers, mock_http_request, mock_activity_log):
@@ -1455,7 +1537,7 @@ class TestUnmergeEntityByContributorAdditional:
 class TestUnmergeEntityTreeByContributorAdditional:
     """Additional test cases for unmerge_entity_tree_by_contributor"""
     
-    @patch("src.tools.entity.http_request", side_effect=Exception("400 Bad Request"))
+    @patch("src.tools.entity.http_request_async", side_effect=ReltioHTTPError(400, "Bad Request"))
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_invalid_request_error(self, mock_validate_security, mock_get_headers, mock_http_request):
@@ -1467,7 +1549,7 @@ class TestUnmergeEntityTreeByContributorAdditional:
         assert "error" in result
         assert result["error"]["code_key"] == "INVALID_REQUEST"
     
-    @patch("src.tools.entity.http_request", side_effect=Exception("500 Internal Server Error"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("500 Internal Server Error"))
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_server_error(self, mock_validate_security, mock_get_headers, mock_http_request):
@@ -1488,7 +1570,7 @@ class TestUnmergeEntityTreeByContributorAdditional:
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_activity_log_failure(self, mock_validate_security, mock_get_headers, mock_http_request, mock_activity_log):
@@ -1510,7 +1592,7 @@ class TestUnmergeEntityTreeByContributorAdditional:
 class TestGetEntityWithMatchesAdditional:
     """Additional test cases for get_entity_with_matches"""
     
-    @patch("src.tools.entity.http_request", side_effect=Exception("404 Not Found"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("404 Not Found"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1531,7 +1613,7 @@ class TestGetEntityWithMatchesAdditional:
         assert "error" in result
         assert result["error"]["code_key"] == "RESOURCE_NOT_FOUND"
     
-    @patch("src.tools.entity.http_request", side_effect=Exception("500 Server Error"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("500 Server Error"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1574,7 +1656,7 @@ class TestGetEntityWithMatchesAdditional:
         assert "error" in result
         assert result["error"]["code_key"] == "SECURITY_ERROR"
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1604,7 +1686,7 @@ class TestGetEntityWithMatchesAdditional:
         assert result["error"]["code_key"] == "SECURITY_ERROR"
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1629,7 +1711,7 @@ class TestGetEntityWithMatchesAdditional:
         parsed_result = yaml.safe_load(result) if isinstance(result, str) else result
         assert "source_entity" in parsed_result
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1659,7 +1741,7 @@ class TestGetEntityWithMatchesAdditional:
         assert "source_entity" in parsed_result
         assert "matches" in parsed_result
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1688,7 +1770,7 @@ class TestGetEntityWithMatchesAdditional:
         assert "source_entity" in parsed_result
         assert "total_matches" in parsed_result
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1718,7 +1800,7 @@ class TestGetEntityWithMatchesAdditional:
         parsed_result = yaml.safe_load(result) if isinstance(result, str) else result
         assert "source_entity" in parsed_result
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1759,7 +1841,7 @@ class TestGetEntityWithMatchesAdditional:
 class TestCreateEntitiesAdditional:
     """Additional test cases for create_entities"""
     
-    @patch("src.tools.entity.http_request", side_effect=Exception("401 Unauthorized"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("401 Unauthorized"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1779,7 +1861,7 @@ class TestCreateEntitiesAdditional:
         assert "error" in result
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
     
-    @patch("src.tools.entity.http_request", side_effect=Exception("403 Forbidden"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("403 Forbidden"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1815,7 +1897,7 @@ class TestCreateEntitiesAdditional:
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1835,7 +1917,7 @@ class TestCreateEntitiesAdditional:
         parsed_result = yaml.safe_load(result) if isinstance(result, str) else result
         assert isinstance(parsed_result, list)
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1871,7 +1953,7 @@ class TestCreateEntitiesAdditional:
         assert isinstance(parsed_result, list)
         assert "object" in parsed_result[0]
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1897,7 +1979,7 @@ class TestCreateEntitiesAdditional:
         assert parsed_result[0]["successful"] is False
         assert "errors" in parsed_result[0]
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1941,7 +2023,7 @@ class TestGetEntityHopsAdditional:
         assert "error" in result
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1958,7 +2040,7 @@ class TestGetEntityHopsAdditional:
         parsed_result = yaml.safe_load(result) if isinstance(result, str) else result
         assert "entities" in parsed_result
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1975,7 +2057,7 @@ class TestGetEntityHopsAdditional:
         parsed_result = yaml.safe_load(result) if isinstance(result, str) else result
         assert "entities" in parsed_result
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -1992,7 +2074,7 @@ class TestGetEntityHopsAdditional:
         parsed_result = yaml.safe_load(result) if isinstance(result, str) else result
         assert "entities" in parsed_result
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -2009,7 +2091,7 @@ class TestGetEntityHopsAdditional:
         parsed_result = yaml.safe_load(result) if isinstance(result, str) else result
         assert "entities" in parsed_result
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -2032,7 +2114,7 @@ class TestGetEntityHopsAdditional:
         parsed_result = yaml.safe_load(result) if isinstance(result, str) else result
         assert "entities" in parsed_result
     
-    @patch("src.tools.entity.http_request", side_effect=Exception('{"errorMessage": "Entity not found"}'))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception('{"errorMessage": "Entity not found"}'))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -2048,7 +2130,7 @@ class TestGetEntityHopsAdditional:
         
         assert "error" in result
     
-    @patch("src.tools.entity.http_request", side_effect=Exception('400 Bad Request: {"errorMessage": "Invalid parameters"}'))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception('400 Bad Request: {"errorMessage": "Invalid parameters"}'))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -2065,7 +2147,7 @@ class TestGetEntityHopsAdditional:
         assert "error" in result
         assert result["error"]["code_key"] == "INVALID_REQUEST"
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -2098,7 +2180,7 @@ class TestGetEntityHopsAdditional:
         assert "crosswalks" in parsed_result["entities"][0]
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -2141,7 +2223,7 @@ class TestGetEntityParentsAdditional:
         assert "error" in result
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -2165,7 +2247,7 @@ class TestGetEntityParentsAdditional:
         parsed_result = yaml.safe_load(result) if isinstance(result, str) else result
         assert "parentPaths" in parsed_result
     
-    @patch("src.tools.entity.http_request", side_effect=Exception('{"errorCode": 119, "errorMessage": "Graph type not found"}'))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception('{"errorCode": 119, "errorMessage": "Graph type not found"}'))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -2185,7 +2267,7 @@ class TestGetEntityParentsAdditional:
         assert "error" in result
         assert result["error"]["code_key"] == "RESOURCE_NOT_FOUND"
     
-    @patch("src.tools.entity.http_request", side_effect=Exception('400 Bad Request: {"errorMessage": "Invalid select"}'))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception('400 Bad Request: {"errorMessage": "Invalid select"}'))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -2205,7 +2287,7 @@ class TestGetEntityParentsAdditional:
         assert "error" in result
         assert result["error"]["code_key"] == "INVALID_REQUEST"
     
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -2241,7 +2323,7 @@ class TestGetEntityParentsAdditional:
         assert "attributes" in parsed_result["entities"][entity_key]
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -12,7 +12,7 @@ class TestGetEntityInteractions:
     @patch("src.tools.interaction.get_reltio_url")
     @patch("src.tools.interaction.get_reltio_headers")
     @patch("src.tools.interaction.validate_connection_security")
-    @patch("src.tools.interaction.http_request")
+    @patch("src.tools.interaction.http_request_async")
     @patch("src.tools.interaction.simplify_reltio_attributes")
     @patch("src.tools.interaction.yaml.dump")
     @patch("src.tools.interaction.ActivityLog.execute_and_log_activity")
@@ -59,7 +59,7 @@ class TestGetEntityInteractions:
     @patch("src.tools.interaction.get_reltio_url")
     @patch("src.tools.interaction.get_reltio_headers")
     @patch("src.tools.interaction.validate_connection_security")
-    @patch("src.tools.interaction.http_request")
+    @patch("src.tools.interaction.http_request_async")
     @patch("src.tools.interaction.simplify_reltio_attributes")
     @patch("src.tools.interaction.yaml.dump")
     @patch("src.tools.interaction.ActivityLog.execute_and_log_activity")
@@ -122,7 +122,7 @@ class TestGetEntityInteractions:
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
         assert "Failed to authenticate with Reltio API" in result["error"]["message"]
 
-    @patch("src.tools.interaction.http_request", side_effect=Exception("404 Not Found"))
+    @patch("src.tools.interaction.http_request_async", side_effect=Exception("404 Not Found"))
     @patch("src.tools.interaction.validate_connection_security")
     @patch("src.tools.interaction.get_reltio_headers")
     @patch("src.tools.interaction.get_reltio_url")
@@ -141,7 +141,7 @@ class TestGetEntityInteractions:
         assert "Entity with ID" in result["error"]["message"]
         assert "not found or no interactions available" in result["error"]["message"]
 
-    @patch("src.tools.interaction.http_request", side_effect=Exception("Internal Server Error"))
+    @patch("src.tools.interaction.http_request_async", side_effect=Exception("Internal Server Error"))
     @patch("src.tools.interaction.validate_connection_security")
     @patch("src.tools.interaction.get_reltio_headers")
     @patch("src.tools.interaction.get_reltio_url")
@@ -166,7 +166,7 @@ class TestCreateInteractions:
     @patch("src.tools.interaction.get_reltio_url")
     @patch("src.tools.interaction.get_reltio_headers")
     @patch("src.tools.interaction.validate_connection_security")
-    @patch("src.tools.interaction.http_request")
+    @patch("src.tools.interaction.http_request_async")
     @patch("src.tools.interaction.yaml.dump")
     async def test_create_interactions_success(self, mock_dump, mock_http, mock_validate, mock_headers, mock_url, mock_request):
         # Setup test data
@@ -240,7 +240,7 @@ class TestCreateInteractions:
         assert result["error"]["code_key"] == "VALIDATION_ERROR"
         assert "Invalid input parameters" in result["error"]["message"]
 
-    @patch("src.tools.interaction.http_request", side_effect=Exception("400 Bad Request"))
+    @patch("src.tools.interaction.http_request_async", side_effect=Exception("400 Bad Request"))
     @patch("src.tools.interaction.validate_connection_security")
     @patch("src.tools.interaction.get_reltio_headers")
     @patch("src.tools.interaction.get_reltio_url")
@@ -255,7 +255,7 @@ class TestCreateInteractions:
         assert result["error"]["code_key"] == "BAD_REQUEST"
         assert "Invalid interaction data provided" in result["error"]["message"]
 
-    @patch("src.tools.interaction.http_request", side_effect=Exception("409 Conflict - duplicate crosswalk"))
+    @patch("src.tools.interaction.http_request_async", side_effect=Exception("409 Conflict - duplicate crosswalk"))
     @patch("src.tools.interaction.validate_connection_security")
     @patch("src.tools.interaction.get_reltio_headers")
     @patch("src.tools.interaction.get_reltio_url")
@@ -284,7 +284,7 @@ class TestCreateInteractions:
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
         assert "Failed to authenticate with Reltio API" in result["error"]["message"]
 
-    @patch("src.tools.interaction.http_request", side_effect=Exception("404 Not Found"))
+    @patch("src.tools.interaction.http_request_async", side_effect=Exception("404 Not Found"))
     @patch("src.tools.interaction.validate_connection_security")
     @patch("src.tools.interaction.get_reltio_headers")
     @patch("src.tools.interaction.get_reltio_url")
@@ -12,7 +12,7 @@ class TestRdmLookupsList:
     
     @patch("src.tools.lookup.ActivityLog.execute_and_log_activity")
     @patch("src.tools.lookup.yaml.dump")
-    @patch("src.tools.lookup.http_request")
+    @patch("src.tools.lookup.http_request_async")
     @patch("src.tools.lookup.validate_connection_security")
     @patch("src.tools.lookup.get_reltio_headers")
     @patch("src.tools.lookup.get_reltio_url")
@@ -40,7 +40,7 @@ class TestRdmLookupsList:
 
     @patch("src.tools.lookup.ActivityLog.execute_and_log_activity")
     @patch("src.tools.lookup.yaml.dump")
-    @patch("src.tools.lookup.http_request")
+    @patch("src.tools.lookup.http_request_async")
     @patch("src.tools.lookup.validate_connection_security")
     @patch("src.tools.lookup.get_reltio_headers")
     @patch("src.tools.lookup.get_reltio_url")
@@ -67,7 +67,7 @@ class TestRdmLookupsList:
 
     @patch("src.tools.lookup.ActivityLog.execute_and_log_activity")
     @patch("src.tools.lookup.yaml.dump")
-    @patch("src.tools.lookup.http_request")
+    @patch("src.tools.lookup.http_request_async")
     @patch("src.tools.lookup.validate_connection_security")
     @patch("src.tools.lookup.get_reltio_headers")
     @patch("src.tools.lookup.get_reltio_url")
@@ -92,7 +92,7 @@ class TestRdmLookupsList:
 
     @patch("src.tools.lookup.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
     @patch("src.tools.lookup.yaml.dump")
-    @patch("src.tools.lookup.http_request")
+    @patch("src.tools.lookup.http_request_async")
     @patch("src.tools.lookup.validate_connection_security")
     @patch("src.tools.lookup.get_reltio_headers")
     @patch("src.tools.lookup.get_reltio_url")
@@ -137,7 +137,7 @@ class TestRdmLookupsList:
         result = await rdm_lookups_list(LOOKUP_TYPE, TENANT_ID, 10, "")
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.lookup.http_request", side_effect=Exception("API error"))
+    @patch("src.tools.lookup.http_request_async", side_effect=Exception("API error"))
     @patch("src.tools.lookup.validate_connection_security")
     @patch("src.tools.lookup.get_reltio_headers")
     @patch("src.tools.lookup.get_reltio_url")
@@ -161,7 +161,7 @@ class TestRdmLookupsList:
 
     @patch("src.tools.lookup.ActivityLog.execute_and_log_activity")
     @patch("src.tools.lookup.yaml.dump")
-    @patch("src.tools.lookup.http_request")
+    @patch("src.tools.lookup.http_request_async")
     @patch("src.tools.lookup.validate_connection_security")
     @patch("src.tools.lookup.get_reltio_headers")
     @patch("src.tools.lookup.get_reltio_url")
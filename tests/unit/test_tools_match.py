@@ -1,3 +1,4 @@
+import httpx
 import pytest
 import pytest_asyncio
 from unittest.mock import patch, MagicMock
@@ -7,7 +8,8 @@ from src.tools.match import (
     get_total_matches, 
     get_total_matches_by_entity_type,
     find_potential_matches,
-    get_potential_match_apis
+    get_potential_match_apis,
+    _count_cache
 )
 
 @pytest_asyncio.fixture(autouse=True)
@@ -19,8 +21,9 @@ def mock_dependencies():
          patch("src.tools.match.get_reltio_headers") as mock_get_headers, \
          patch("src.tools.match.get_reltio_url") as mock_get_url, \
          patch("src.tools.match.validate_connection_security") as mock_validate_security, \
-         patch("src.tools.match.http_request") as mock_http_request, \
-         patch("src.tools.match.create_error_response") as mock_create_error_response:
+         patch("src.tools.match.http_request_async") as mock_http_request_async, \
+         patch("src.tools.match.create_error_response") as mock_create_error_response, \
+         patch("src.tools.match.ActivityLog.execute_and_log_activity") as mock_log_activity:
 
         mock_match_score_request.return_value = MagicMock()
         mock_confidence_request.return_value = MagicMock()
@@ -29,8 +32,9 @@ def mock_dependencies():
         mock_get_headers.return_value = {"Authorization": "Bearer token"}
         mock_get_url.return_value = "https://reltio.com/entities/_search"
         mock_validate_security.return_value = None
-        mock_http_request.return_value = [{"result": "some result"}]
+        mock_http_request_async.return_value = [{"result": "some result"}]
         mock_create_error_response.side_effect = lambda code, msg: {"error": code, "message": msg}
+        _count_cache.clear()
 
         yield {
             "match_score_request": mock_match_score_request,
@@ -40,8 +44,9 @@ def mock_dependencies():
             "get_headers": mock_get_headers,
             "get_url": mock_get_url,
             "validate_security": mock_validate_security,
-            "http_request": mock_http_request,
+            "http_request_async": mock_http_request_async,
             "create_error_response": mock_create_error_response,
+            "log_activity": mock_log_activity,
         }
 
 @pytest.mark.asyncio
@@ -50,16 +55,64 @@ async def test_find_matches_by_match_score_success(mock_dependencies):
     mock_dependencies["match_score_request"].return_value.max_results = 10
     mock_dependencies["match_score_request"].return_value.offset = 0
     # Mock http_request to return a list of dicts as expected
-    mock_dependencies["http_request"].return_value = [
+    mock_dependencies["http_request_async"].return_value = [
         {"uri": "entities/1", "label": "Entity 1", "type": "Individual"},
         {"uri": "entities/2", "label": "Entity 2", "type": "Individual"}
     ]
     result = await find_matches_by_match_score(10, 90)
-    if isinstance(result, str):
-        import yaml
-        result = yaml.safe_load(result)
-    assert isinstance(result, list)
-    assert all("uri" in r and "label" in r and "type" in r for r in result)
+    assert isinstance(result, dict)
+    assert all("uri" in r and "label" in r and "type" in r for r in result["matches"])
+
+@pytest.mark.asyncio
+async def test_find_matches_by_confidence_escapes_filter_values(mock_dependencies):
+    request = mock_dependencies["confidence_request"].return_value
+    request.entity_type = "O'Type"
+    request.confidence_level = "High') or (true"
+    request.max_results = 10
+    request.offset = 0
+    mock_dependencies["http_request_async"].return_value = []
+    
+    await find_matches_by_confidence("High') or (true", "O'Type")
+    
+    payload = mock_dependencies["http_request_async"].call_args.kwargs["data"]
+    assert payload["filter"] == (
+        "(equals(type,'configuration/entityTypes/O\\'Type') and "
+        "equals(relevanceScores.actionLabel,'High\\') or (true'))"
+    )
+
+@pytest.mark.asyncio
+async def test_find_matches_by_match_score_payload(mock_dependencies):
+    request = mock_dependencies["match_score_request"].return_value
+    request.start_match_score = 10
+    request.end_match_score = 90
+    request.entity_type = "Individual"
+    request.max_results = 10
+    request.offset = 5
+    mock_dependencies["http_request_async"].return_value = []
+
+    await find_matches_by_match_score(10, 90)
+
+    payload = mock_dependencies["http_request_async"].call_args.kwargs["data"]
+    assert payload == {
+        "filter": "(range(potentialMatches.matchScore,10,90) and equals(type,'configuration/entityTypes/Individual')",
+        "select": "uri,label,type,relevanceScores",
+        "max": 10,
+        "offset": 5,
+        "scoreEnabled": False,
+        "options": "ovOnly",
+        "activeness": "active"
+    }
+
+@pytest.mark.asyncio
+async def test_find_matches_by_match_score_security_error_skips_auth(mock_dependencies):
+    from src.util.exceptions import SecurityError
+    mock_dependencies["validate_security"].side_effect = SecurityError("Insecure connection")
+
+    result = await find_matches_by_match_score(10, 90)
+
+    assert result["error"] == "SECURITY_ERROR"
+    mock_dependencies["get_headers"].assert_not_called()
+    mock_dependencies["http_request_async"].assert_not_called()
 
 @pytest.mark.asyncio
 async def test_find_matches_by_match_score_validation_error(mock_dependencies):
@@ -73,16 +126,27 @@ async def test_find_matches_by_confidence_success(mock_dependencies):
     mock_dependencies["confidence_request"].return_value.max_results = 10
     mock_dependencies["confidence_request"].return_value.offset = 0
     # Mock http_request to return a list of dicts as expected
-    mock_dependencies["http_request"].return_value = [
+    mock_dependencies["http_request_async"].return_value = [
         {"uri": "entities/1", "label": "Entity 1", "type": "Individual"},
         {"uri": "entities/2", "label": "Entity 2", "type": "Individual"}
     ]
     result = await find_matches_by_confidence("High confidence")
-    if isinstance(result, str):
-        import yaml
-        result = yaml.safe_load(result)
-    assert isinstance(result, list)
-    assert all("uri" in r and "label" in r and "type" in r for r in result)
+    assert isinstance(result, dict)
+    assert all("uri" in r and "label" in r and "type" in r for r in result["matches"])
+
+@pytest.mark.asyncio
+async def test_find_matches_by_confidence_filter(mock_dependencies):
+    request = mock_dependencies["confidence_request"].return_value
+    request.entity_type = "Individual"
+    request.confidence_level = "High confidence"
+    request.max_results = 10
+    request.offset = 0
+    mock_dependencies["http_request_async"].return_value = []
+
+    await find_matches_by_confidence("High confidence")
+
+    payload = mock_dependencies["http_request_async"].call_args.kwargs["data"]
+    assert payload["filter"] == "(equals(type,'configuration/entityTypes/Individual') and equals(relevanceScores.actionLabel,'High confidence'))"
 
 @pytest.mark.asyncio
 async def test_find_matches_by_confidence_validation_error(mock_dependencies):
@@ -95,7 +159,7 @@ async def test_find_matches_by_confidence_no_results(mock_dependencies):
     # Patch the ConfidenceLevelRequest to return a real object with int fields
     mock_dependencies["confidence_request"].return_value.max_results = 10
     mock_dependencies["confidence_request"].return_value.offset = 0
-    mock_dependencies["http_request"].return_value = []
+    mock_dependencies["http_request_async"].return_value = []
 
     result = await find_matches_by_confidence("Low confidence")
     if isinstance(result, str):
@@ -106,14 +170,14 @@ async def test_find_matches_by_confidence_no_results(mock_dependencies):
 
 @pytest.mark.asyncio
 async def test_find_matches_by_match_score_http_exception(mock_dependencies):
-    mock_dependencies["http_request"].side_effect = Exception("HTTP failed")
+    mock_dependencies["http_request_async"].side_effect = httpx.ConnectError("HTTP failed")
     result = await find_matches_by_match_score()
     assert result["error"] == "SERVER_ERROR"
 
 @pytest.mark.asyncio
 async def test_get_total_matches_success(mock_dependencies):
     # Configure the mock to return a specific response for total matches
-    mock_dependencies["http_request"].return_value = {"total": 1114}
+    mock_dependencies["http_request_async"].return_value = {"total": 1114}
     mock_dependencies["get_url"].return_value = "https://reltio.com/entities/_total"
     
     # Configure the min_matches property on the request mock
@@ -131,7 +195,7 @@ async def test_get_total_matches_success(mock_dependencies):
 @pytest.mark.asyncio
 async def test_get_total_matches_with_filter(mock_dependencies):
     # Configure the mock to return a specific response
-    mock_dependencies["http_request"].return_value = {"total": 500}
+    mock_dependencies["http_request_async"].return_value = {"total": 500}
     mock_dependencies["get_url"].return_value = "https://reltio.com/entities/_total"
     
     # Set the expected request object properties
@@ -141,7 +205,7 @@ async def test_get_total_matches_with_filter(mock_dependencies):
     result = await get_total_matches(5)
     
     # Assert the payload contains the correct filter
-    mock_dependencies["http_request"].assert_called_once()
+    mock_dependencies["http_request_async"].assert_called_once()
     assert "total" in result
     assert result["total"] == 500
     assert result["min_matches"] == 5
@@ -161,7 +225,7 @@ async def test_get_total_matches_validation_error(mock_dependencies):
 @pytest.mark.asyncio
 async def test_get_total_matches_api_error(mock_dependencies):
     # Configure the mock to return an invalid response
-    mock_dependencies["http_request"].return_value = {"not_total": "missing total field"}
+    mock_dependencies["http_request_async"].return_value = {"not_total": "missing total field"}
     
     # Call the function
     result = await get_total_matches(0)
@@ -173,7 +237,7 @@ async def test_get_total_matches_api_error(mock_dependencies):
 @pytest.mark.asyncio
 async def test_get_total_matches_http_exception(mock_dependencies):
     # Configure the mock to raise an exception
-    mock_dependencies["http_request"].side_effect = Exception("HTTP failed")
+    mock_dependencies["http_request_async"].side_effect = httpx.ConnectError("HTTP failed")
     
     # Call the function
     result = await get_total_matches(0)
@@ -182,10 +246,58 @@ async def test_get_total_matches_http_exception(mock_dependencies):
     assert result["error"] == "SERVER_ERROR"
     assert "Failed to retrieve total matches count" in result["message"]
 
+@pytest.mark.asyncio
+async def test_get_total_matches_unexpected_error_not_reported_as_api_error(mock_dependencies):
+    mock_dependencies["http_request_async"].side_effect = RuntimeError("bug")
+    
+    result = await get_total_matches(0)
+    
+    assert result["error"] == "SERVER_ERROR"
+    assert "unexpected error" in result["message"]
+
+@pytest.mark.asyncio
+async def test_get_total_matches_served_from_cache(mock_dependencies):
+    mock_dependencies["http_request_async"].return_value = {"total": 42}
+    mock_dependencies["total_matches_request"].return_value.min_matches = 0
+    
+    first = await get_total_matches(0)
+    first["total"] = 0
+    second = await get_total_matches(0)
+    
+    assert second["total"] == 42
+    mock_dependencies["http_request_async"].assert_called_once()
+    # The cached count is still recorded in the activity log
+    assert mock_dependencies["log_activity"].call_count == 2
+
+@pytest.mark.asyncio
+async def test_get_total_matches_error_not_cached(mock_dependencies):
+    mock_dependencies["http_request_async"].side_effect = [httpx.ConnectError("HTTP failed"), {"total": 7}]
+    mock_dependencies["total_matches_request"].return_value.min_matches = 0
+    
+    first = await get_total_matches(0)
+    second = await get_total_matches(0)
+    
+    assert first["error"] == "SERVER_ERROR"
+    assert second["total"] == 7
+    assert mock_dependencies["http_request_async"].call_count == 2
+
+@pytest.mark.asyncio
+async def test_get_total_matches_by_entity_type_served_from_cache(mock_dependencies):
+    mock_dependencies["http_request_async"].return_value = {"type": [{"value": "Individual", "count": 3}]}
+    mock_dependencies["match_facets_request"].return_value.min_matches = 0
+    
+    first = await get_total_matches_by_entity_type(0)
+    first["type_counts"].clear()
+    result = await get_total_matches_by_entity_type(0)
+    
+    assert result["type_counts"] == [{"value": "Individual", "count": 3}]
+    mock_dependencies["http_request_async"].assert_called_once()
+    assert mock_dependencies["log_activity"].call_count == 2
+
 @pytest.mark.asyncio
 async def test_get_total_matches_by_entity_type_success(mock_dependencies):
     # Configure the mock to return a specific response for facets
-    mock_dependencies["http_request"].return_value = {"type": {"Individual": 56, "Organization": 1058}}
+    mock_dependencies["http_request_async"].return_value = {"type": {"Individual": 56, "Organization": 1058}}
     mock_dependencies["get_url"].return_value = "https://reltio.com/entities/_facets"
     
     # Configure the min_matches property on the request mock
@@ -203,7 +315,7 @@ async def test_get_total_matches_by_entity_type_success(mock_dependencies):
 @pytest.mark.asyncio
 async def test_get_total_matches_by_entity_type_with_filter(mock_dependencies):
     # Configure the mock to return a specific response
-    mock_dependencies["http_request"].return_value = {"type": {"Individual": 20, "Organization": 500}}
+    mock_dependencies["http_request_async"].return_value = {"type": {"Individual": 20, "Organization": 500}}
     mock_dependencies["get_url"].return_value = "https://reltio.com/entities/_facets"
     
     # Set the expected request object properties
@@ -213,7 +325,7 @@ async def test_get_total_matches_by_entity_type_with_filter(mock_dependencies):
     result = await get_total_matches_by_entity_type(5)
     
     # Assert the http_request was called with correct parameters
-    mock_dependencies["http_request"].assert_called_once()
+    mock_dependencies["http_request_async"].assert_called_once()
     assert "type_counts" in result
     assert result["type_counts"] == {"Individual": 20, "Organization": 500}
     assert result["min_matches"] == 5
@@ -233,7 +345,7 @@ async def test_get_total_matches_by_entity_type_validation_error(mock_dependenci
 @pytest.mark.asyncio
 async def test_get_total_matches_by_entity_type_api_error(mock_dependencies):
     # Configure the mock to return an invalid response
-    mock_dependencies["http_request"].return_value = {"not_type": "missing type field"}
+    mock_dependencies["http_request_async"].return_value = {"not_type": "missing type field"}
     
     # Call the function
     result = await get_total_matches_by_entity_type(0)
@@ -245,7 +357,7 @@ async def test_get_total_matches_by_entity_type_api_error(mock_dependencies):
 @pytest.mark.asyncio
 async def test_get_total_matches_by_entity_type_http_exception(mock_dependencies):
     # Configure the mock to raise an exception
-    mock_dependencies["http_request"].side_effect = Exception("HTTP failed")
+    mock_dependencies["http_request_async"].side_effect = httpx.ConnectError("HTTP failed")
     
     # Call the function
     result = await get_total_matches_by_entity_type(0)
@@ -260,7 +372,26 @@ class TestFindPotentialMatches:
     """Test suite for find_potential_matches function"""
     
     @patch("src.tools.match.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.match.http_request")
+    @patch("src.tools.match.http_request_async")
+    @patch("src.tools.match.validate_connection_security")
+    @patch("src.tools.match.get_reltio_headers")
+    @patch("src.tools.match.get_reltio_url")
+    async def test_find_potential_matches_escapes_quoted_values(self, mock_get_url, mock_headers, mock_validate, mock_http, mock_activity_log):
+        """Test quotes in the confidence label and entity type cannot close the filter literals"""
+        mock_get_url.return_value = "https://api/entities/_search"
+        mock_headers.return_value = {"Authorization": "Bearer token"}
+        mock_http.return_value = []
+        
+        await find_potential_matches("confidence", "High') or (true", "O'Type", "test-tenant", 10, 0, "")
+        
+        payload = mock_http.call_args.kwargs["data"]
+        assert payload["filter"] == (
+            "(equals(relevanceScores.actionLabel,'High\\') or (true') and "
+            "equals(type,'configuration/entityTypes/O\\'Type'))"
+        )
+    
+    @patch("src.tools.match.ActivityLog.execute_and_log_activity")
+    @patch("src.tools.match.http_request_async")
     @patch("src.tools.match.validate_connection_security")
     @patch("src.tools.match.get_reltio_headers")
     @patch("src.tools.match.get_reltio_url")
@@ -290,7 +421,7 @@ class TestFindPotentialMatches:
         assert parsed_result[0]["uri"] == "entities/123"
     
     @patch("src.tools.match.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.match.http_request")
+    @patch("src.tools.match.http_request_async")
     @patch("src.tools.match.validate_connection_security")
     @patch("src.tools.match.get_reltio_headers")
     @patch("src.tools.match.get_reltio_url")
@@ -336,7 +467,7 @@ class TestFindPotentialMatches:
             # Nested dict error format
             assert result["error"]["code_key"] == "VALIDATION_ERROR"
     
-    @patch("src.tools.match.http_request")
+    @patch("src.tools.match.http_request_async")
     @patch("src.tools.match.validate_connection_security")
     @patch("src.tools.match.get_reltio_headers")
     @patch("src.tools.match.get_reltio_url")
@@ -368,7 +499,7 @@ class TestGetPotentialMatchApis:
     """Test suite for get_potential_match_apis function"""
     
     @patch("src.tools.match.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.match.http_request")
+    @patch("src.tools.match.http_request_async")
     @patch("src.tools.match.validate_connection_security")
     @patch("src.tools.match.get_reltio_headers")
     @patch("src.tools.match.get_reltio_url")
@@ -418,7 +549,7 @@ class TestGetPotentialMatchApis:
             # Nested dict error format
             assert result["error"]["code_key"] == "VALIDATION_ERROR"
     
-    @patch("src.tools.match.http_request", side_effect=Exception("HTTP Error"))
+    @patch("src.tools.match.http_request_async", side_effect=Exception("HTTP Error"))
     @patch("src.tools.match.validate_connection_security")
     @patch("src.tools.match.get_reltio_headers")
     @patch("src.tools.match.get_reltio_url")
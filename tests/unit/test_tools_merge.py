@@ -1,6 +1,7 @@
 import pytest
 import yaml
 from unittest.mock import patch, MagicMock
+from src.util.exceptions import ReltioHTTPError
 from src.tools.entity import (
     unmerge_entity_by_contributor,
     unmerge_entity_tree_by_contributor,
@@ -85,7 +86,7 @@ MOCK_UNMERGE_RESPONSE_WITH_NULL_FIELDS = {
 @pytest.mark.asyncio
 class TestUnmergeEntityByContributor:
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_unmerge_entity_by_contributor_success(self, mock_validate, mock_headers, mock_request):
@@ -117,33 +118,33 @@ class TestUnmergeEntityByContributor:
         assert isinstance(result, dict)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_unmerge_entity_by_contributor_404_error(self, mock_validate, mock_headers, mock_request):
         """Test 404 error handling"""
         mock_headers.return_value = {"Authorization": "Bearer token"}
-        mock_request.side_effect = Exception("404 Not Found")
+        mock_request.side_effect = ReltioHTTPError(404, "Not Found")
         
         result = await unmerge_entity_by_contributor(ORIGIN_ENTITY_ID, CONTRIBUTOR_ENTITY_ID, TENANT_ID)
         
         assert isinstance(result, dict)
         assert result["error"]["code_key"] == "RESOURCE_NOT_FOUND"
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_unmerge_entity_by_contributor_400_error(self, mock_validate, mock_headers, mock_request):
         """Test 400 error handling"""
         mock_headers.return_value = {"Authorization": "Bearer token"}
-        mock_request.side_effect = Exception("400 Bad Request")
+        mock_request.side_effect = ReltioHTTPError(400, "Bad Request")
         
         result = await unmerge_entity_by_contributor(ORIGIN_ENTITY_ID, CONTRIBUTOR_ENTITY_ID, TENANT_ID)
         
         assert isinstance(result, dict)
         assert result["error"]["code_key"] == "INVALID_REQUEST"
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_unmerge_entity_by_contributor_general_error(self, mock_validate, mock_headers, mock_request):
@@ -163,7 +164,7 @@ class TestUnmergeEntityByContributor:
         assert isinstance(result, dict)
         assert result["error"]["code_key"] == "VALIDATION_ERROR"
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_unmerge_entity_by_contributor_with_missing_fields(self, mock_validate, mock_headers, mock_request):
@@ -180,7 +181,7 @@ class TestUnmergeEntityByContributor:
         assert parsed_result["a"]["uri"] == f"entities/{ORIGIN_ENTITY_ID}"
         assert parsed_result["b"]["uri"] == f"entities/{CONTRIBUTOR_ENTITY_ID}"
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_unmerge_entity_by_contributor_with_null_fields(self, mock_validate, mock_headers, mock_request):
@@ -201,7 +202,7 @@ class TestUnmergeEntityByContributor:
 @pytest.mark.asyncio
 class TestUnmergeEntityTreeByContributor:
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_unmerge_entity_tree_by_contributor_success(self, mock_validate, mock_headers, mock_request):
@@ -235,33 +236,33 @@ class TestUnmergeEntityTreeByContributor:
         assert isinstance(result, dict)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_unmerge_entity_tree_by_contributor_404_error(self, mock_validate, mock_headers, mock_request):
         """Test 404 error handling"""
         mock_headers.return_value = {"Authorization": "Bearer token"}
-        mock_request.side_effect = Exception("404 Not Found")
+        mock_request.side_effect = ReltioHTTPError(404, "Not Found")
         
         result = await unmerge_entity_tree_by_contributor(ORIGIN_ENTITY_ID, CONTRIBUTOR_ENTITY_ID, TENANT_ID)
         
         assert isinstance(result, dict)
         assert result["error"]["code_key"] == "RESOURCE_NOT_FOUND"
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_unmerge_entity_tree_by_contributor_400_error(self, mock_validate, mock_headers, mock_request):
         """Test 400 error handling"""
         mock_headers.return_value = {"Authorization": "Bearer token"}
-        mock_request.side_effect = Exception("400 Bad Request")
+        mock_request.side_effect = ReltioHTTPError(400, "Bad Request")
         
         result = await unmerge_entity_tree_by_contributor(ORIGIN_ENTITY_ID, CONTRIBUTOR_ENTITY_ID, TENANT_ID)
         
         assert isinstance(result, dict)
         assert result["error"]["code_key"] == "INVALID_REQUEST"
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_unmerge_entity_tree_by_contributor_general_error(self, mock_validate, mock_headers, mock_request):
@@ -281,7 +282,7 @@ class TestUnmergeEntityTreeByContributor:
         assert isinstance(result, dict)
         assert result["error"]["code_key"] == "VALIDATION_ERROR"
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.validate_connection_security")
     async def test_unmerge_entity_tree_by_contributor_with_params(self, mock_validate, mock_headers, mock_request):
@@ -324,7 +325,7 @@ class TestUnmergeValidation:
 @pytest.mark.asyncio
 class TestMergeEntities:
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -365,7 +366,7 @@ class TestMergeEntities:
 class TestExportMergeTree:
     
     @patch("src.tools.entity.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -381,7 +382,7 @@ class TestExportMergeTree:
         assert parsed_result["status"] == "success"
         assert parsed_result["jobId"] == "job123"
 
-    @patch("src.tools.entity.http_request")
+    @patch("src.tools.entity.http_request_async")
     @patch("src.tools.entity.validate_connection_security", side_effect=Exception("Auth failed"))
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
@@ -389,7 +390,7 @@ class TestExportMergeTree:
         result = await export_merge_tree("test@example.com", TENANT_ID)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.entity.http_request", side_effect=Exception("Internal Server Error"))
+    @patch("src.tools.entity.http_request_async", side_effect=Exception("Internal Server Error"))
     @patch("src.tools.entity.validate_connection_security")
     @patch("src.tools.entity.get_reltio_headers")
     @patch("src.tools.entity.get_reltio_url")
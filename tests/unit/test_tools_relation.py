@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import patch, MagicMock
+from src.util.exceptions import ReltioHTTPError
 from src.tools.relation import (
     get_relation_details,
     create_relationships,
@@ -14,7 +15,7 @@ async def test_get_relation_details_success():
          patch("src.tools.relation.get_reltio_url") as mock_url, \
          patch("src.tools.relation.get_reltio_headers") as mock_headers, \
          patch("src.tools.relation.validate_connection_security") as mock_validate, \
-         patch("src.tools.relation.http_request") as mock_http:
+         patch("src.tools.relation.http_request_async") as mock_http:
 
         mock_request.return_value = MagicMock(relation_id="rel123", tenant_id="tenant")
         mock_url.return_value = "https://reltio.com/relations/rel123"
@@ -22,11 +23,28 @@ async def test_get_relation_details_success():
         mock_http.return_value = {"id": "rel123", "type": "relation", "attributes": {}}
 
         result = await get_relation_details("rel123", "tenant")
-        import yaml
-        if isinstance(result, str):
-            result = yaml.safe_load(result)
+        assert isinstance(result, dict)
         assert result["id"] == "rel123"
 
+@pytest.mark.asyncio
+async def test_get_relation_details_without_attributes():
+    with patch("src.tools.relation.RelationIdRequest") as mock_request, \
+         patch("src.tools.relation.get_reltio_url") as mock_url, \
+         patch("src.tools.relation.get_reltio_headers") as mock_headers, \
+         patch("src.tools.relation.validate_connection_security"), \
+         patch("src.tools.relation.ActivityLog.execute_and_log_activity"), \
+         patch("src.tools.relation.simplify_reltio_attributes") as mock_simplify, \
+         patch("src.tools.relation.http_request_async") as mock_http:
+
+        mock_request.return_value = MagicMock(relation_id="rel123", tenant_id="tenant")
+        mock_url.return_value = "https://reltio.com/relations/rel123"
+        mock_headers.return_value = {"Authorization": "Bearer token"}
+        mock_http.return_value = {"uri": "relations/rel123", "type": "configuration/relationTypes/HasAddress"}
+
+        result = await get_relation_details("rel123", "tenant")
+        assert result == {"uri": "relations/rel123", "type": "configuration/relationTypes/HasAddress"}
+        mock_simplify.assert_not_called()
+
 @pytest.mark.asyncio
 async def test_get_relation_details_validation_error():
     with patch("src.tools.relation.RelationIdRequest", side_effect=ValueError("Invalid ID")), \
@@ -56,7 +74,7 @@ async def test_get_relation_details_404_not_found():
          patch("src.tools.relation.get_reltio_url"), \
          patch("src.tools.relation.get_reltio_headers"), \
          patch("src.tools.relation.validate_connection_security"), \
-         patch("src.tools.relation.http_request", side_effect=Exception("404 Not Found")), \
+         patch("src.tools.relation.http_request_async", side_effect=ReltioHTTPError(404, "Not Found")), \
          patch("src.tools.relation.create_error_response") as mock_create_error:
 
         mock_request.return_value = MagicMock(relation_id="rel123", tenant_id="tenant")
@@ -71,7 +89,7 @@ async def test_get_relation_details_generic_server_error():
          patch("src.tools.relation.get_reltio_url"), \
          patch("src.tools.relation.get_reltio_headers"), \
          patch("src.tools.relation.validate_connection_security"), \
-         patch("src.tools.relation.http_request", side_effect=Exception("Some API error")), \
+         patch("src.tools.relation.http_request_async", side_effect=Exception("Some API error")), \
          patch("src.tools.relation.create_error_response") as mock_create_error:
 
         mock_request.return_value = MagicMock(relation_id="rel123", tenant_id="tenant")
@@ -110,7 +128,7 @@ class TestCreateRelationships:
 
     @patch("src.tools.relation.ActivityLog.execute_and_log_activity")
     @patch("src.tools.relation.yaml.dump")
-    @patch("src.tools.relation.http_request")
+    @patch("src.tools.relation.http_request_async")
     @patch("src.tools.relation.validate_connection_security")
     @patch("src.tools.relation.get_reltio_headers")
     @patch("src.tools.relation.get_reltio_url")
@@ -165,7 +183,7 @@ class TestCreateRelationships:
         result = await create_relationships(self.SAMPLE_RELATIONS, tenant_id=self.TENANT_ID)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.relation.http_request", side_effect=Exception("API error"))
+    @patch("src.tools.relation.http_request_async", side_effect=Exception("API error"))
     @patch("src.tools.relation.validate_connection_security")
     @patch("src.tools.relation.get_reltio_headers")
     @patch("src.tools.relation.get_reltio_url")
@@ -189,7 +207,7 @@ class TestDeleteRelation:
     TENANT_ID = "test-tenant"
 
     @patch("src.tools.relation.yaml.dump")
-    @patch("src.tools.relation.http_request")
+    @patch("src.tools.relation.http_request_async")
     @patch("src.tools.relation.validate_connection_security")
     @patch("src.tools.relation.get_reltio_headers")
     @patch("src.tools.relation.get_reltio_url")
@@ -226,7 +244,7 @@ class TestDeleteRelation:
         
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.relation.http_request", side_effect=Exception("404 Not Found"))
+    @patch("src.tools.relation.http_request_async", side_effect=Exception("404 Not Found"))
     @patch("src.tools.relation.validate_connection_security")
     @patch("src.tools.relation.get_reltio_headers")
     @patch("src.tools.relation.get_reltio_url")
@@ -250,7 +268,7 @@ class TestGetEntityRelations:
 
     @patch("src.tools.relation.ActivityLog.execute_and_log_activity")
     @patch("src.tools.relation.yaml.dump")
-    @patch("src.tools.relation.http_request")
+    @patch("src.tools.relation.http_request_async")
     @patch("src.tools.relation.validate_connection_security")
     @patch("src.tools.relation.get_reltio_headers")
     @patch("src.tools.relation.get_reltio_url")
@@ -298,7 +316,7 @@ class TestGetEntityRelations:
         result = await get_entity_relations(self.ENTITY_ID, self.ENTITY_TYPES, tenant_id=self.TENANT_ID)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.relation.http_request", side_effect=Exception("API error"))
+    @patch("src.tools.relation.http_request_async", side_effect=Exception("API error"))
     @patch("src.tools.relation.validate_connection_security")
     @patch("src.tools.relation.get_reltio_headers")
     @patch("src.tools.relation.get_reltio_url")
@@ -322,7 +340,7 @@ class TestSearchRelations:
 
     @patch("src.tools.relation.ActivityLog.execute_and_log_activity")
     @patch("src.tools.relation.yaml.dump")
-    @patch("src.tools.relation.http_request")
+    @patch("src.tools.relation.http_request_async")
     @patch("src.tools.relation.validate_connection_security")
     @patch("src.tools.relation.get_reltio_headers")
     @patch("src.tools.relation.get_reltio_url")
@@ -364,7 +382,7 @@ class TestSearchRelations:
         result = await search_relations(tenant_id=self.TENANT_ID)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.relation.http_request", side_effect=Exception("API error"))
+    @patch("src.tools.relation.http_request_async", side_effect=Exception("API error"))
     @patch("src.tools.relation.validate_connection_security")
     @patch("src.tools.relation.get_reltio_headers")
     @patch("src.tools.relation.get_reltio_url")
@@ -1,6 +1,17 @@
+import asyncio
 import pytest
+import yaml
 from unittest.mock import patch, MagicMock
-from src.tools.search import search_entities
+from src.tools.search import search_entities, _search_cache
+from src.util.cache import invalidate_tenant
+from src.util.models import EntitySearchRequest
+
+
+@pytest.fixture(autouse=True)
+def clear_search_cache():
+    _search_cache.clear()
+    yield
+    _search_cache.clear()
 
 @pytest.mark.asyncio
 async def test_search_entities_success_with_query_and_type():
@@ -8,7 +19,7 @@ async def test_search_entities_success_with_query_and_type():
          patch("src.tools.search.get_reltio_url") as mock_url, \
          patch("src.tools.search.get_reltio_headers") as mock_headers, \
          patch("src.tools.search.validate_connection_security"), \
-         patch("src.tools.search.http_request") as mock_http, \
+         patch("src.tools.search.http_request_async") as mock_http, \
          patch("src.tools.search.ActivityLog.execute_and_log_activity"), \
          patch("src.tools.search.yaml.dump") as mock_yaml_dump:
 
@@ -38,6 +49,85 @@ async def test_search_entities_success_with_query_and_type():
         result = await search_entities("containsWordStartingWith(attributes,'John')", "Individual", "tenant123", 10)
         assert result == "mocked_yaml_output"
 
+@pytest.mark.asyncio
+async def test_concurrent_identical_searches_share_one_request():
+    async def slow_search(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return [{"uri": "entities/1", "label": "John Doe"}]
+
+    with patch("src.tools.search.get_reltio_url", return_value="https://reltio.com/entities/_search"), \
+         patch("src.tools.search.get_reltio_headers", return_value={"Authorization": "Bearer token"}), \
+         patch("src.tools.search.validate_connection_security"), \
+         patch("src.tools.search.http_request_async", side_effect=slow_search) as mock_http, \
+         patch("src.tools.search.ActivityLog.execute_and_log_activity"):
+
+        results = await asyncio.gather(*[search_entities("equals(type,'configuration/entityTypes/Individual')", tenant_id="tenant123") for _ in range(3)])
+
+        assert len(set(results)) == 1
+        mock_http.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_search_entities_selected_fields_per_entity():
+    with patch("src.tools.search.get_reltio_url", return_value="https://reltio.com/entities/_search"), \
+         patch("src.tools.search.get_reltio_headers", return_value={"Authorization": "Bearer token"}), \
+         patch("src.tools.search.validate_connection_security"), \
+         patch("src.tools.search.http_request_async") as mock_http, \
+         patch("src.tools.search.simplify_reltio_attributes", side_effect=lambda _: {"FirstName": "John"}) as mock_simplify, \
+         patch("src.tools.search.ActivityLog.execute_and_log_activity"):
+        mock_http.return_value = [
+            {"uri": "entities/1", "label": "John Doe", "type": "Individual", "attributes": {}},
+            {"uri": "entities/2", "label": "Jane Doe", "type": "Individual", "attributes": {}}
+        ]
+
+        result = await search_entities(tenant_id="tenant123", select="uri,attributes.FirstName,label,attributes.LastName,type")
+
+        # Keys keep the order of select, with attributes where its first field appears
+        assert result == (
+            "- entities/1:\n"
+            "    attributes:\n"
+            "      FirstName: John\n"
+            "    label: John Doe\n"
+            "    type: Individual\n"
+            "- entities/2:\n"
+            "    attributes:\n"
+            "      FirstName: John\n"
+            "    label: Jane Doe\n"
+            "    type: Individual\n"
+        )
+        assert mock_simplify.call_count == 2
+
+@pytest.mark.asyncio
+async def test_repeated_search_served_from_cache_until_tenant_write():
+    with patch("src.tools.search.get_reltio_url", return_value="https://reltio.com/entities/_search"), \
+         patch("src.tools.search.get_reltio_headers", return_value={"Authorization": "Bearer token"}), \
+         patch("src.tools.search.validate_connection_security"), \
+         patch("src.tools.search.http_request_async", return_value=[{"uri": "entities/1", "label": "John Doe"}]) as mock_http, \
+         patch("src.tools.search.ActivityLog.execute_and_log_activity") as mock_log:
+
+        first = await search_entities("equals(attributes.FirstName,'John')", tenant_id="cache-tenant")
+        second = await search_entities("equals(attributes.FirstName,'John')", tenant_id="cache-tenant")
+        assert first == second
+        mock_http.assert_called_once()
+        # Every search is audited, including the one answered from cache
+        assert mock_log.call_count == 2
+
+        invalidate_tenant("cache-tenant")
+        await search_entities("equals(attributes.FirstName,'John')", tenant_id="cache-tenant")
+        assert mock_http.call_count == 2
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_results, expected_max", [(50, 50), (500, 100)])
+async def test_search_entities_page_size_capped_once(max_results, expected_max):
+    with patch("src.tools.search.get_reltio_url", return_value="https://reltio.com/entities/_search"), \
+         patch("src.tools.search.get_reltio_headers", return_value={"Authorization": "Bearer token"}), \
+         patch("src.tools.search.validate_connection_security"), \
+         patch("src.tools.search.http_request_async", return_value=[]) as mock_http, \
+         patch("src.tools.search.ActivityLog.execute_and_log_activity"):
+
+        await search_entities(tenant_id="tenant123", max_results=max_results)
+
+        assert mock_http.call_args.kwargs["data"]["max"] == expected_max
+
 @pytest.mark.asyncio
 async def test_search_entities_validation_error():
     with patch("src.tools.search.EntitySearchRequest", side_effect=ValueError("Invalid params")), \
@@ -78,7 +168,7 @@ async def test_search_entities_api_failure():
          patch("src.tools.search.get_reltio_url"), \
          patch("src.tools.search.get_reltio_headers"), \
          patch("src.tools.search.validate_connection_security"), \
-         patch("src.tools.search.http_request", side_effect=Exception("API failed")), \
+         patch("src.tools.search.http_request_async", side_effect=Exception("API failed")), \
          patch("src.tools.search.create_error_response") as mock_create_error:
 
         mock_request.return_value = MagicMock(
@@ -116,7 +206,7 @@ class TestSearchEntitiesComprehensive:
     @patch("src.tools.search.ActivityLog.execute_and_log_activity")
     @patch("src.tools.search.yaml.dump")
     @patch("src.tools.search.simplify_reltio_attributes")
-    @patch("src.tools.search.http_request")
+    @patch("src.tools.search.http_request_async")
     @patch("src.tools.search.validate_connection_security")
     @patch("src.tools.search.get_reltio_headers")
     @patch("src.tools.search.get_reltio_url")
@@ -163,7 +253,7 @@ class TestSearchEntitiesComprehensive:
 
     @patch("src.tools.search.ActivityLog.execute_and_log_activity")
     @patch("src.tools.search.yaml.dump")
-    @patch("src.tools.search.http_request")
+    @patch("src.tools.search.http_request_async")
     @patch("src.tools.search.validate_connection_security")
     @patch("src.tools.search.get_reltio_headers")
     @patch("src.tools.search.get_reltio_url")
@@ -199,7 +289,7 @@ class TestSearchEntitiesComprehensive:
         result = await search_entities(filter="invalid_filter", entity_type="Individual", tenant_id="test-tenant")
         assert result["error"]["code_key"] == "VALIDATION_ERROR"
 
-    @patch("src.tools.search.http_request", side_effect=Exception("Network timeout"))
+    @patch("src.tools.search.http_request_async", side_effect=Exception("Network timeout"))
     @patch("src.tools.search.validate_connection_security")
     @patch("src.tools.search.get_reltio_headers")
     @patch("src.tools.search.get_reltio_url")
@@ -213,4 +303,4 @@ class TestSearchEntitiesComprehensive:
         )
         
         result = await search_entities(filter="containsWordStartingWith(attributes,'John')", entity_type="Individual", tenant_id="test-tenant")
-        assert result["error"]["code_key"] == "SERVER_ERROR"
\ No newline at end of file
+        assert result["error"]["code_key"] == "SERVER_ERROR"
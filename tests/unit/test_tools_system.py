@@ -2,10 +2,9 @@ import pytest
 from unittest.mock import patch
 from src.tools.system import list_capabilities
 
-@pytest.mark.asyncio
-async def test_list_capabilities_success():
+def test_list_capabilities_success():
     with patch("src.tools.system.RELTIO_SERVER_NAME", "MyReltioServer"):
-        result = await list_capabilities()
+        result = list_capabilities()
         
         assert isinstance(result, dict)
         assert result["server_name"] == "MyReltioServer"
@@ -1,5 +1,9 @@
+import asyncio
+import json
+import httpx
 import pytest
 from unittest.mock import patch, MagicMock
+from src.util.exceptions import ReltioHTTPError
 
 from src.tools.tenant_config import (
     get_business_configuration, 
@@ -12,19 +16,219 @@ from src.tools.tenant_config import (
     get_change_request_type_definition,
     get_graph_type_definition,
     get_grouping_type_definition,
+    get_type_definitions,
+    warm_business_config,
     get_entity_type_definition_util,
     get_change_request_type_definition_util,
     get_relation_type_definition_util,
     get_interaction_type_definition_util,
     get_graph_type_definition_util,
-    get_grouping_type_definition_util
+    get_grouping_type_definition_util,
+    _config_cache,
+    _config_store,
+    _last_known_configs,
+    _type_indexes,
+    _rendered_responses,
+    _get_type_index
 )
 
 TENANT_ID = "test-tenant"
 
+
+@pytest.fixture(autouse=True)
+def clear_business_config_cache():
+    _config_cache.clear()
+    _last_known_configs.clear()
+    _type_indexes.clear()
+    _rendered_responses.clear()
+    yield
+    _config_cache.clear()
+    _last_known_configs.clear()
+    _type_indexes.clear()
+    _rendered_responses.clear()
+
+
+class TestTypeIndex:
+    def test_index_built_once_per_config(self):
+        config = {"entityTypes": [{"uri": "configuration/entityTypes/Individual", "label": "Individual"}]}
+        type_index = _get_type_index(TENANT_ID, config)
+        assert type_index["entityTypes"]["configuration/entityTypes/Individual"]["label"] == "Individual"
+        assert type_index["relationTypes"] == {}
+        assert _get_type_index(TENANT_ID, config) is type_index
+
+    def test_index_rebuilt_for_new_config(self):
+        _get_type_index(TENANT_ID, {"entityTypes": [{"uri": "configuration/entityTypes/Individual"}]})
+        type_index = _get_type_index(TENANT_ID, {"entityTypes": [{"uri": "configuration/entityTypes/Organization"}]})
+        assert list(type_index["entityTypes"]) == ["configuration/entityTypes/Organization"]
+
+    def test_util_accepts_index(self):
+        type_index = _get_type_index(TENANT_ID, {"graphTypes": [{"uri": "configuration/graphTypes/Hierarchy", "label": "Hierarchy"}]})
+        result = get_graph_type_definition_util("configuration/graphTypes/Hierarchy", type_index["graphTypes"])
+        assert result["label"] == "Hierarchy"
+        assert get_graph_type_definition_util("configuration/graphTypes/Missing", type_index["graphTypes"]) == {}
+
+
+@pytest.mark.asyncio
+class TestBusinessConfigCache:
+    @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
+    @patch("src.tools.tenant_config.http_request_async")
+    @patch("src.tools.tenant_config.validate_connection_security")
+    @patch("src.tools.tenant_config.get_reltio_headers")
+    @patch("src.tools.tenant_config.get_reltio_url")
+    async def test_config_fetched_once_across_tools(self, mock_get_url, mock_headers, mock_validate, mock_http, mock_activity_log):
+        mock_http.return_value = {"uri": "configuration", "entityTypes": [{"uri": "configuration/entityTypes/Individual"}]}
+        await get_business_configuration(TENANT_ID)
+        await get_tenant_metadata(TENANT_ID)
+        await get_entity_type_definition("configuration/entityTypes/Individual", TENANT_ID)
+        mock_http.assert_called_once()
+
+    @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
+    @patch("src.tools.tenant_config.http_request_async")
+    @patch("src.tools.tenant_config.validate_connection_security")
+    @patch("src.tools.tenant_config.get_reltio_headers")
+    @patch("src.tools.tenant_config.get_reltio_url")
+    async def test_concurrent_tools_share_one_fetch(self, mock_get_url, mock_headers, mock_validate, mock_http, mock_activity_log):
+        async def slow_fetch(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return {"uri": "configuration", "relationTypes": [], "graphTypes": []}
+        mock_http.side_effect = slow_fetch
+        results = await asyncio.gather(
+            get_business_configuration(TENANT_ID),
+            get_tenant_metadata(TENANT_ID),
+            get_relation_type_definition("configuration/relationTypes/HasAddress", TENANT_ID),
+            get_graph_type_definition("configuration/graphTypes/Hierarchy", TENANT_ID)
+        )
+        assert not any(isinstance(result, dict) and "error" in result for result in results)
+        mock_http.assert_called_once()
+
+    @patch("src.tools.util.RELTIO_TOOL_FORMAT", "json")
+    @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
+    @patch("src.tools.tenant_config.http_request_async")
+    @patch("src.tools.tenant_config.validate_connection_security")
+    @patch("src.tools.tenant_config.get_reltio_headers")
+    @patch("src.tools.tenant_config.get_reltio_url")
+    async def test_json_tool_format(self, mock_get_url, mock_headers, mock_validate, mock_http, mock_activity_log):
+        mock_http.return_value = {"entityTypes": [{"uri": "configuration/entityTypes/Individual", "label": "Individual"}]}
+        result = await get_data_model_definition(["entityTypes"], TENANT_ID)
+        assert json.loads(result) == {"entityTypes": [{"uri": "configuration/entityTypes/Individual", "label": "Individual", "description": ""}]}
+
+    @patch("src.tools.tenant_config.http_request_async")
+    @patch("src.tools.tenant_config.validate_connection_security")
+    @patch("src.tools.tenant_config.get_reltio_headers")
+    @patch("src.tools.tenant_config.get_reltio_url")
+    async def test_last_known_config_served_when_refresh_fails(self, mock_get_url, mock_headers, mock_validate, mock_http):
+        mock_http.side_effect = [{"uri": "configuration"}, httpx.ConnectError("Internal Server Error")]
+        await get_business_configuration(TENANT_ID)
+        _config_cache.clear()
+        result = await get_business_configuration(TENANT_ID)
+        assert result["uri"] == "configuration"
+        assert mock_http.call_count == 2
+
+    @patch("src.tools.tenant_config.http_request_async")
+    @patch("src.tools.tenant_config.validate_connection_security")
+    @patch("src.tools.tenant_config.get_reltio_headers")
+    @patch("src.tools.tenant_config.get_reltio_url")
+    async def test_last_known_config_not_served_on_client_error(self, mock_get_url, mock_headers, mock_validate, mock_http):
+        mock_http.side_effect = [{"uri": "configuration"}, ReltioHTTPError(403, "Forbidden"), httpx.ConnectError("refused")]
+        await get_business_configuration(TENANT_ID)
+        _config_cache.clear()
+        result = await get_business_configuration(TENANT_ID)
+        assert result["error"]["code_key"] == "API_REQUEST_ERROR"
+        
+        # The copy is dropped, so a later transport failure has nothing to fall back on either
+        result = await get_business_configuration(TENANT_ID)
+        assert result["error"]["code_key"] == "API_REQUEST_ERROR"
+
+    @patch("src.tools.tenant_config.dump_tool_response", return_value="rendered")
+    @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
+    @patch("src.tools.tenant_config.http_request_async")
+    @patch("src.tools.tenant_config.validate_connection_security")
+    @patch("src.tools.tenant_config.get_reltio_headers")
+    @patch("src.tools.tenant_config.get_reltio_url")
+    async def test_response_rendered_once_per_config(self, mock_get_url, mock_headers, mock_validate, mock_http, mock_activity_log, mock_dump):
+        mock_http.side_effect = [{"uri": "configuration", "updatedTime": 1}, {"uri": "configuration", "updatedTime": 2}]
+        assert await get_tenant_metadata(TENANT_ID) == "rendered"
+        assert await get_tenant_metadata(TENANT_ID) == "rendered"
+        assert mock_dump.call_count == 1
+        assert mock_activity_log.call_count == 2
+        
+        _config_cache.clear()
+        await get_tenant_metadata(TENANT_ID)
+        assert mock_dump.call_count == 2
+
+    @patch("src.tools.tenant_config.http_request_async")
+    @patch("src.tools.tenant_config.validate_connection_security")
+    @patch("src.tools.tenant_config.get_reltio_headers")
+    @patch("src.tools.tenant_config.get_reltio_url")
+    async def test_persisted_config_served_after_restart_when_unreachable(self, mock_get_url, mock_headers, mock_validate, mock_http):
+        mock_headers.return_value = {"Authorization": "Bearer token"}
+        mock_http.side_effect = [{"uri": "configuration", "updatedTime": 1700000000000}, httpx.ConnectError("refused")]
+        await get_business_configuration(TENANT_ID)
+        assert _config_store.load(f"business_config-{TENANT_ID}")["updatedTime"] == 1700000000000
+        
+        _config_cache.clear()
+        _last_known_configs.clear()
+        result = await get_business_configuration(TENANT_ID)
+        assert result["uri"] == "configuration"
+        assert "If-Modified-Since" not in mock_http.call_args.kwargs["headers"]
+
+@pytest.mark.asyncio
+class TestWarmBusinessConfig:
+    @patch("src.tools.tenant_config.http_request_async")
+    @patch("src.tools.tenant_config.validate_connection_security")
+    @patch("src.tools.tenant_config.get_reltio_headers")
+    @patch("src.tools.tenant_config.get_reltio_url")
+    async def test_warm_fills_cache(self, mock_get_url, mock_headers, mock_validate, mock_http):
+        mock_http.return_value = {"uri": "configuration"}
+        await warm_business_config(TENANT_ID)
+        assert _config_cache.get(TENANT_ID) == {"uri": "configuration"}
+
+    @patch("src.tools.tenant_config.http_request_async")
+    @patch("src.tools.tenant_config.validate_connection_security")
+    @patch("src.tools.tenant_config.get_reltio_headers", side_effect=ValueError("Authentication failed"))
+    @patch("src.tools.tenant_config.get_reltio_url")
+    async def test_warm_failure_is_not_raised(self, mock_get_url, mock_headers, mock_validate, mock_http):
+        await warm_business_config(TENANT_ID)
+        assert _config_cache.get(TENANT_ID) is None
+        mock_http.assert_not_called()
+
+@pytest.mark.asyncio
+class TestGetTypeDefinitions:
+    @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
+    @patch("src.tools.tenant_config.http_request_async")
+    @patch("src.tools.tenant_config.validate_connection_security")
+    @patch("src.tools.tenant_config.get_reltio_headers")
+    @patch("src.tools.tenant_config.get_reltio_url")
+    async def test_definitions_resolved_from_one_fetch(self, mock_get_url, mock_headers, mock_validate, mock_http, mock_activity_log):
+        mock_http.return_value = {
+            "entityTypes": [{"uri": "configuration/entityTypes/Individual", "label": "Individual"}],
+            "relationTypes": [{"uri": "configuration/relationTypes/HasAddress", "label": "Has Address"}]
+        }
+        result = await get_type_definitions([
+            "configuration/entityTypes/Individual",
+            "configuration/relationTypes/HasAddress",
+            "configuration/graphTypes/Missing",
+            "Individual"
+        ], TENANT_ID)
+        assert "Individual" in result
+        assert "Has Address" in result
+        assert "configuration/graphTypes/Missing: {}" in result
+        assert "Individual: {}" in result
+        mock_http.assert_called_once()
+        mock_activity_log.assert_called_once()
+
+    @patch("src.tools.tenant_config.http_request_async")
+    @patch("src.tools.tenant_config.validate_connection_security")
+    @patch("src.tools.tenant_config.get_reltio_headers")
+    @patch("src.tools.tenant_config.get_reltio_url")
+    async def test_fetch_error(self, mock_get_url, mock_headers, mock_validate, mock_http):
+        mock_http.side_effect = httpx.ConnectError("API Error")
+        result = await get_type_definitions(["configuration/entityTypes/Individual"], TENANT_ID)
+        assert result["error"]["code_key"] == "API_REQUEST_ERROR"
+
 @pytest.mark.asyncio
 class TestBusinessConfig:
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -35,7 +239,7 @@ class TestBusinessConfig:
         result = await get_business_configuration(TENANT_ID)
         assert isinstance(result, dict)
 
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security", side_effect=Exception("Auth failed"))
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -43,7 +247,7 @@ class TestBusinessConfig:
         result = await get_business_configuration(TENANT_ID)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.tenant_config.http_request", side_effect=Exception("Internal Server Error"))
+    @patch("src.tools.tenant_config.http_request_async", side_effect=httpx.ConnectError("Internal Server Error"))
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -53,7 +257,7 @@ class TestBusinessConfig:
 
 @pytest.mark.asyncio
 class TestTenantPermissionsMetadata:
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -69,7 +273,7 @@ class TestTenantPermissionsMetadata:
         assert isinstance(result, dict)
         assert result["status"] == "completed"
 
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security", side_effect=Exception("Auth failed"))
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -77,7 +281,7 @@ class TestTenantPermissionsMetadata:
         result = await get_tenant_permissions_metadata(TENANT_ID)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.tenant_config.http_request", side_effect=Exception("Internal Server Error"))
+    @patch("src.tools.tenant_config.http_request_async", side_effect=httpx.ConnectError("Internal Server Error"))
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -91,7 +295,7 @@ class TestGetTenantMetadata:
     """Test cases for get_tenant_metadata function"""
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -113,7 +317,7 @@ class TestGetTenantMetadata:
         assert isinstance(result, dict)
         mock_activity_log.assert_called_once()
 
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security", side_effect=Exception("Auth failed"))
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -122,7 +326,7 @@ class TestGetTenantMetadata:
         result = await get_tenant_metadata(TENANT_ID)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.tenant_config.http_request", side_effect=Exception("Internal Server Error"))
+    @patch("src.tools.tenant_config.http_request_async", side_effect=httpx.ConnectError("Internal Server Error"))
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -137,7 +341,7 @@ class TestGetDataModelDefinition:
     """Test cases for get_data_model_definition function"""
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -156,7 +360,7 @@ class TestGetDataModelDefinition:
             result = yaml.safe_load(result)
         assert isinstance(result, dict)
 
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security", side_effect=Exception("Auth failed"))
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -171,7 +375,7 @@ class TestGetEntityTypeDefinition:
     """Test cases for get_entity_type_definition function"""
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -206,7 +410,7 @@ class TestGetRelationTypeDefinition:
     """Test cases for get_relation_type_definition function"""
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -240,7 +444,7 @@ class TestGetInteractionTypeDefinition:
     """Test cases for get_interaction_type_definition function"""
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -280,7 +484,7 @@ class TestBusinessConfigurationExtended:
         assert result["error"]["code_key"] == "INTERNAL_SERVER_ERROR"
         assert "An error occurred while retrieving business configuration" in result["error"]["message"]
     
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -315,7 +519,7 @@ class TestTenantPermissionsMetadataExtended:
         assert "An error occurred while retrieving tenant permissions metadata" in result["error"]["message"]
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -345,7 +549,7 @@ class TestTenantMetadataExtended:
         assert "An error occurred while retrieving tenant metadata" in result["error"]["message"]
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -392,7 +596,7 @@ class TestDataModelDefinitionExtended:
         assert "An error occurred while retrieving data model definition" in result["error"]["message"]
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -425,7 +629,7 @@ class TestDataModelDefinitionExtended:
         assert "groupingTypes" in result
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -446,7 +650,7 @@ class TestDataModelDefinitionExtended:
         assert len(result["changeRequestTypes"]) == 2
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -466,7 +670,7 @@ class TestDataModelDefinitionExtended:
         assert "relationTypes" in result
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -486,7 +690,7 @@ class TestDataModelDefinitionExtended:
         assert "interactionTypes" in result
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -506,7 +710,7 @@ class TestDataModelDefinitionExtended:
         assert "graphTypes" in result
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -526,7 +730,7 @@ class TestDataModelDefinitionExtended:
         assert "survivorshipStrategies" in result
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -546,7 +750,7 @@ class TestDataModelDefinitionExtended:
         assert "groupingTypes" in result
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -564,7 +768,7 @@ class TestDataModelDefinitionExtended:
             result = yaml.safe_load(result)
         assert isinstance(result, dict)
     
-    @patch("src.tools.tenant_config.http_request", side_effect=Exception("API Error"))
+    @patch("src.tools.tenant_config.http_request_async", side_effect=httpx.ConnectError("API Error"))
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -586,7 +790,7 @@ class TestEntityTypeDefinitionExtended:
         assert "An error occurred while retrieving entity type definition" in result["error"]["message"]
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -620,7 +824,7 @@ class TestEntityTypeDefinitionExtended:
             result = yaml.safe_load(result)
         assert isinstance(result, dict)
     
-    @patch("src.tools.tenant_config.http_request", side_effect=Exception("API Error"))
+    @patch("src.tools.tenant_config.http_request_async", side_effect=httpx.ConnectError("API Error"))
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -635,7 +839,7 @@ class TestChangeRequestTypeDefinition:
     """Test cases for get_change_request_type_definition function"""
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -671,7 +875,7 @@ class TestChangeRequestTypeDefinition:
         assert result["error"]["code_key"] == "INTERNAL_SERVER_ERROR"
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -689,7 +893,7 @@ class TestChangeRequestTypeDefinition:
             result = yaml.safe_load(result)
         assert isinstance(result, dict)
     
-    @patch("src.tools.tenant_config.http_request", side_effect=Exception("API Error"))
+    @patch("src.tools.tenant_config.http_request_async", side_effect=httpx.ConnectError("API Error"))
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -710,7 +914,7 @@ class TestRelationTypeDefinitionExtended:
         assert result["error"]["code_key"] == "INTERNAL_SERVER_ERROR"
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -746,7 +950,7 @@ class TestRelationTypeDefinitionExtended:
             result = yaml.safe_load(result)
         assert isinstance(result, dict)
     
-    @patch("src.tools.tenant_config.http_request", side_effect=Exception("API Error"))
+    @patch("src.tools.tenant_config.http_request_async", side_effect=httpx.ConnectError("API Error"))
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -767,7 +971,7 @@ class TestInteractionTypeDefinitionExtended:
         assert result["error"]["code_key"] == "INTERNAL_SERVER_ERROR"
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -798,7 +1002,7 @@ class TestInteractionTypeDefinitionExtended:
             result = yaml.safe_load(result)
         assert isinstance(result, dict)
     
-    @patch("src.tools.tenant_config.http_request", side_effect=Exception("API Error"))
+    @patch("src.tools.tenant_config.http_request_async", side_effect=httpx.ConnectError("API Error"))
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -813,7 +1017,7 @@ class TestGraphTypeDefinition:
     """Test cases for get_graph_type_definition function"""
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -853,7 +1057,7 @@ class TestGraphTypeDefinition:
         assert result["error"]["code_key"] == "INTERNAL_SERVER_ERROR"
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -871,7 +1075,7 @@ class TestGraphTypeDefinition:
             result = yaml.safe_load(result)
         assert isinstance(result, dict)
     
-    @patch("src.tools.tenant_config.http_request", side_effect=Exception("API Error"))
+    @patch("src.tools.tenant_config.http_request_async", side_effect=httpx.ConnectError("API Error"))
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -886,7 +1090,7 @@ class TestGroupingTypeDefinition:
     """Test cases for get_grouping_type_definition function"""
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity")
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -926,7 +1130,7 @@ class TestGroupingTypeDefinition:
         assert result["error"]["code_key"] == "INTERNAL_SERVER_ERROR"
     
     @patch("src.tools.tenant_config.ActivityLog.execute_and_log_activity", side_effect=Exception("Logging failed"))
-    @patch("src.tools.tenant_config.http_request")
+    @patch("src.tools.tenant_config.http_request_async")
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
@@ -944,7 +1148,7 @@ class TestGroupingTypeDefinition:
             result = yaml.safe_load(result)
         assert isinstance(result, dict)
     
-    @patch("src.tools.tenant_config.http_request", side_effect=Exception("API Error"))
+    @patch("src.tools.tenant_config.http_request_async", side_effect=httpx.ConnectError("API Error"))
     @patch("src.tools.tenant_config.validate_connection_security")
     @patch("src.tools.tenant_config.get_reltio_headers")
     @patch("src.tools.tenant_config.get_reltio_url")
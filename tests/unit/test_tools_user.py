@@ -87,7 +87,7 @@ MOCK_EMPTY_ACTIVITY_DATA = []
 @pytest.mark.asyncio
 class TestGetUsersSummary:
 
-    @patch("src.tools.user.http_request")
+    @patch("src.tools.user.http_request_async")
     @patch("src.tools.user.get_reltio_headers")
     @patch("src.tools.user.validate_connection_security")
     @patch("src.tools.user.ActivityLog.execute_and_log_activity")
@@ -127,7 +127,7 @@ class TestGetUsersSummary:
         assert isinstance(result, dict)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.user.http_request")
+    @patch("src.tools.user.http_request_async")
     @patch("src.tools.user.get_reltio_headers")
     @patch("src.tools.user.validate_connection_security")
     async def test_get_users_summary_api_error(self, mock_validate, mock_headers, mock_request):
@@ -140,7 +140,7 @@ class TestGetUsersSummary:
         assert isinstance(result, dict)
         assert result["error"]["code_key"] == "API_REQUEST_ERROR"
 
-    @patch("src.tools.user.http_request")
+    @patch("src.tools.user.http_request_async")
     @patch("src.tools.user.get_reltio_headers")
     @patch("src.tools.user.validate_connection_security")
     @patch("src.tools.user.ActivityLog.execute_and_log_activity")
@@ -160,7 +160,7 @@ class TestGetUsersSummary:
 @pytest.mark.asyncio
 class TestGetUserDetails:
 
-    @patch("src.tools.user.http_request")
+    @patch("src.tools.user.http_request_async")
     @patch("src.tools.user.get_reltio_headers")
     @patch("src.tools.user.validate_connection_security")
     @patch("src.tools.user.ActivityLog.execute_and_log_activity")
@@ -197,7 +197,7 @@ class TestGetUserDetails:
         assert isinstance(result, dict)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.user.http_request")
+    @patch("src.tools.user.http_request_async")
     @patch("src.tools.user.get_reltio_headers")
     @patch("src.tools.user.validate_connection_security")
     async def test_get_user_details_api_error(self, mock_validate, mock_headers, mock_request):
@@ -214,7 +214,7 @@ class TestGetUserDetails:
 @pytest.mark.asyncio
 class TestGetUsersByRoleAndTenant:
 
-    @patch("src.tools.user.http_request")
+    @patch("src.tools.user.http_request_async")
     @patch("src.tools.user.get_reltio_headers")
     @patch("src.tools.user.validate_connection_security")
     @patch("src.tools.user.ActivityLog.execute_and_log_activity")
@@ -249,7 +249,7 @@ class TestGetUsersByRoleAndTenant:
 @pytest.mark.asyncio
 class TestGetUsersByGroup:
 
-    @patch("src.tools.user.http_request")
+    @patch("src.tools.user.http_request_async")
     @patch("src.tools.user.get_reltio_headers")
     @patch("src.tools.user.validate_connection_security")
     @patch("src.tools.user.ActivityLog.execute_and_log_activity")
@@ -283,7 +283,7 @@ class TestGetUsersByGroup:
 @pytest.mark.asyncio
 class TestCheckUserActivity:
 
-    @patch("src.tools.user.http_request")
+    @patch("src.tools.user.http_request_async")
     @patch("src.tools.user.get_reltio_headers")
     @patch("src.tools.user.validate_connection_security")
     @patch("src.tools.user.ActivityLog.execute_and_log_activity")
@@ -311,7 +311,7 @@ class TestCheckUserActivity:
         assert isinstance(result, dict)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.user.http_request")
+    @patch("src.tools.user.http_request_async")
     @patch("src.tools.user.get_reltio_headers")
     @patch("src.tools.user.validate_connection_security")
     @patch("src.tools.user.ActivityLog.execute_and_log_activity")
@@ -0,0 +1,41 @@
+from src.tools.util import escape_filter_value, simplify_reltio_attributes
+
+
+class TestSimplifyReltioAttributes:
+
+    def test_nested_values_keep_structure(self):
+        attributes = {
+            "FirstName": [{"value": "John"}],
+            "Phone": [{"value": "555-0100"}, {"value": "555-0101"}],
+            "Address": [{"value": {"City": [{"value": "Austin"}], "Zip": [{"value": {"Zip5": [{"value": "78701"}]}}]}}],
+            "Empty": [],
+            "NoValue": [{"ov": True}],
+            "Malformed": ["raw", ["value"], None],
+            "MalformedSingle": ["raw"]
+        }
+        assert simplify_reltio_attributes(attributes) == {
+            "FirstName": "John",
+            "Phone": ["555-0100", "555-0101"],
+            "Address": {"City": "Austin", "Zip": {"Zip5": "78701"}}
+        }
+
+    def test_deeply_nested_values_do_not_hit_recursion_limit(self):
+        attributes = {"Leaf": [{"value": "x"}]}
+        for _ in range(5000):
+            attributes = {"Group": [{"value": attributes}]}
+        result = simplify_reltio_attributes(attributes)
+        for _ in range(5000):
+            result = result["Group"]
+        assert result == {"Leaf": "x"}
+
+
+class TestEscapeFilterValue:
+
+    def test_single_quotes_escaped(self):
+        assert escape_filter_value("O'Type") == "O\\'Type"
+
+    def test_trailing_backslash_cannot_escape_closing_quote(self):
+        assert escape_filter_value("foo\\") == "foo\\\\"
+
+    def test_escaped_quote_in_value_stays_literal(self):
+        assert escape_filter_value("a\\') or (true") == "a\\\\\\') or (true"
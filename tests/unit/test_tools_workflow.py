@@ -210,6 +210,25 @@ class TestGetUserWorkflowTasks:
         mock_request.assert_called_once()
         mock_log.assert_called_once()
 
+    @patch("src.tools.workflow.ActivityLog.execute_and_log_activity", new_callable=AsyncMock)
+    @patch("src.tools.workflow.http_request_workflow")
+    @patch("src.tools.workflow.get_reltio_headers")
+    @patch("src.tools.workflow.validate_connection_security")
+    async def test_get_user_workflow_tasks_runs_on_http_executor(self, mock_validate, mock_headers, mock_request, mock_log):
+        """Test the blocking workflow request runs on the dedicated HTTP executor"""
+        import threading
+        thread_names = []
+        def record_thread(*args, **kwargs):
+            thread_names.append(threading.current_thread().name)
+            return MOCK_WORKFLOW_RESPONSE
+        mock_headers.return_value = {"Authorization": "Bearer token"}
+        mock_request.side_effect = record_thread
+        
+        await get_user_workflow_tasks(ASSIGNEE, TENANT_ID, OFFSET, MAX_RESULTS)
+        
+        assert len(thread_names) == 1
+        assert thread_names[0].startswith("reltio-http")
+
     @patch("src.tools.workflow.get_reltio_headers")
     @patch("src.tools.workflow.validate_connection_security")
     async def test_get_user_workflow_tasks_auth_error(self, mock_validate, mock_headers):
@@ -556,7 +575,7 @@ class TestStartProcessInstance:
     """Test suite for start_process_instance function"""
 
     @patch("src.tools.workflow.ActivityLog.execute_and_log_activity", new_callable=AsyncMock)
-    @patch("src.tools.workflow.http_request")
+    @patch("src.tools.workflow.http_request_async")
     @patch("src.tools.workflow.get_reltio_headers")
     @patch("src.tools.workflow.validate_connection_security")
     @patch("src.tools.workflow.StartProcessInstanceRequest")
@@ -609,7 +628,7 @@ class TestStartProcessInstance:
         assert isinstance(result, dict)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.workflow.http_request")
+    @patch("src.tools.workflow.http_request_async")
     @patch("src.tools.workflow.get_reltio_headers")
     @patch("src.tools.workflow.validate_connection_security")
     @patch("src.tools.workflow.StartProcessInstanceRequest")
@@ -628,7 +647,7 @@ class TestExecuteTaskAction:
     """Test suite for execute_task_action function"""
 
     @patch("src.tools.workflow.ActivityLog.execute_and_log_activity", new_callable=AsyncMock)
-    @patch("src.tools.workflow.http_request")
+    @patch("src.tools.workflow.http_request_async")
     @patch("src.tools.workflow.get_reltio_headers")
     @patch("src.tools.workflow.validate_connection_security")
     @patch("src.tools.workflow.ExecuteTaskActionRequest")
@@ -678,7 +697,7 @@ class TestExecuteTaskAction:
         assert isinstance(result, dict)
         assert result["error"]["code_key"] == "AUTHENTICATION_ERROR"
 
-    @patch("src.tools.workflow.http_request")
+    @patch("src.tools.workflow.http_request_async")
     @patch("src.tools.workflow.get_reltio_headers")
     @patch("src.tools.workflow.validate_connection_security")
     @patch("src.tools.workflow.ExecuteTaskActionRequest")
@@ -699,7 +718,7 @@ class TestExecuteTaskAction:
         assert isinstance(result, dict)
         assert result["error"]["code_key"] == "INVALID_REQUEST"
 
-    @patch("src.tools.workflow.http_request")
+    @patch("src.tools.workflow.http_request_async")
     @patch("src.tools.workflow.get_reltio_headers")
     @patch("src.tools.workflow.validate_connection_security")
     @patch("src.tools.workflow.ExecuteTaskActionRequest")
@@ -717,7 +736,7 @@ class TestExecuteTaskAction:
 class TestHttpRequestWorkflow:
     """Test suite for http_request_workflow function"""
 
-    @patch("src.tools.workflow.requests.request")
+    @patch("src.tools.workflow.http_session.request")
     def test_http_request_workflow_success(self, mock_request):
         """Test successful HTTP request to workflow API"""
         mock_response = MagicMock()
@@ -736,7 +755,7 @@ class TestHttpRequestWorkflow:
         assert result == {"status": "success"}
         mock_request.assert_called_once()
 
-    @patch("src.tools.workflow.requests.request")
+    @patch("src.tools.workflow.http_session.request")
     def test_http_request_workflow_http_error(self, mock_request):
         """Test HTTP error handling"""
         mock_response = MagicMock()
@@ -754,7 +773,7 @@ class TestHttpRequestWorkflow:
         
         assert "Workflow API request failed" in str(exc_info.value)
 
-    @patch("src.tools.workflow.requests.request")
+    @patch("src.tools.workflow.http_session.request")
     def test_http_request_workflow_timeout(self, mock_request):
         """Test timeout error handling"""
         mock_request.side_effect = Exception("Connection timeout")